@@ -0,0 +1,272 @@
+"""Database diagnostics for the ``diagnose`` command group.
+
+Everything here reads PostgreSQL's statistics views and changes nothing, so it is safe to run
+against production while latency is spiking:
+
+* **Statements** come from ``pg_stat_statements``, which has to be in
+  ``shared_preload_libraries`` and created in the database with
+  ``CREATE EXTENSION pg_stat_statements``. Timings are cumulative since the last
+  ``pg_stat_statements_reset()``.
+* **Bloat** is estimated from ``pg_class`` and the planner's column widths in ``pg_stats``, so it
+  is only as fresh as the last ``ANALYZE`` and ignores alignment padding and TOAST. Treat it as a
+  hint for which table or B-tree index needs a ``VACUUM`` or ``REINDEX CONCURRENTLY``, not an exact
+  measure.
+* **Cache hit ratios** are the share of block reads served from shared buffers, for the database
+  and per table.
+* **Activity** lists backends that have been busy (or idle in a transaction) for too long, and
+  those waiting on another backend's lock together with the PIDs blocking them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+from psycopg import sql
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import psycopg
+
+__all__ = (
+    "BLOAT_TABLES",
+    "Activity",
+    "Bloat",
+    "CacheHitRatios",
+    "DiagnosticsError",
+    "Statement",
+    "TableCacheHits",
+    "activity",
+    "bloat",
+    "cache_hit_ratios",
+    "to_json",
+    "top_statements",
+)
+
+BLOAT_TABLES: Final = ("refresh_token", "password_reset_token", "email_verification_token", "audit_log")
+"""Tables with the most update and delete churn, checked by default."""
+
+_HAS_PG_STAT_STATEMENTS = "SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'"
+
+_TOP_STATEMENTS = sql.SQL("""
+SELECT queryid, calls, total_exec_time, mean_exec_time, rows,
+       shared_blks_hit::float8 / nullif(shared_blks_hit + shared_blks_read, 0), query
+FROM pg_stat_statements
+WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+ORDER BY {order} DESC
+LIMIT %(limit)s
+""")
+
+_TABLE_BLOAT = """
+WITH widths AS (
+    SELECT tablename, sum((1 - null_frac) * avg_width) AS row_width
+    FROM pg_stats
+    WHERE schemaname = current_schema() AND tablename = ANY(%(tables)s)
+    GROUP BY tablename
+), sizes AS (
+    SELECT c.relname, pg_relation_size(c.oid) AS size_bytes,
+           -- 24 byte tuple header and 4 byte line pointer per row; 24 byte page header.
+           ceil(c.reltuples * (28 + w.row_width) / (current_setting('block_size')::int - 24))
+               * current_setting('block_size')::int AS expected_bytes
+    FROM pg_class c
+    JOIN widths w ON w.tablename = c.relname
+    WHERE c.relnamespace = current_schema()::regnamespace AND c.relkind = 'r'
+)
+SELECT relname, NULL, size_bytes::bigint, greatest(size_bytes - expected_bytes, 0)::bigint
+FROM sizes
+"""
+
+_INDEX_BLOAT = """
+WITH sizes AS (
+    SELECT t.relname AS table_name, c.relname AS index_name, pg_relation_size(c.oid) AS size_bytes,
+           -- 8 byte index tuple header and 4 byte line pointer per entry; leaf pages 90%% full.
+           ceil(c.reltuples * (12 + coalesce(sum(s.avg_width), 0))
+                / ((current_setting('block_size')::int - 24) * 0.9))
+               * current_setting('block_size')::int AS expected_bytes
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_class t ON t.oid = i.indrelid
+    JOIN pg_am am ON am.oid = c.relam
+    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(i.indkey)
+    LEFT JOIN pg_stats s ON s.schemaname = current_schema() AND s.tablename = t.relname AND s.attname = a.attname
+    WHERE am.amname = 'btree' AND t.relnamespace = current_schema()::regnamespace AND t.relname = ANY(%(tables)s)
+    GROUP BY t.relname, c.relname, c.oid, c.reltuples
+)
+SELECT table_name, index_name, size_bytes::bigint, greatest(size_bytes - expected_bytes, 0)::bigint
+FROM sizes
+"""
+
+_DATABASE_CACHE_HITS = """
+SELECT blks_hit::float8 / nullif(blks_hit + blks_read, 0)
+FROM pg_stat_database
+WHERE datname = current_database()
+"""
+
+_TABLE_CACHE_HITS = """
+SELECT relname, heap_blks_read, heap_blks_hit::float8 / nullif(heap_blks_hit + heap_blks_read, 0),
+       coalesce(idx_blks_read, 0), idx_blks_hit::float8 / nullif(idx_blks_hit + idx_blks_read, 0)
+FROM pg_statio_user_tables
+ORDER BY heap_blks_read + coalesce(idx_blks_read, 0) DESC, relname
+LIMIT %(limit)s
+"""
+
+_ACTIVITY = """
+SELECT pid, usename, application_name, state, wait_event_type, wait_event,
+       extract(epoch FROM now() - xact_start)::float8,
+       extract(epoch FROM now() - query_start)::float8,
+       pg_blocking_pids(pid), query
+FROM pg_stat_activity
+WHERE pid <> pg_backend_pid() AND datname = current_database() AND backend_type = 'client backend'
+  AND (
+      (state <> 'idle' AND now() - coalesce(xact_start, query_start) >= make_interval(secs => %(min_seconds)s))
+      OR cardinality(pg_blocking_pids(pid)) > 0
+  )
+ORDER BY xact_start NULLS LAST, pid
+"""
+
+
+class DiagnosticsError(Exception):
+    """The database cannot provide the requested statistics."""
+
+
+@dataclass(frozen=True)
+class Statement:
+    query_id: int | None
+    calls: int
+    total_ms: float
+    mean_ms: float
+    rows: int
+    cache_hit_ratio: float | None
+    query: str
+
+
+@dataclass(frozen=True)
+class Bloat:
+    table: str
+    index: str | None
+    """``None`` for the table itself."""
+    size_bytes: int
+    bloat_bytes: int
+
+    @property
+    def bloat_ratio(self) -> float:
+        return self.bloat_bytes / self.size_bytes if self.size_bytes else 0.0
+
+
+@dataclass(frozen=True)
+class TableCacheHits:
+    table: str
+    heap_blocks_read: int
+    heap_hit_ratio: float | None
+    index_blocks_read: int
+    index_hit_ratio: float | None
+
+
+@dataclass(frozen=True)
+class CacheHitRatios:
+    database: float | None
+    """``None`` until the database has read a block."""
+    tables: list[TableCacheHits]
+    """Ordered by blocks read from outside shared buffers, most first."""
+
+
+@dataclass(frozen=True)
+class Activity:
+    pid: int
+    user: str | None
+    application: str | None
+    state: str | None
+    wait_event_type: str | None
+    wait_event: str | None
+    transaction_seconds: float | None
+    query_seconds: float | None
+    blocked_by: list[int]
+    query: str
+
+
+def top_statements(
+    connection: psycopg.Connection[Any], *, order_by: Literal["total", "mean"] = "total", limit: int = 20
+) -> list[Statement]:
+    """The statements of the current database that took the most time.
+
+    Args:
+        connection: A psycopg connection to the application database.
+        order_by: Rank by ``total`` execution time or by ``mean`` time per call.
+        limit: Statements to return.
+
+    Raises:
+        DiagnosticsError: If ``pg_stat_statements`` is not installed in the database.
+
+    Returns:
+        The statements, slowest first.
+    """
+    if connection.execute(_HAS_PG_STAT_STATEMENTS).fetchone() is None:
+        msg = (
+            "pg_stat_statements is not installed: add it to shared_preload_libraries, restart "
+            "PostgreSQL and run CREATE EXTENSION pg_stat_statements"
+        )
+        raise DiagnosticsError(msg)
+    order = sql.Identifier("total_exec_time" if order_by == "total" else "mean_exec_time")
+    return [Statement(*row) for row in connection.execute(_TOP_STATEMENTS.format(order=order), {"limit": limit})]
+
+
+def bloat(connection: psycopg.Connection[Any], tables: Sequence[str] = BLOAT_TABLES) -> list[Bloat]:
+    """Estimate the bloat of ``tables`` and their B-tree indexes.
+
+    Args:
+        connection: A psycopg connection to the application database.
+        tables: Tables to check.
+
+    Returns:
+        Tables and indexes, most wasted bytes first. Tables never analyzed are left out.
+    """
+    params = {"tables": list(tables)}
+    found = [Bloat(*row) for query in (_TABLE_BLOAT, _INDEX_BLOAT) for row in connection.execute(query, params)]
+    return sorted(found, key=lambda item: (-item.bloat_bytes, item.table, item.index or ""))
+
+
+def cache_hit_ratios(connection: psycopg.Connection[Any], *, limit: int = 10) -> CacheHitRatios:
+    """Shared buffer hit ratios of the database and of the tables reading the most from disk.
+
+    Args:
+        connection: A psycopg connection to the application database.
+        limit: Tables to return.
+
+    Returns:
+        The ratios.
+    """
+    database = connection.execute(_DATABASE_CACHE_HITS).fetchone()
+    return CacheHitRatios(
+        database=database[0] if database else None,
+        tables=[TableCacheHits(*row) for row in connection.execute(_TABLE_CACHE_HITS, {"limit": limit})],
+    )
+
+
+def activity(connection: psycopg.Connection[Any], *, min_seconds: float = 5.0) -> list[Activity]:
+    """Long-running and lock-blocked backends of the current database.
+
+    Args:
+        connection: A psycopg connection to the application database.
+        min_seconds: Backends whose transaction (or query, outside one) has run at least this long
+            are listed; blocked backends are always listed.
+
+    Returns:
+        The backends, oldest transaction first.
+    """
+    return [Activity(*row) for row in connection.execute(_ACTIVITY, {"min_seconds": min_seconds})]
+
+
+def to_json(value: Any) -> Any:
+    """Convert the results of this module into JSON-serializable values.
+
+    Returns:
+        Dictionaries and lists in place of the dataclasses.
+    """
+    if isinstance(value, list):
+        return [to_json(item) for item in value]  # pyright: ignore[reportUnknownVariableType]
+    if isinstance(value, Bloat):
+        return asdict(value) | {"bloat_ratio": value.bloat_ratio}
+    if isinstance(value, (Statement, CacheHitRatios, Activity, TableCacheHits)):
+        return asdict(value)
+    return value
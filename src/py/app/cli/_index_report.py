@@ -0,0 +1,135 @@
+"""Index usage report for the ``perf index-report`` command.
+
+Reads PostgreSQL's cumulative statistics, which count since they were last reset, so run it
+against a database that has served representative traffic for a while:
+
+* **Unused indexes** are non-unique indexes scanned at most ``max_scans`` times. They cost writes
+  and cache space without serving reads. Unique and primary key indexes are left out because they
+  enforce constraints whether or not queries use them.
+* **Invalid indexes** are left behind by a ``CREATE INDEX CONCURRENTLY`` that failed. They are
+  maintained on every write but never used; drop and rebuild them.
+* **Missing indexes** are indexes the models declare that the database does not have, usually a
+  migration that has not run.
+* **Sequentially scanned tables** have at least ``min_rows`` live rows and were read by more
+  sequential scans than index scans. Some predicate on them is probably not indexed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    import psycopg
+    from sqlalchemy import MetaData
+
+__all__ = (
+    "IndexReport",
+    "SeqScannedTable",
+    "UnusedIndex",
+    "declared_indexes",
+    "index_report",
+)
+
+_STATS_SINCE = "SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()"
+
+_UNUSED_INDEXES = """
+SELECT s.relname, s.indexrelname, s.idx_scan, pg_relation_size(s.indexrelid)
+FROM pg_stat_user_indexes s
+JOIN pg_index i ON i.indexrelid = s.indexrelid
+WHERE NOT i.indisunique AND NOT i.indisprimary AND i.indisvalid AND s.idx_scan <= %(max_scans)s
+ORDER BY pg_relation_size(s.indexrelid) DESC, s.relname, s.indexrelname
+"""
+
+_INVALID_INDEXES = """
+SELECT t.relname, c.relname
+FROM pg_index i
+JOIN pg_class c ON c.oid = i.indexrelid
+JOIN pg_class t ON t.oid = i.indrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE NOT i.indisvalid AND n.nspname = current_schema()
+ORDER BY t.relname, c.relname
+"""
+
+_PRESENT_INDEXES = "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"
+
+_SEQ_SCANNED_TABLES = """
+SELECT relname, seq_scan, seq_tup_read, coalesce(idx_scan, 0), n_live_tup
+FROM pg_stat_user_tables
+WHERE n_live_tup >= %(min_rows)s AND seq_scan > coalesce(idx_scan, 0)
+ORDER BY seq_tup_read DESC, relname
+"""
+
+
+@dataclass(frozen=True)
+class UnusedIndex:
+    table: str
+    index: str
+    scans: int
+    size_bytes: int
+
+
+@dataclass(frozen=True)
+class SeqScannedTable:
+    table: str
+    seq_scans: int
+    seq_rows_read: int
+    index_scans: int
+    live_rows: int
+
+
+@dataclass(frozen=True)
+class IndexReport:
+    """What :func:`index_report` found, each list ordered most significant first."""
+
+    stats_since: datetime | None
+    """When the statistics were last reset, if ever."""
+    unused: list[UnusedIndex]
+    invalid: list[tuple[str, str]]
+    """``(table, index)`` pairs."""
+    missing: list[tuple[str, str]]
+    """``(table, index)`` pairs."""
+    seq_scanned: list[SeqScannedTable]
+
+
+def declared_indexes(metadata: MetaData, dialect: str = "postgresql") -> dict[str, str]:
+    """Named indexes the models declare for ``dialect``, mapped to their table.
+
+    Returns:
+        Index name to table name.
+    """
+    declared: dict[str, str] = {}
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            ddl_if = index._ddl_if  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+            if index.name is None or (ddl_if is not None and ddl_if.dialect not in {None, dialect}):
+                continue
+            declared[str(index.name)] = table.name
+    return declared
+
+
+def index_report(
+    connection: psycopg.Connection[Any], metadata: MetaData, *, max_scans: int = 0, min_rows: int = 1000
+) -> IndexReport:
+    """Collect index usage from the database behind ``connection``.
+
+    Args:
+        connection: A psycopg connection to the application database.
+        metadata: The models' metadata, for the indexes they declare.
+        max_scans: Indexes scanned at most this often count as unused.
+        min_rows: Smaller tables are left out of the sequential scan list.
+
+    Returns:
+        The report.
+    """
+    stats_since = connection.execute(_STATS_SINCE).fetchone()
+    present = {str(name) for (name,) in connection.execute(_PRESENT_INDEXES)}
+    return IndexReport(
+        stats_since=stats_since[0] if stats_since else None,
+        unused=[UnusedIndex(*row) for row in connection.execute(_UNUSED_INDEXES, {"max_scans": max_scans})],
+        invalid=[(str(table), str(index)) for table, index in connection.execute(_INVALID_INDEXES)],
+        missing=sorted((table, index) for index, table in declared_indexes(metadata).items() if index not in present),
+        seq_scanned=[SeqScannedTable(*row) for row in connection.execute(_SEQ_SCANNED_TABLES, {"min_rows": min_rows})],
+    )
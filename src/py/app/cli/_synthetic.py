@@ -0,0 +1,444 @@
+"""Synthetic dataset generation for the ``perf generate`` command.
+
+Every row is a pure function of the :class:`SyntheticSpec` and the row's index: ids,
+timestamps and random choices are derived from ``(seed, table, index)``. Chunks of any table
+can therefore be generated in any order, by any worker process, and still produce the same
+database for the same seed. Each worker COPYs its chunk over its own psycopg connection.
+
+Ids follow the UUIDv7 layout with a timestamp that grows with the index, so primary key
+indexes see the same append-mostly insert order as production data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+__all__ = (
+    "SYNTHETIC_PASSWORD",
+    "TABLES",
+    "SyntheticSpec",
+    "generate",
+    "generate_rows",
+    "plan_chunks",
+)
+
+SYNTHETIC_PASSWORD: Final = "Synthetic-Passw0rd!"  # noqa: S105
+"""Password shared by every generated user (hashed once, not per user)."""
+
+_AUDIT_ACTIONS: Final = (
+    ("auth.login", 50),
+    ("auth.refresh", 25),
+    ("auth.logout", 8),
+    ("login.failed", 6),
+    ("team.member.added", 4),
+    ("team.updated", 3),
+    ("user.updated", 2),
+    ("admin.user.update", 1),
+    ("admin.team.update", 1),
+)
+_DEVICES: Final = ("Chrome on macOS", "Firefox on Linux", "Safari on iOS", "Edge on Windows", None)
+_MAX_REFRESH_TOKENS: Final = 20
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Cardinalities and distributions of a synthetic dataset."""
+
+    seed: int = 42
+    users: int = 10_000
+    teams: int = 1_000
+    tags: int = 200
+    audit_logs: int = 100_000
+    memberships_per_user: float = 1.5
+    """Mean team memberships per user; sets the total size of all teams."""
+    team_size_skew: float = 1.2
+    """Zipf exponent of team sizes: team ``j`` gets a share proportional to ``1 / (j + 1) ** skew``."""
+    tags_per_team: float = 3.0
+    """Mean tags per team (Poisson)."""
+    refresh_tokens_per_user: float = 2.0
+    """Mean refresh tokens per user (exponential, capped at 20)."""
+    until: datetime = datetime(2026, 1, 1, tzinfo=UTC)
+    """Newest generated timestamp; rows are spread over the ``days`` before it."""
+    days: int = 365
+    password_hash: str = ""
+    default_role_id: UUID | None = None
+    """Role given to every generated user, if set."""
+    _team_weight_total: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        total = math.fsum(1 / (rank + 1) ** self.team_size_skew for rank in range(self.teams))
+        object.__setattr__(self, "_team_weight_total", total)
+
+    @property
+    def start(self) -> datetime:
+        return self.until - timedelta(days=self.days)
+
+    def team_size(self, team: int) -> int:
+        """Number of members of team ``team``, following the configured skew."""
+        if not self.users:
+            return 0
+        share: float = 1 / (team + 1) ** self.team_size_skew / self._team_weight_total
+        return max(1, min(self.users, round(self.users * self.memberships_per_user * share)))
+
+
+def _digest(*key: Any) -> bytes:
+    return hashlib.blake2b(":".join(map(str, key)).encode(), digest_size=16).digest()
+
+
+def _rng(spec: SyntheticSpec, table: str, index: int) -> random.Random:
+    return random.Random(int.from_bytes(_digest(spec.seed, table, index)))  # noqa: S311
+
+
+def _uuid7(moment: datetime, *key: Any) -> UUID:
+    random_bits = int.from_bytes(_digest(*key)) & ((1 << 74) - 1)
+    milliseconds = int(moment.timestamp() * 1000) & ((1 << 48) - 1)
+    rand_a, rand_b = random_bits >> 62, random_bits & ((1 << 62) - 1)
+    return UUID(int=(milliseconds << 80) | (0x7 << 76) | (rand_a << 64) | (0b10 << 62) | rand_b)
+
+
+def _created_at(spec: SyntheticSpec, index: int, count: int) -> datetime:
+    """Spread ``count`` rows evenly and in index order over the dataset's time span."""
+    return spec.start + timedelta(seconds=spec.days * 86_400 * index / max(count, 1))
+
+
+def _user(spec: SyntheticSpec, index: int) -> tuple[UUID, datetime]:
+    created = _created_at(spec, index, spec.users)
+    return _uuid7(created, spec.seed, "user", index), created
+
+
+def _team(spec: SyntheticSpec, index: int) -> tuple[UUID, datetime]:
+    created = _created_at(spec, index, spec.teams)
+    return _uuid7(created, spec.seed, "team", index), created
+
+
+def _tag(spec: SyntheticSpec, index: int) -> tuple[UUID, datetime]:
+    created = _created_at(spec, index, spec.tags)
+    return _uuid7(created, spec.seed, "tag", index), created
+
+
+def _email(spec: SyntheticSpec, index: int) -> str:
+    return f"user{index:07d}.s{spec.seed}@example.com"
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    threshold, count, product = math.exp(-mean), 0, rng.random()
+    while product > threshold:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def _user_account(spec: SyntheticSpec, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+    for index in range(start, stop):
+        rng = _rng(spec, "user_account", index)
+        user_id, created = _user(spec, index)
+        verified = rng.random() < 0.8  # noqa: PLR2004
+        yield (
+            user_id,
+            _email(spec, index),
+            f"Synthetic User {index}",
+            f"s{spec.seed}u{index}"[:30],
+            spec.password_hash or None,
+            rng.random() < 0.95,  # noqa: PLR2004
+            index == 0,
+            verified,
+            created.date() if verified else None,
+            created.date(),
+            rng.randrange(200),
+            0,
+            rng.random() < 0.1,  # noqa: PLR2004
+            created,
+            created,
+        )
+
+
+def _team_rows(spec: SyntheticSpec, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+    for index in range(start, stop):
+        team_id, created = _team(spec, index)
+        slug = f"team-s{spec.seed}-{index}"
+        yield (team_id, f"Team {index}", f"Synthetic team {index}", True, slug, created, created)
+
+
+def _tag_rows(spec: SyntheticSpec, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+    for index in range(start, stop):
+        tag_id, created = _tag(spec, index)
+        yield (tag_id, f"Tag {index}", None, f"tag-s{spec.seed}-{index}", created, created)
+
+
+def _team_member(spec: SyntheticSpec, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+    for team in range(start, stop):
+        rng = _rng(spec, "team_member", team)
+        team_id, team_created = _team(spec, team)
+        for position, member in enumerate(rng.sample(range(spec.users), spec.team_size(team))):
+            user_id, user_created = _user(spec, member)
+            joined = max(team_created, user_created)
+            is_owner = position == 0
+            role = "ADMIN" if is_owner or rng.random() < 0.1 else "MEMBER"  # noqa: PLR2004
+            member_id = _uuid7(joined, spec.seed, "team_member", team, member)
+            yield (member_id, user_id, team_id, role, is_owner, joined, joined)
+
+
+def _team_tag(spec: SyntheticSpec, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+    if not spec.tags:
+        return
+    for team in range(start, stop):
+        rng = _rng(spec, "team_tag", team)
+        team_id, _ = _team(spec, team)
+        for tag in rng.sample(range(spec.tags), min(spec.tags, _poisson(rng, spec.tags_per_team))):
+            yield (team_id, _tag(spec, tag)[0])
+
+
+def _refresh_token(spec: SyntheticSpec, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+    for user in range(start, stop):
+        rng = _rng(spec, "refresh_token", user)
+        user_id, user_created = _user(spec, user)
+        count = min(_MAX_REFRESH_TOKENS, int(rng.expovariate(1 / spec.refresh_tokens_per_user)))
+        family_id = _uuid7(user_created, spec.seed, "token_family", user)
+        for number in range(count):
+            issued = user_created + (spec.until - user_created) * rng.random()
+            revoked = issued + timedelta(hours=rng.randrange(1, 72)) if rng.random() < 0.6 else None  # noqa: PLR2004
+            yield (
+                _uuid7(issued, spec.seed, "refresh_token", user, number),
+                user_id,
+                hashlib.sha256(_digest(spec.seed, "token_hash", user, number)).hexdigest(),
+                family_id,
+                issued + timedelta(days=7),
+                revoked,
+                rng.choice(_DEVICES),
+                issued,
+                revoked or issued,
+            )
+
+
+def _audit_log(spec: SyntheticSpec, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+    actions = [action for action, _ in _AUDIT_ACTIONS]
+    weights = [weight for _, weight in _AUDIT_ACTIONS]
+    for index in range(start, stop):
+        rng = _rng(spec, "audit_log", index)
+        created = _created_at(spec, index, spec.audit_logs)
+        # A small share of accounts produces most of the activity; a few events have no actor.
+        actor = int(spec.users * rng.random() ** 3) if spec.users and rng.random() < 0.98 else None  # noqa: PLR2004
+        action = rng.choices(actions, weights)[0]
+        if "team" in action and spec.teams:
+            team = rng.randrange(spec.teams)
+            target: tuple[str | None, str | None, str | None] = ("team", str(_team(spec, team)[0]), f"Team {team}")
+        elif actor is not None:
+            target = ("user", str(_user(spec, actor)[0]), _email(spec, actor))
+        else:
+            target = (None, None, None)
+        yield (
+            _uuid7(created, spec.seed, "audit_log", index),
+            _user(spec, actor)[0] if actor is not None else None,
+            _email(spec, actor) if actor is not None else None,
+            action,
+            *target,
+            json.dumps({"synthetic": True, "sequence": index}),
+            f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}",
+            rng.choice(_DEVICES),
+            created,
+            created,
+        )
+
+
+def _user_account_role(spec: SyntheticSpec, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+    if spec.default_role_id is None:
+        return
+    for user in range(start, stop):
+        user_id, created = _user(spec, user)
+        assignment_id = _uuid7(created, spec.seed, "user_account_role", user)
+        yield (assignment_id, user_id, spec.default_role_id, created, created, created)
+
+
+@dataclass(frozen=True)
+class _Table:
+    name: str
+    columns: tuple[str, ...]
+    rows: Callable[[SyntheticSpec, int, int], Iterator[tuple[Any, ...]]]
+    units: Callable[[SyntheticSpec], int]
+    """Number of generator units (users, teams, ...) the table's rows are derived from."""
+    rows_per_unit: Callable[[SyntheticSpec], float] = lambda _: 1.0
+    phase: int = 0
+    """Tables of a later phase reference rows of earlier phases."""
+
+
+TABLES: Final[tuple[_Table, ...]] = (
+    _Table(
+        "user_account",
+        (
+            "id",
+            "email",
+            "name",
+            "username",
+            "hashed_password",
+            "is_active",
+            "is_superuser",
+            "is_verified",
+            "verified_at",
+            "joined_at",
+            "login_count",
+            "failed_reset_attempts",
+            "is_two_factor_enabled",
+            "created_at",
+            "updated_at",
+        ),
+        _user_account,
+        lambda spec: spec.users,
+    ),
+    _Table(
+        "team",
+        ("id", "name", "description", "is_active", "slug", "created_at", "updated_at"),
+        _team_rows,
+        lambda spec: spec.teams,
+    ),
+    _Table("tag", ("id", "name", "description", "slug", "created_at", "updated_at"), _tag_rows, lambda spec: spec.tags),
+    _Table(
+        "team_member",
+        ("id", "user_id", "team_id", "role", "is_owner", "created_at", "updated_at"),
+        _team_member,
+        lambda spec: spec.teams,
+        lambda spec: spec.users * spec.memberships_per_user / max(spec.teams, 1),
+        phase=1,
+    ),
+    _Table(
+        "team_tag",
+        ("team_id", "tag_id"),
+        _team_tag,
+        lambda spec: spec.teams,
+        lambda spec: spec.tags_per_team,
+        phase=1,
+    ),
+    _Table(
+        "refresh_token",
+        (
+            "id",
+            "user_id",
+            "token_hash",
+            "family_id",
+            "expires_at",
+            "revoked_at",
+            "device_info",
+            "created_at",
+            "updated_at",
+        ),
+        _refresh_token,
+        lambda spec: spec.users,
+        lambda spec: spec.refresh_tokens_per_user,
+        phase=1,
+    ),
+    _Table(
+        "audit_log",
+        (
+            "id",
+            "actor_id",
+            "actor_email",
+            "action",
+            "target_type",
+            "target_id",
+            "target_label",
+            "details",
+            "ip_address",
+            "user_agent",
+            "created_at",
+            "updated_at",
+        ),
+        _audit_log,
+        lambda spec: spec.audit_logs,
+        phase=1,
+    ),
+    _Table(
+        "user_account_role",
+        ("id", "user_id", "role_id", "assigned_at", "created_at", "updated_at"),
+        _user_account_role,
+        lambda spec: spec.users if spec.default_role_id else 0,
+        phase=1,
+    ),
+)
+_TABLES_BY_NAME: Final = {table.name: table for table in TABLES}
+
+
+def generate_rows(spec: SyntheticSpec, table: str, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+    """Generate the rows of ``table`` derived from units ``start`` to ``stop``.
+
+    Returns:
+        Row tuples in the column order of the table's COPY statement.
+    """
+    return _TABLES_BY_NAME[table].rows(spec, start, stop)
+
+
+def plan_chunks(spec: SyntheticSpec, chunk_size: int) -> list[list[tuple[str, int, int]]]:
+    """Split every table into ``(table, start, stop)`` unit ranges of about ``chunk_size`` rows.
+
+    Returns:
+        One list of chunks per load phase.
+    """
+    phases: list[list[tuple[str, int, int]]] = [[], []]
+    for table in TABLES:
+        units = table.units(spec)
+        step = max(1, int(chunk_size / max(table.rows_per_unit(spec), 1)))
+        phases[table.phase].extend((table.name, start, min(start + step, units)) for start in range(0, units, step))
+    return phases
+
+
+def _copy_chunk(dsn: str, spec: SyntheticSpec, table: str, start: int, stop: int) -> tuple[str, int, int]:
+    """Generate and COPY one chunk; runs in a worker process."""
+    import psycopg
+    from psycopg import sql
+
+    columns = sql.SQL(", ").join(map(sql.Identifier, _TABLES_BY_NAME[table].columns))
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(sql.Identifier(table), columns)
+    rows = 0
+    with (
+        psycopg.connect(dsn) as connection,
+        connection.cursor() as cursor,
+        cursor.copy(statement) as copy,
+    ):
+        for row in generate_rows(spec, table, start, stop):
+            copy.write_row(row)
+            rows += 1
+    return table, stop - start, rows
+
+
+def generate(
+    spec: SyntheticSpec,
+    dsn: str,
+    *,
+    workers: int,
+    chunk_size: int,
+    on_chunk: Callable[[str, int, int], None] | None = None,
+) -> dict[str, int]:
+    """Load the dataset described by ``spec`` into the database at ``dsn``.
+
+    Users, teams and tags are loaded first, then the tables that reference them. Within a
+    phase, chunks are generated and copied by ``workers`` processes in parallel.
+
+    Args:
+        spec: The dataset to generate.
+        dsn: libpq connection string of the target database.
+        workers: Worker processes.
+        chunk_size: Approximate rows per COPY.
+        on_chunk: Optional callback invoked with ``(table, units, rows)`` after each chunk.
+
+    Returns:
+        Rows written per table.
+    """
+    written = {table.name: 0 for table in TABLES}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for phase in plan_chunks(spec, chunk_size):
+            futures = [executor.submit(_copy_chunk, dsn, spec, *chunk) for chunk in phase]
+            for future in as_completed(futures):
+                table, units, rows = future.result()
+                written[table] += rows
+                if on_chunk is not None:
+                    on_chunk(table, units, rows)
+    return written
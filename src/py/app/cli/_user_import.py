@@ -0,0 +1,424 @@
+"""Bulk user import for the ``users import`` command.
+
+Rows are streamed from a CSV or JSONL file and validated with :mod:`app.lib.validation`.
+Plain-text passwords are hashed across a process pool while the previous batch is being
+written. Each batch is loaded with PostgreSQL ``COPY`` into a temporary staging table, then
+merged into ``user_account`` and ``user_account_role`` with one set-based statement.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final, Literal, cast
+from uuid import UUID  # noqa: TC003
+
+import msgspec
+from advanced_alchemy.utils.text import slugify
+from uuid_utils.compat import uuid7
+
+from app.lib import constants
+from app.lib.validation import (
+    ValidationError,
+    validate_email,
+    validate_name,
+    validate_password,
+    validate_phone,
+    validate_username,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+__all__ = (
+    "ImportFormat",
+    "ImportRow",
+    "ImportStats",
+    "detect_format",
+    "import_users",
+    "parse_row",
+    "read_rows",
+)
+
+ImportFormat = Literal["csv", "jsonl"]
+
+ARGON2_PREFIX: Final = "$argon2"
+"""Prefix of a PHC-formatted Argon2 hash; such values are stored as given."""
+ROLE_SEPARATOR: Final = ";"
+"""Separator for multiple role slugs in a CSV ``roles`` cell."""
+_TRUE_VALUES: Final = frozenset({"1", "true", "t", "yes", "y"})
+_FALSE_VALUES: Final = frozenset({"", "0", "false", "f", "no", "n"})
+
+_jsonl_decoder = msgspec.json.Decoder(dict[str, Any])
+
+_STAGING_TABLE: Final = "user_import_staging"
+_STAGING_COLUMNS: Final = (
+    "id",
+    "email",
+    "name",
+    "username",
+    "phone",
+    "hashed_password",
+    "is_active",
+    "is_superuser",
+    "is_verified",
+    "role_slugs",
+)
+_STAGING_TYPES: Final = ("uuid", "text", "text", "text", "text", "text", "bool", "bool", "bool", "text[]")
+
+_CREATE_STAGING = f"""
+CREATE TEMPORARY TABLE IF NOT EXISTS {_STAGING_TABLE} (
+    id uuid NOT NULL,
+    email text NOT NULL,
+    name text,
+    username text,
+    phone text,
+    hashed_password text,
+    is_active boolean NOT NULL,
+    is_superuser boolean NOT NULL,
+    is_verified boolean NOT NULL,
+    role_slugs text[] NOT NULL
+) ON COMMIT DELETE ROWS
+"""
+
+# One statement per batch: upsert the staged users, then give the accounts it touched their
+# staged roles. Rows whose username already belongs to another account are left out rather
+# than failing the batch; association ids come from gen_random_uuid() because the user ids
+# they point at are only known inside the statement.
+_MERGE = f"""
+WITH merged AS (
+    INSERT INTO user_account (
+        id, email, name, username, phone, hashed_password, is_active, is_superuser, is_verified,
+        verified_at, joined_at, login_count, failed_reset_attempts, is_two_factor_enabled, created_at, updated_at
+    )
+    SELECT
+        s.id, s.email, s.name, s.username, s.phone, s.hashed_password, s.is_active, s.is_superuser, s.is_verified,
+        CASE WHEN s.is_verified THEN current_date END, current_date, 0, 0, false, now(), now()
+    FROM {_STAGING_TABLE} AS s
+    WHERE s.username IS NULL
+       OR NOT EXISTS (SELECT 1 FROM user_account AS u WHERE u.username = s.username AND u.email <> s.email)
+    ON CONFLICT (email) DO {{on_conflict}}
+    RETURNING id, email
+),
+assigned AS (
+    INSERT INTO user_account_role (id, user_id, role_id, assigned_at, created_at, updated_at)
+    SELECT gen_random_uuid(), merged.id, r.id, now(), now(), now()
+    FROM merged
+    JOIN {_STAGING_TABLE} AS s ON s.email = merged.email
+    CROSS JOIN LATERAL unnest(s.role_slugs) AS slug(value)
+    JOIN role AS r ON r.slug = slug.value
+    WHERE NOT EXISTS (SELECT 1 FROM user_account_role AS ur WHERE ur.user_id = merged.id AND ur.role_id = r.id)
+)
+SELECT count(*) FROM merged
+"""  # noqa: S608
+
+_UPDATE_EXISTING = """UPDATE SET
+        name = coalesce(excluded.name, user_account.name),
+        username = coalesce(excluded.username, user_account.username),
+        phone = coalesce(excluded.phone, user_account.phone),
+        hashed_password = coalesce(excluded.hashed_password, user_account.hashed_password),
+        is_active = excluded.is_active,
+        is_superuser = excluded.is_superuser,
+        is_verified = excluded.is_verified,
+        updated_at = now()"""
+
+
+class ImportRow(msgspec.Struct, kw_only=True):
+    """A validated user row, ready to stage."""
+
+    id: UUID
+    email: str
+    name: str | None = None
+    username: str | None = None
+    phone: str | None = None
+    password: str | None = None
+    """Plain-text password still to be hashed."""
+    hashed_password: str | None = None
+    is_active: bool = True
+    is_superuser: bool = False
+    is_verified: bool = False
+    role_slugs: list[str] = msgspec.field(default_factory=list[str])
+
+    def as_copy_row(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, column) for column in _STAGING_COLUMNS)
+
+
+@dataclass
+class ImportStats:
+    """Running totals for an import."""
+
+    read: int = 0
+    imported: int = 0
+    invalid: int = 0
+    skipped: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list[tuple[int, str]])
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.read / elapsed if elapsed > 0 else 0.0
+
+
+def detect_format(path: Path) -> ImportFormat:
+    """Pick the input format from the file suffix.
+
+    Returns:
+        ``jsonl`` for ``.jsonl``/``.ndjson`` files, otherwise ``csv``.
+    """
+    return "jsonl" if path.suffix.lower() in {".jsonl", ".ndjson"} else "csv"
+
+
+def read_rows(path: Path, import_format: ImportFormat) -> Iterator[tuple[int, dict[str, Any] | str]]:
+    """Stream raw rows from a CSV (with header) or JSONL file.
+
+    JSONL lines are yielded undecoded so that a malformed line is reported by
+    :func:`parse_row` like any other invalid row.
+
+    Yields:
+        The 1-based line number and the CSV row mapping or JSONL line.
+    """
+    with path.open(encoding="utf-8", newline="") as handle:
+        if import_format == "csv":
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line_number, line in enumerate(handle, start=1):
+            if line.strip():
+                yield line_number, line
+
+
+def _optional(value: Any) -> str | None:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _flag(value: Any, *, default: bool) -> bool:
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    msg = f"Invalid boolean value: {value!r}"
+    raise ValidationError(msg)
+
+
+def _roles(value: Any, default_role: str) -> list[str]:
+    if isinstance(value, list):
+        slugs = [str(item).strip() for item in value]  # pyright: ignore[reportUnknownVariableType,reportUnknownArgumentType]
+    else:
+        slugs = [slug.strip() for slug in (_optional(value) or "").split(ROLE_SEPARATOR)]
+    return [slug for slug in slugs if slug] or [default_role]
+
+
+def parse_row(raw: dict[str, Any] | str, *, default_role: str) -> ImportRow:
+    """Validate a raw row into an :class:`ImportRow`.
+
+    Recognised keys are ``email`` (required), ``name``, ``username``, ``phone``, ``password`` or
+    ``hashed_password`` (an Argon2 PHC string), ``is_active``, ``is_superuser``, ``is_verified``
+    and ``roles`` (role slugs; ``;``-separated in CSV). Rows without roles get ``default_role``.
+
+    Raises:
+        ValidationError: If any field fails validation.
+        msgspec.DecodeError: If a JSONL line is not a JSON object.
+
+    Returns:
+        The validated row.
+    """
+    if isinstance(raw, str):
+        raw = _jsonl_decoder.decode(raw)
+    email = _optional(raw.get("email"))
+    if email is None:
+        msg = "Email is required"
+        raise ValidationError(msg)
+    name = _optional(raw.get("name"))
+    username = _optional(raw.get("username"))
+    phone = _optional(raw.get("phone"))
+    password = _optional(raw.get("password"))
+    hashed_password = _optional(raw.get("hashed_password"))
+    if password and hashed_password:
+        msg = "Provide either password or hashed_password, not both"
+        raise ValidationError(msg)
+    if hashed_password and not hashed_password.startswith(ARGON2_PREFIX):
+        msg = "hashed_password must be an Argon2 hash"
+        raise ValidationError(msg)
+    return ImportRow(
+        id=uuid7(),
+        email=validate_email(email),
+        name=validate_name(name) if name else None,
+        username=validate_username(username) if username else None,
+        phone=validate_phone(phone) if phone else None,
+        password=validate_password(password) if password else None,
+        hashed_password=hashed_password,
+        is_active=_flag(raw.get("is_active"), default=True),
+        is_superuser=_flag(raw.get("is_superuser"), default=False),
+        is_verified=_flag(raw.get("is_verified"), default=False),
+        role_slugs=_roles(raw.get("roles"), default_role),
+    )
+
+
+def _hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash a slice of passwords; runs in a worker process."""
+    from app.lib.crypt import hasher
+
+    return [hasher.hash(password) for password in passwords]
+
+
+async def _hash_batch(rows: list[ImportRow], executor: Executor, workers: int) -> list[ImportRow]:
+    pending = [row for row in rows if row.password is not None]
+    if not pending:
+        return rows
+    loop = asyncio.get_running_loop()
+    size = -(-len(pending) // workers)
+    slices = [pending[start : start + size] for start in range(0, len(pending), size)]
+    hashed = await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, _hash_passwords, [cast("str", row.password) for row in part])
+            for part in slices
+        )
+    )
+    for part, hashes in zip(slices, hashed, strict=True):
+        for row, password_hash in zip(part, hashes, strict=True):
+            row.hashed_password, row.password = password_hash, None
+    return rows
+
+
+async def _load_batch(connection: AsyncConnection, rows: list[ImportRow], *, update_existing: bool) -> int:
+    from sqlalchemy import text
+
+    # Begin the transaction through SQLAlchemy first: ON COMMIT DELETE ROWS would empty
+    # the staging table if the driver ran the COPY in autocommit mode.
+    await connection.execute(text(f"TRUNCATE {_STAGING_TABLE}"))
+    raw_connection = await connection.get_raw_connection()
+    driver_connection: Any = raw_connection.driver_connection
+    if connection.dialect.driver == "asyncpg":
+        await driver_connection.copy_records_to_table(
+            _STAGING_TABLE, records=[row.as_copy_row() for row in rows], columns=_STAGING_COLUMNS
+        )
+    else:
+        async with driver_connection.cursor() as cursor:
+            statement = f"COPY {_STAGING_TABLE} ({', '.join(_STAGING_COLUMNS)}) FROM STDIN"
+            async with cursor.copy(statement) as copy:
+                copy.set_types(_STAGING_TYPES)
+                for row in rows:
+                    await copy.write_row(row.as_copy_row())
+    merged = await connection.scalar(
+        text(_MERGE.format(on_conflict=_UPDATE_EXISTING if update_existing else "NOTHING"))
+    )
+    await connection.commit()
+    return merged or 0
+
+
+async def import_users(
+    path: Path,
+    *,
+    import_format: ImportFormat,
+    batch_size: int,
+    executor: Executor,
+    workers: int,
+    update_existing: bool = False,
+    on_progress: Callable[[ImportStats], None] | None = None,
+) -> ImportStats:
+    """Import users from ``path`` in batches of ``batch_size``.
+
+    Duplicate emails or usernames within the file are reported as invalid rows. Existing
+    accounts (matched by email) are skipped unless ``update_existing`` is set.
+
+    Args:
+        path: The CSV or JSONL file to read.
+        import_format: ``csv`` or ``jsonl``.
+        batch_size: Rows per ``COPY`` and merge transaction.
+        executor: Process pool used for password hashing.
+        workers: Number of slices each batch's passwords are split into.
+        update_existing: Update accounts whose email already exists instead of skipping them.
+        on_progress: Optional callback invoked with the stats after every batch.
+
+    Raises:
+        RuntimeError: If the configured engine's driver has no COPY support.
+
+    Returns:
+        Final import statistics.
+    """
+    from sqlalchemy import text
+
+    from app.config import alchemy
+
+    engine = alchemy.get_engine()
+    if engine.dialect.driver not in {"psycopg", "asyncpg"}:
+        msg = f"Bulk import needs the psycopg or asyncpg driver for COPY, not {engine.dialect.driver!r}"
+        raise RuntimeError(msg)
+
+    default_role = slugify(constants.DEFAULT_ACCESS_ROLE)
+    stats = ImportStats()
+    seen_emails: set[str] = set()
+    seen_usernames: set[str] = set()
+
+    def _check_unique(row: ImportRow) -> None:
+        if row.email in seen_emails:
+            msg = f"Duplicate email in input: {row.email}"
+            raise ValidationError(msg)
+        if row.username is not None and row.username in seen_usernames:
+            msg = f"Duplicate username in input: {row.username}"
+            raise ValidationError(msg)
+
+    def _batches() -> Iterator[list[ImportRow]]:
+        batch: list[ImportRow] = []
+        for line_number, raw in read_rows(path, import_format):
+            stats.read += 1
+            try:
+                row = parse_row(raw, default_role=default_role)
+                _check_unique(row)
+            except (ValidationError, msgspec.DecodeError) as exc:
+                stats.invalid += 1
+                stats.errors.append((line_number, str(exc)))
+                continue
+            seen_emails.add(row.email)
+            if row.username is not None:
+                seen_usernames.add(row.username)
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async with engine.connect() as connection:
+        await connection.execute(text(_CREATE_STAGING))
+        await connection.commit()
+        # Hash batch N+1 in the pool while batch N is copied and merged.
+        hashing: asyncio.Future[list[ImportRow]] | None = None
+        for batch in _batches():
+            next_hashing = asyncio.ensure_future(_hash_batch(batch, executor, workers))
+            if hashing is not None:
+                await _flush(connection, await hashing, stats, update_existing, on_progress)
+            hashing = next_hashing
+        if hashing is not None:
+            await _flush(connection, await hashing, stats, update_existing, on_progress)
+    return stats
+
+
+async def _flush(
+    connection: AsyncConnection,
+    rows: list[ImportRow],
+    stats: ImportStats,
+    update_existing: bool,
+    on_progress: Callable[[ImportStats], None] | None,
+) -> None:
+    merged = await _load_batch(connection, rows, update_existing=update_existing)
+    stats.imported += merged
+    stats.skipped += len(rows) - merged
+    if on_progress is not None:
+        on_progress(stats)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from pathlib import Path
+from typing import Any, Literal
 
 import click
 
@@ -11,31 +12,84 @@ def user_management_group(_: dict[str, Any]) -> None:
     """Manage application users."""
 
 
-async def load_database_fixtures() -> None:
-    """Import/Synchronize Database Fixtures."""
+@click.group(
+    name="perf",
+    invoke_without_command=False,
+    help="Performance tooling: synthetic datasets, pool sizing and index usage.",
+)
+@click.pass_context
+def perf_group(_: dict[str, Any]) -> None:
+    """Performance tooling."""
+
+
+@click.group(
+    name="diagnose",
+    invoke_without_command=False,
+    help="Diagnose a slow database: top statements, bloat, cache hit ratios and blocked queries.",
+)
+@click.pass_context
+def diagnostics_group(_: dict[str, Any]) -> None:
+    """Database diagnostics."""
+
+
+_output_format = click.option(
+    "--format",
+    "output_format",
+    help="Print rich tables, or JSON for dashboards and scripts",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    show_default=True,
+)
+
+
+def _echo_json(value: Any) -> None:
+    import json
+
+    from app.cli._diagnostics import to_json
+
+    click.echo(json.dumps(to_json(value), indent=2, default=str))
+
+
+def _libpq_dsn() -> str:
+    """The application database URL as a libpq connection string, for commands using psycopg directly."""
+    from sqlalchemy.engine import make_url
+
+    from app.lib.settings import get_settings
+
+    return make_url(get_settings().db.URL).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+async def load_database_fixtures(chunk_size: int = 5000) -> None:
+    """Import/Synchronize Database Fixtures.
+
+    Fixtures are streamed from disk and upserted a chunk at a time, one statement and one
+    commit per chunk, so large fixture files never sit in memory.
+
+    Args:
+        chunk_size: Fixture rows per upsert.
+    """
 
     from pathlib import Path
 
-    from advanced_alchemy.utils.fixtures import open_fixture_async
-    from sqlalchemy import select
-    from sqlalchemy.orm import load_only
+    from advanced_alchemy.utils.text import slugify
     from structlog import get_logger
 
     from app.config import alchemy
     from app.db.models import Role
-    from app.domain.accounts.services import RoleService
     from app.lib.settings import get_settings
+    from app.utils.fixtures import bulk_upsert, iter_fixture_chunks
 
     settings = get_settings()
     logger = get_logger()
     fixtures_path = Path(settings.db.FIXTURE_PATH)
-    async with RoleService.new(
-        statement=select(Role).options(load_only(Role.id, Role.slug, Role.name, Role.description)),
-        config=alchemy,
-    ) as service:
-        fixture_data = await open_fixture_async(fixtures_path, "role")
-        await service.upsert_many(match_fields=["name"], data=fixture_data, auto_commit=True)
-        await logger.ainfo("loaded roles")
+    async with alchemy.get_session() as db_session:
+        loaded = 0
+        for chunk in iter_fixture_chunks(fixtures_path, "role", chunk_size):
+            rows = [{"slug": slugify(row["name"]), **row} for row in chunk]
+            await bulk_upsert(db_session, Role, rows, index_elements=["name"])
+            await db_session.commit()
+            loaded += len(rows)
+        await logger.ainfo("loaded roles", count=loaded)
 
 
 @user_management_group.command(name="create-user", help="Create a user")
@@ -113,6 +167,101 @@ def create_user(
     anyio.run(_create_user, cast("str", email), cast("str", password), name, cast("bool", superuser))
 
 
+@user_management_group.command(name="import", help="Bulk import users from a CSV or JSONL file")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))  # type: ignore[type-var]
+@click.option(
+    "--format",
+    "import_format",
+    help="Input format (defaults to the file suffix: .jsonl/.ndjson or csv)",
+    type=click.Choice(["csv", "jsonl"]),
+    required=False,
+)
+@click.option(
+    "--batch-size",
+    help="Rows per COPY and merge transaction",
+    type=click.IntRange(min=1),
+    default=5000,
+    show_default=True,
+)
+@click.option(
+    "--workers",
+    help="Password hashing processes (defaults to the CPU count)",
+    type=click.IntRange(min=1),
+    required=False,
+)
+@click.option(
+    "--update-existing",
+    help="Update accounts whose email already exists instead of skipping them",
+    is_flag=True,
+    default=False,
+)
+def import_users(
+    path: Path,
+    import_format: str | None,
+    batch_size: int,
+    workers: int | None,
+    update_existing: bool,
+) -> None:
+    """Bulk import users.
+
+    Args:
+        path: CSV (with header) or JSONL file of users.
+        import_format: ``csv`` or ``jsonl``.
+        batch_size: Rows per COPY and merge transaction.
+        workers: Password hashing processes.
+        update_existing: Update existing accounts instead of skipping them.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from typing import cast
+
+    import anyio
+    from rich import get_console
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    from app.cli._user_import import ImportFormat, ImportStats, detect_format
+    from app.cli._user_import import import_users as _import_users
+
+    console = get_console()
+    fmt = cast("ImportFormat", import_format) if import_format else detect_format(path)
+    workers = workers or os.cpu_count() or 1
+    max_reported_errors = 20
+
+    async def _run() -> ImportStats:
+        with (
+            ProcessPoolExecutor(max_workers=workers) as executor,
+            Progress(
+                SpinnerColumn(),
+                TextColumn("{task.description}"),
+                TextColumn("{task.completed:,} rows read"),
+                TextColumn("[cyan]{task.fields[rate]:,.0f} rows/s"),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress,
+        ):
+            task = progress.add_task(f"Importing {path.name}", total=None, rate=0.0)
+            return await _import_users(
+                path,
+                import_format=fmt,
+                batch_size=batch_size,
+                executor=executor,
+                workers=workers,
+                update_existing=update_existing,
+                on_progress=lambda stats: progress.update(task, completed=stats.read, rate=stats.rows_per_second),
+            )
+
+    console.rule(f"Import users from {path}.")
+    stats = anyio.run(_run)
+    for line_number, error in stats.errors[:max_reported_errors]:
+        console.print(f"[yellow]line {line_number}:[/] {error}")
+    if len(stats.errors) > max_reported_errors:
+        console.print(f"[yellow]... and {len(stats.errors) - max_reported_errors} more invalid rows")
+    console.print(
+        f"Read {stats.read:,} rows: {stats.imported:,} imported, {stats.skipped:,} skipped (existing), "
+        f"{stats.invalid:,} invalid at {stats.rows_per_second:,.0f} rows/s"
+    )
+
+
 @user_management_group.command(name="promote-to-superuser", help="Promotes a user to application superuser")
 @click.option(
     "--email",
@@ -159,37 +308,472 @@ def promote_to_superuser(email: str) -> None:
 
 
 @user_management_group.command(name="create-roles", help="Create pre-configured application roles and assign to users.")
-def create_default_roles() -> None:
-    """Create the default Roles for the system
+@click.option(
+    "--chunk-size",
+    help="Users per role assignment statement",
+    type=click.IntRange(min=1),
+    default=10_000,
+    show_default=True,
+)
+def create_default_roles(chunk_size: int) -> None:
+    """Create the default Roles for the system and assign the default role to active users.
 
     Args:
-        email (str): The email address of the user to promote.
+        chunk_size: Users per role assignment statement.
     """
     import anyio
     from advanced_alchemy.utils.text import slugify
     from rich import get_console
 
-    from app.db.models import UserRole
-    from app.domain.accounts.deps import provide_users_service
-    from app.domain.accounts.services import RoleService
+    from app.domain.accounts.services import RoleService, UserRoleService
+    from app.lib import constants
     from app.lib.deps import create_service_provider, provide_services
 
     provide_roles_service = create_service_provider(RoleService)
+    provide_user_roles_service = create_service_provider(UserRoleService)
     console = get_console()
 
     async def _create_default_roles() -> None:
         await load_database_fixtures()
-        async with provide_services(provide_users_service, provide_roles_service) as (users_service, roles_service):
-            default_role = await roles_service.get_one_or_none(slug=slugify(users_service.default_role))
+        async with provide_services(provide_roles_service, provide_user_roles_service) as (
+            roles_service,
+            user_roles_service,
+        ):
+            default_role = await roles_service.get_one_or_none(slug=slugify(constants.DEFAULT_ACCESS_ROLE))
             if default_role:
-                all_active_users = await users_service.list(is_active=True)
-                for user in all_active_users:
-                    if any(r.role_id == default_role.id for r in user.roles):
-                        console.print("User %s already has default role", user.email)
-                    else:
-                        user.roles.append(UserRole(role_id=default_role.id))
-                        console.print("Assigned %s default role", user.email)
-                        await users_service.update(item_id=user.id, data=user, auto_commit=True)
+                assigned = await user_roles_service.assign_role_to_active_users(default_role.id, chunk_size=chunk_size)
+                console.print(f"Assigned the {default_role.name} role to {assigned} users")
 
     console.rule("Creating default roles.")
     anyio.run(_create_default_roles)
+
+
+@perf_group.command(name="generate", help="Generate a deterministic synthetic dataset and COPY it into the database")
+@click.option(
+    "--seed",
+    help="Random seed; the same seed always produces the same data",
+    type=int,
+    default=42,
+    show_default=True,
+)
+@click.option("--users", type=click.IntRange(min=0), default=10_000, show_default=True)
+@click.option("--teams", type=click.IntRange(min=0), default=1_000, show_default=True)
+@click.option("--tags", type=click.IntRange(min=0), default=200, show_default=True)
+@click.option("--audit-logs", type=click.IntRange(min=0), default=100_000, show_default=True)
+@click.option(
+    "--memberships-per-user",
+    help="Mean team memberships per user",
+    type=click.FloatRange(min=0),
+    default=1.5,
+    show_default=True,
+)
+@click.option(
+    "--team-size-skew",
+    help="Zipf exponent of team sizes (0 = equal sizes)",
+    type=click.FloatRange(min=0),
+    default=1.2,
+    show_default=True,
+)
+@click.option(
+    "--tags-per-team",
+    help="Mean tags per team",
+    type=click.FloatRange(min=0),
+    default=3.0,
+    show_default=True,
+)
+@click.option(
+    "--refresh-tokens-per-user",
+    help="Mean refresh tokens per user",
+    type=click.FloatRange(min=0, min_open=True),  # type: ignore[call-arg]
+    default=2.0,
+    show_default=True,
+)
+@click.option(
+    "--days",
+    help="Days of history to spread rows over",
+    type=click.IntRange(min=1),
+    default=365,
+    show_default=True,
+)
+@click.option(
+    "--chunk-size",
+    help="Approximate rows per COPY",
+    type=click.IntRange(min=1),
+    default=50_000,
+    show_default=True,
+)
+@click.option(
+    "--workers",
+    help="Worker processes (defaults to the CPU count)",
+    type=click.IntRange(min=1),
+    required=False,
+)
+@click.option("--truncate", help="Empty the generated tables first", is_flag=True, default=False)
+def generate_synthetic_data(
+    seed: int,
+    users: int,
+    teams: int,
+    tags: int,
+    audit_logs: int,
+    memberships_per_user: float,
+    team_size_skew: float,
+    tags_per_team: float,
+    refresh_tokens_per_user: float,
+    days: int,
+    chunk_size: int,
+    workers: int | None,
+    truncate: bool,
+) -> None:
+    """Generate a synthetic dataset for performance work.
+
+    Every generated user has the password ``Synthetic-Passw0rd!``.
+    """
+    import os
+    import time
+
+    import psycopg
+    from advanced_alchemy.utils.text import slugify
+    from psycopg import sql
+    from rich import get_console
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+
+    from app.cli._synthetic import SYNTHETIC_PASSWORD, TABLES, SyntheticSpec, generate
+    from app.lib import constants
+    from app.lib.crypt import hasher
+
+    console = get_console()
+    dsn = _libpq_dsn()
+    if truncate:
+        click.confirm("Truncate user_account, team, tag, audit_log and every table referencing them?", abort=True)
+    with psycopg.connect(dsn, autocommit=True) as connection:
+        if truncate:
+            names = sql.SQL(", ").join(sql.Identifier(table.name) for table in TABLES)
+            connection.execute(sql.SQL("TRUNCATE {} CASCADE").format(names))
+        role_id = connection.execute(
+            "SELECT id FROM role WHERE slug = %s", (slugify(constants.DEFAULT_ACCESS_ROLE),)
+        ).fetchone()
+    spec = SyntheticSpec(
+        seed=seed,
+        users=users,
+        teams=teams,
+        tags=tags,
+        audit_logs=audit_logs,
+        memberships_per_user=memberships_per_user,
+        team_size_skew=team_size_skew,
+        tags_per_team=tags_per_team,
+        refresh_tokens_per_user=refresh_tokens_per_user,
+        days=days,
+        password_hash=hasher.hash(SYNTHETIC_PASSWORD),
+        default_role_id=role_id[0] if role_id else None,
+    )
+
+    console.rule(f"Generating synthetic data (seed {seed}).")
+    started = time.perf_counter()
+    with Progress(
+        TextColumn("{task.description:<18}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("[cyan]{task.fields[rows]:,} rows"),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        tasks = {
+            table.name: progress.add_task(table.name, total=table.units(spec), rows=0)
+            for table in TABLES
+            if table.units(spec)
+        }
+        copied = dict.fromkeys(tasks, 0)
+
+        def _on_chunk(table: str, units: int, rows: int) -> None:
+            copied[table] += rows
+            progress.update(tasks[table], advance=units, rows=copied[table])
+
+        written = generate(spec, dsn, workers=workers or os.cpu_count() or 1, chunk_size=chunk_size, on_chunk=_on_chunk)
+    with psycopg.connect(dsn, autocommit=True) as connection:
+        connection.execute(sql.SQL("ANALYZE {}").format(sql.SQL(", ").join(map(sql.Identifier, written))))
+    elapsed = time.perf_counter() - started
+    total = sum(written.values())
+    console.print(f"Wrote {total:,} rows in {elapsed:,.1f}s ({total / elapsed:,.0f} rows/s)")
+
+
+@perf_group.command(name="pool-advice", help="Recommend connection pool settings from a running worker's metrics")
+@click.option(
+    "--url",
+    help="Metrics endpoint of one worker",
+    type=click.STRING,
+    default="http://localhost:8000/metrics",
+    show_default=True,
+)
+@click.option("--token", help="Bearer token when METRICS_TOKEN is set", type=click.STRING, default=None)
+@click.option(
+    "--interval",
+    help="Seconds between the two scrapes; run it under representative load",
+    type=click.FloatRange(min=1),
+    default=60,
+    show_default=True,
+)
+@click.option(
+    "--pool",
+    help="Engine whose pool to size: primary, or replica0, replica1... in DATABASE_REPLICA_URLS order",
+    type=click.STRING,
+    default="primary",
+    show_default=True,
+)
+@click.option("--top", help="Routes to list by connection hold time", type=click.IntRange(min=0), default=5)
+def pool_advice(url: str, token: str | None, interval: float, pool: str, top: int) -> None:
+    """Scrape a worker's metrics twice and size its pool from what happened in between."""
+    import time
+
+    import httpx
+    from rich import get_console
+    from rich.table import Table
+
+    from app.lib.pool import advise_pool_size
+
+    console = get_console()
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    with httpx.Client(headers=headers, timeout=10) as client:
+        before = client.get(url).raise_for_status().text
+        with console.status(f"Watching {url} for {interval:g}s"):
+            time.sleep(interval)
+        after = client.get(url).raise_for_status().text
+    advice = advise_pool_size(before, after, interval, pool=pool)
+
+    console.print(
+        f"{advice.checkouts:,} checkouts, {advice.slow_waits:,} waited, "
+        f"{advice.overflow_connects:,} overflow connects, {advice.in_use:.2f} connections in use on average"
+    )
+    if advice.routes and top:
+        table = Table("Route", "Hold seconds", "Share")
+        held = sum(seconds for _, seconds in advice.routes)
+        for route, seconds in advice.routes[:top]:
+            table.add_row(route, f"{seconds:,.2f}", f"{seconds / held:.0%}")
+        console.print(table)
+    console.print(
+        f"DATABASE_POOL_SIZE={advice.recommended_size} "
+        f"DATABASE_MAX_POOL_OVERFLOW={advice.recommended_overflow} (currently {advice.pool_size})"
+    )
+
+
+@perf_group.command(name="index-report", help="Report unused, invalid and missing indexes from PostgreSQL statistics")
+@click.option(
+    "--max-scans",
+    help="Non-unique indexes scanned at most this often are reported as unused",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+)
+@click.option(
+    "--min-rows",
+    help="Only report sequentially scanned tables with at least this many rows",
+    type=click.IntRange(min=0),
+    default=1000,
+    show_default=True,
+)
+def index_report(max_scans: int, min_rows: int) -> None:
+    """Read pg_stat_user_indexes and pg_stat_user_tables and print what needs attention."""
+    import psycopg
+    from advanced_alchemy.base import UUIDAuditBase
+    from rich import get_console
+    from rich.table import Table
+
+    from app.cli._index_report import index_report
+
+    console = get_console()
+    dsn = _libpq_dsn()
+    with psycopg.connect(dsn, autocommit=True) as connection:
+        report = index_report(connection, UUIDAuditBase.registry.metadata, max_scans=max_scans, min_rows=min_rows)
+
+    console.print(f"Statistics collected since {report.stats_since or 'the database was created'}.")
+    if report.unused:
+        table = Table("Table", "Index", "Scans", "Size", title="Unused indexes")
+        for unused in report.unused:
+            table.add_row(unused.table, unused.index, f"{unused.scans:,}", f"{unused.size_bytes / 1024**2:,.1f} MiB")
+        console.print(table)
+    if report.invalid:
+        table = Table("Table", "Index", title="Invalid indexes (failed concurrent builds: drop and recreate)")
+        for row in report.invalid:
+            table.add_row(*row)
+        console.print(table)
+    if report.missing:
+        table = Table("Table", "Index", title="Indexes declared by the models but missing (pending migrations?)")
+        for row in report.missing:
+            table.add_row(*row)
+        console.print(table)
+    if report.seq_scanned:
+        table = Table(
+            "Table", "Seq scans", "Rows read", "Index scans", "Live rows", title="Mostly sequentially scanned"
+        )
+        for seq in report.seq_scanned:
+            table.add_row(
+                seq.table, f"{seq.seq_scans:,}", f"{seq.seq_rows_read:,}", f"{seq.index_scans:,}", f"{seq.live_rows:,}"
+            )
+        console.print(table)
+    if not (report.unused or report.invalid or report.missing or report.seq_scanned):
+        console.print("Nothing to report.")
+
+
+@diagnostics_group.command(
+    name="statements", help="Top statements by total or mean execution time (pg_stat_statements)"
+)
+@click.option(
+    "--sort",
+    "order_by",
+    help="Rank by total time across all calls or by mean time per call",
+    type=click.Choice(["total", "mean"]),
+    default="total",
+    show_default=True,
+)
+@click.option("--limit", help="Statements to list", type=click.IntRange(min=1), default=20, show_default=True)
+@_output_format
+def top_statements(order_by: Literal["total", "mean"], limit: int, output_format: str) -> None:
+    """Print the statements of this database that took the most time."""
+    import psycopg
+    from rich import get_console
+    from rich.table import Table
+
+    from app.cli._diagnostics import DiagnosticsError, top_statements
+
+    dsn = _libpq_dsn()
+    with psycopg.connect(dsn, autocommit=True) as connection:
+        try:
+            statements = top_statements(connection, order_by=order_by, limit=limit)
+        except DiagnosticsError as exc:
+            raise click.ClickException(str(exc)) from exc
+
+    if output_format == "json":
+        _echo_json(statements)
+        return
+    table = Table(
+        "Calls", "Total ms", "Mean ms", "Rows", "Cache hits", "Query", title=f"Top statements by {order_by} time"
+    )
+    for statement in statements:
+        table.add_row(
+            f"{statement.calls:,}",
+            f"{statement.total_ms:,.1f}",
+            f"{statement.mean_ms:,.2f}",
+            f"{statement.rows:,}",
+            "-" if statement.cache_hit_ratio is None else f"{statement.cache_hit_ratio:.1%}",
+            " ".join(statement.query.split()),
+        )
+    get_console().print(table)
+
+
+@diagnostics_group.command(name="bloat", help="Estimate table and B-tree index bloat from planner statistics")
+@click.option(
+    "--table",
+    "tables",
+    help="Table to check; repeat for several (default: the token and audit tables)",
+    type=click.STRING,
+    multiple=True,
+)
+@_output_format
+def bloat(tables: tuple[str, ...], output_format: str) -> None:
+    """Print the estimated wasted space of the tables and their indexes."""
+    import psycopg
+    from rich import get_console
+    from rich.table import Table
+
+    from app.cli._diagnostics import BLOAT_TABLES, bloat
+
+    dsn = _libpq_dsn()
+    with psycopg.connect(dsn, autocommit=True) as connection:
+        found = bloat(connection, tables or BLOAT_TABLES)
+
+    if output_format == "json":
+        _echo_json(found)
+        return
+    table = Table("Table", "Index", "Size", "Bloat", "Share", title="Estimated bloat (as of the last ANALYZE)")
+    for item in found:
+        table.add_row(
+            item.table,
+            item.index or "-",
+            f"{item.size_bytes / 1024**2:,.1f} MiB",
+            f"{item.bloat_bytes / 1024**2:,.1f} MiB",
+            f"{item.bloat_ratio:.0%}",
+        )
+    get_console().print(table)
+
+
+@diagnostics_group.command(name="cache", help="Shared buffer hit ratios of the database and its busiest tables")
+@click.option(
+    "--limit",
+    help="Tables to list, most blocks read from disk first",
+    type=click.IntRange(min=0),
+    default=10,
+    show_default=True,
+)
+@_output_format
+def cache_hit_ratios(limit: int, output_format: str) -> None:
+    """Print how many block reads were served from shared buffers."""
+    import psycopg
+    from rich import get_console
+    from rich.table import Table
+
+    from app.cli._diagnostics import cache_hit_ratios
+
+    dsn = _libpq_dsn()
+    with psycopg.connect(dsn, autocommit=True) as connection:
+        ratios = cache_hit_ratios(connection, limit=limit)
+
+    if output_format == "json":
+        _echo_json(ratios)
+        return
+
+    def _ratio(value: float | None) -> str:
+        return "-" if value is None else f"{value:.2%}"
+
+    console = get_console()
+    console.print(f"Database cache hit ratio: {_ratio(ratios.database)}")
+    if ratios.tables:
+        table = Table("Table", "Heap reads", "Heap hits", "Index reads", "Index hits")
+        for row in ratios.tables:
+            table.add_row(
+                row.table,
+                f"{row.heap_blocks_read:,}",
+                _ratio(row.heap_hit_ratio),
+                f"{row.index_blocks_read:,}",
+                _ratio(row.index_hit_ratio),
+            )
+        console.print(table)
+
+
+@diagnostics_group.command(name="activity", help="Long-running transactions and queries waiting on locks")
+@click.option(
+    "--min-duration",
+    help="Seconds a transaction must have run to be listed; blocked queries are always listed",
+    type=click.FloatRange(min=0),
+    default=5,
+    show_default=True,
+)
+@_output_format
+def activity(min_duration: float, output_format: str) -> None:
+    """Print backends that are slow or blocked, and what blocks them."""
+    import psycopg
+    from rich import get_console
+    from rich.table import Table
+
+    from app.cli._diagnostics import activity
+
+    dsn = _libpq_dsn()
+    with psycopg.connect(dsn, autocommit=True) as connection:
+        backends = activity(connection, min_seconds=min_duration)
+
+    if output_format == "json":
+        _echo_json(backends)
+        return
+    if not backends:
+        get_console().print(f"No transaction has run for {min_duration:g}s and nothing is waiting on a lock.")
+        return
+    table = Table("PID", "State", "Waiting on", "Transaction s", "Query s", "Blocked by", "Query")
+    for backend in backends:
+        table.add_row(
+            str(backend.pid),
+            backend.state or "-",
+            f"{backend.wait_event_type}: {backend.wait_event}" if backend.wait_event_type else "-",
+            "-" if backend.transaction_seconds is None else f"{backend.transaction_seconds:,.1f}",
+            "-" if backend.query_seconds is None else f"{backend.query_seconds:,.1f}",
+            ", ".join(map(str, backend.blocked_by)) or "-",
+            " ".join(backend.query.split()),
+        )
+    get_console().print(table)
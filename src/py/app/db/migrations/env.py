@@ -9,6 +9,9 @@ from sqlalchemy import pool
 from sqlalchemy.ext.asyncio import AsyncEngine, async_engine_from_config
 from sqlalchemy.sql.schema import SchemaItem
 
+from app.lib.settings import get_settings
+from app.utils.migrations import timeout_statements
+
 if TYPE_CHECKING:
     from advanced_alchemy.alembic.commands import AlembicCommandConfig
     from sqlalchemy.engine import Connection
@@ -78,14 +81,27 @@ def run_migrations_offline() -> None:
         render_as_batch=config.render_as_batch,
         process_revision_directives=writer,
         include_object=include_object,
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
+        if context.get_context().dialect.name == "postgresql":
+            for statement in timeout_statements(get_settings().db):
+                context.execute(statement)
         context.run_migrations()
 
 
 def do_run_migrations(connection: "Connection") -> None:
-    """Run migrations."""
+    """Run migrations.
+
+    On PostgreSQL the session gets ``DATABASE_MIGRATION_LOCK_TIMEOUT`` and
+    ``DATABASE_MIGRATION_STATEMENT_TIMEOUT``, so DDL waiting behind a long transaction fails
+    instead of blocking every query queued after it. Each migration commits on its own.
+    """
+    if connection.dialect.name == "postgresql":
+        for statement in timeout_statements(get_settings().db):
+            connection.exec_driver_sql(statement)
+        connection.commit()
     context.configure(
         connection=connection,
         target_metadata=metadata_registry.get(config.bind_key),
@@ -96,6 +112,7 @@ def do_run_migrations(connection: "Connection") -> None:
         render_as_batch=config.render_as_batch,
         process_revision_directives=writer,
         include_object=include_object,
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -0,0 +1,84 @@
+"""hot path indexes
+
+Revision ID: 7d60625a37c8
+Revises: bc9c4ab7c2be
+Create Date: 2026-10-19 14:36:05.913274
+
+"""
+import warnings
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+from advanced_alchemy.types import EncryptedString, EncryptedText, GUID, ORA_JSONB, DateTimeUTC, StoredObject, PasswordHash
+from sqlalchemy import Text  # pyright: ignore  # noqa: F401
+
+from app.utils.migrations import create_index_concurrently, drop_index_concurrently
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence  # pyright: ignore
+
+__all__ = ("downgrade", "upgrade", "schema_upgrades", "schema_downgrades", "data_upgrades", "data_downgrades")
+
+sa.GUID = GUID # pyright: ignore
+sa.DateTimeUTC = DateTimeUTC  # pyright: ignore
+sa.ORA_JSONB = ORA_JSONB  # pyright: ignore
+sa.EncryptedString = EncryptedString  # pyright: ignore
+sa.EncryptedText = EncryptedText  # pyright: ignore
+sa.StoredObject = StoredObject  # pyright: ignore
+sa.PasswordHash = PasswordHash  # pyright: ignore
+
+# revision identifiers, used by Alembic.
+revision = '7d60625a37c8'
+down_revision = 'bc9c4ab7c2be'
+branch_labels = None
+depends_on = None
+
+ACTIVE_REFRESH_TOKENS = 'revoked_at IS NULL'
+
+# (index, table, columns, partial index predicate)
+HOT_PATH_INDEXES = (
+    # Dashboard stats, recent activity and the audit list's default created_at sort.
+    ('ix_audit_log_created_at', 'audit_log', ['created_at'], None),
+    # AuditLogService.count_recent_actions (MFA rate limiting).
+    ('ix_audit_log_actor_id_action_created_at', 'audit_log', ['actor_id', 'action', 'created_at'], None),
+    # Membership lookups by team; uq_team_member_user_id leads with user_id and only covers those.
+    ('ix_team_member_team_id', 'team_member', ['team_id'], None),
+    # Active refresh tokens of a user (logout, rotation, session listing).
+    ('ix_refresh_token_user_id_active', 'refresh_token', ['user_id'], ACTIVE_REFRESH_TOKENS),
+    # Team.pending_invitations.
+    ('ix_team_invitation_team_id_is_accepted', 'team_invitation', ['team_id', 'is_accepted'], None),
+)
+
+
+def upgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
+        with op.get_context().autocommit_block():
+            schema_upgrades()
+            data_upgrades()
+
+def downgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
+        with op.get_context().autocommit_block():
+            data_downgrades()
+            schema_downgrades()
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+    # Built concurrently so writes to these tables are not blocked. An INVALID index left by a
+    # failed earlier build is dropped and rebuilt; `app perf index-report` lists those.
+    for index_name, table_name, columns, where in HOT_PATH_INDEXES:
+        create_index_concurrently(index_name, table_name, columns, where=where)
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+    for index_name, table_name, _, _ in reversed(HOT_PATH_INDEXES):
+        drop_index_concurrently(index_name, table_name)
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
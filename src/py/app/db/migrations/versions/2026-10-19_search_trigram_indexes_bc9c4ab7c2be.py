@@ -0,0 +1,90 @@
+"""search trigram indexes
+
+Revision ID: bc9c4ab7c2be
+Revises: dc54b25d8b6c
+Create Date: 2026-10-19 09:12:41.207518
+
+"""
+import warnings
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+from advanced_alchemy.types import EncryptedString, EncryptedText, GUID, ORA_JSONB, DateTimeUTC, StoredObject, PasswordHash
+from sqlalchemy import Text  # pyright: ignore  # noqa: F401
+
+from app.utils.migrations import create_index_concurrently, drop_index_concurrently
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence  # pyright: ignore
+
+__all__ = ("downgrade", "upgrade", "schema_upgrades", "schema_downgrades", "data_upgrades", "data_downgrades")
+
+sa.GUID = GUID # pyright: ignore
+sa.DateTimeUTC = DateTimeUTC  # pyright: ignore
+sa.ORA_JSONB = ORA_JSONB  # pyright: ignore
+sa.EncryptedString = EncryptedString  # pyright: ignore
+sa.EncryptedText = EncryptedText  # pyright: ignore
+sa.StoredObject = StoredObject  # pyright: ignore
+sa.PasswordHash = PasswordHash  # pyright: ignore
+
+# revision identifiers, used by Alembic.
+revision = 'bc9c4ab7c2be'
+down_revision = 'dc54b25d8b6c'
+branch_labels = None
+depends_on = None
+
+# (index, table, column) searched with ``LIKE '%term%'`` by the list endpoints.
+TRIGRAM_INDEXES = (
+    ('ix_user_account_name_trgm', 'user_account', 'name'),
+    ('ix_user_account_email_trgm', 'user_account', 'email'),
+    ('ix_team_name_trgm', 'team', 'name'),
+    ('ix_audit_log_actor_email_trgm', 'audit_log', 'actor_email'),
+    ('ix_audit_log_action_trgm', 'audit_log', 'action'),
+    ('ix_audit_log_target_label_trgm', 'audit_log', 'target_label'),
+)
+
+
+def upgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
+        with op.get_context().autocommit_block():
+            schema_upgrades()
+            data_upgrades()
+
+def downgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
+        with op.get_context().autocommit_block():
+            data_downgrades()
+            schema_downgrades()
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # Built concurrently so writes to these tables are not blocked. An INVALID index left by a
+    # failed earlier build is dropped and rebuilt.
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        create_index_concurrently(
+            index_name,
+            table_name,
+            [column_name],
+            postgresql_using='gin',
+            postgresql_ops={column_name: 'gin_trgm_ops'},
+        )
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # The pg_trgm extension is left installed: other objects may depend on it.
+    for index_name, table_name, _ in reversed(TRIGRAM_INDEXES):
+        drop_index_concurrently(index_name, table_name)
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from advanced_alchemy.base import UUIDv7AuditBase
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,7 +21,19 @@ class AuditLog(UUIDv7AuditBase):
     """
 
     __tablename__ = "audit_log"
-    __table_args__ = {"comment": "Audit trail for system events and admin actions"}
+    __table_args__ = (
+        # pg_trgm indexes behind the ``searchString`` filter; created by the search_trigram_indexes migration.
+        *(
+            Index(
+                f"ix_audit_log_{column}_trgm", column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}
+            ).ddl_if(dialect="postgresql")
+            for column in ("actor_email", "action", "target_label")
+        ),
+        Index("ix_audit_log_created_at", "created_at"),
+        # count_recent_actions: equality on actor and action, range on created_at.
+        Index("ix_audit_log_actor_id_action_created_at", "actor_id", "action", "created_at"),
+        {"comment": "Audit trail for system events and admin actions"},
+    )
 
     actor_id: Mapped[UUID | None] = mapped_column(
         ForeignKey("user_account.id", ondelete="SET NULL"),
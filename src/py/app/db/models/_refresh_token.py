@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from advanced_alchemy.base import UUIDv7AuditBase
-from sqlalchemy import ForeignKey, String, case, func
+from sqlalchemy import ForeignKey, Index, String, case, func, text
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,7 +26,15 @@ class RefreshToken(UUIDv7AuditBase):
     """
 
     __tablename__ = "refresh_token"
-    __table_args__ = {"comment": "JWT refresh tokens with rotation tracking"}
+    __table_args__ = (
+        Index(
+            "ix_refresh_token_user_id_active",
+            "user_id",
+            postgresql_where=text("revoked_at IS NULL"),
+            sqlite_where=text("revoked_at IS NULL"),
+        ),
+        {"comment": "JWT refresh tokens with rotation tracking"},
+    )
 
     user_id: Mapped[UUID] = mapped_column(
         ForeignKey("user_account.id", ondelete="CASCADE"),
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from advanced_alchemy.base import UUIDv7AuditBase
 from advanced_alchemy.mixins import SlugKey
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.models._team_tag import team_tag
@@ -45,3 +45,10 @@ class Team(UUIDv7AuditBase, SlugKey):
         cascade="all, delete",
         passive_deletes=True,
     )
+
+
+# pg_trgm index behind the ``searchString`` filter; created by the search_trigram_indexes migration.
+# Declared outside the class so ``SlugKey``'s ``__table_args__`` stay in place.
+Index("ix_team_name_trgm", Team.name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}).ddl_if(
+    dialect="postgresql"
+)
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from advanced_alchemy.base import UUIDv7AuditBase
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.models._team_roles import TeamRoles
@@ -18,6 +18,7 @@ class TeamInvitation(UUIDv7AuditBase):
     """Team Invite."""
 
     __tablename__ = "team_invitation"
+    __table_args__ = (Index("ix_team_invitation_team_id_is_accepted", "team_id", "is_accepted"),)
     team_id: Mapped[UUID] = mapped_column(ForeignKey("team.id", ondelete="cascade"))
     email: Mapped[str] = mapped_column(index=True)
     role: Mapped[TeamRoles] = mapped_column(String(length=50), default=TeamRoles.MEMBER)
@@ -21,7 +21,7 @@ class TeamMember(UUIDv7AuditBase):
     __tablename__ = "team_member"
     __table_args__ = (UniqueConstraint("user_id", "team_id"),)
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user_account.id", ondelete="cascade"), nullable=False)
-    team_id: Mapped[UUID] = mapped_column(ForeignKey("team.id", ondelete="cascade"), nullable=False)
+    team_id: Mapped[UUID] = mapped_column(ForeignKey("team.id", ondelete="cascade"), nullable=False, index=True)
     role: Mapped[TeamRoles] = mapped_column(
         String(length=50),
         default=TeamRoles.MEMBER,
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from advanced_alchemy.base import UUIDv7AuditBase
 from advanced_alchemy.types import EncryptedString
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -26,7 +26,16 @@ settings = get_settings()
 
 class User(UUIDv7AuditBase):
     __tablename__ = "user_account"
-    __table_args__ = {"comment": "User accounts for application access"}
+    __table_args__ = (
+        # pg_trgm indexes behind the ``searchString`` filter; created by the search_trigram_indexes migration.
+        Index(
+            "ix_user_account_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_user_account_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        {"comment": "User accounts for application access"},
+    )
     __pii_columns__ = {"name", "email", "username", "phone", "avatar_url", "totp_secret"}
 
     email: Mapped[str] = mapped_column(unique=True, index=True, nullable=False)
@@ -77,38 +86,38 @@ class User(UUIDv7AuditBase):
 
     roles: Mapped[list[UserRole]] = relationship(
         back_populates="user",
-        lazy="selectin",
+        lazy="raise",
         uselist=True,
         cascade="all, delete",
     )
     teams: Mapped[list[TeamMember]] = relationship(
         back_populates="user",
-        lazy="selectin",
+        lazy="raise",
         uselist=True,
         cascade="all, delete",
         viewonly=True,
     )
     oauth_accounts: Mapped[list[UserOAuthAccount]] = relationship(
         back_populates="user",
-        lazy="noload",
+        lazy="raise",
         cascade="all, delete",
         uselist=True,
     )
     verification_tokens: Mapped[list[EmailVerificationToken]] = relationship(
         back_populates="user",
-        lazy="noload",
+        lazy="raise",
         cascade="all, delete",
         uselist=True,
     )
     reset_tokens: Mapped[list[PasswordResetToken]] = relationship(
         back_populates="user",
-        lazy="noload",
+        lazy="raise",
         cascade="all, delete",
         uselist=True,
     )
     refresh_tokens: Mapped[list[RefreshToken]] = relationship(
         back_populates="user",
-        lazy="noload",
+        lazy="raise",
         cascade="all, delete-orphan",
         uselist=True,
     )
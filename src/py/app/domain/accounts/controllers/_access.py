@@ -21,6 +21,7 @@ from app.domain.accounts.deps import (
     provide_roles_service,
     provide_users_service,
 )
+from app.domain.accounts.loaders import USER_AUTH
 from app.domain.accounts.schemas import (
     AccountLogin,
     AccountRegister,
@@ -259,7 +260,7 @@ class AccessController(Controller):
             device_info=device_info,
         )
 
-        user = await users_service.get(new_token_model.user_id)
+        user = await users_service.get(new_token_model.user_id, load=USER_AUTH)
         token_extras = {
             "user_id": str(user.id),
             "is_superuser": users_service.is_superuser(user),
@@ -431,7 +432,7 @@ class AccessController(Controller):
         _, verification_token = await verification_service.create_verification_token(user_id=user.id, email=user.email)
         await app_email_service.send_verification_email(cast("UserProtocol", user), verification_token)
 
-        return users_service.to_schema(user, schema_type=User)
+        return users_service.to_schema(await users_service.get_profile(user.id), schema_type=User)
 
     @post(operation_id="ForgotPassword", path="/api/access/forgot-password", exclude_from_auth=True, security=[])
     async def forgot_password(
@@ -71,7 +71,7 @@ class EmailVerificationController(Controller):
 
         user = await users_service.verify_email(user_id=verification_token.user_id, email=verification_token.email)
 
-        return users_service.to_schema(user, schema_type=User)
+        return users_service.to_schema(await users_service.get_profile(user.id), schema_type=User)
 
     @get("/status/{user_id:uuid}")
     async def get_verification_status(
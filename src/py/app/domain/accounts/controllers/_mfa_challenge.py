@@ -14,6 +14,7 @@ from sqlalchemy.orm import undefer_group
 
 from app.domain.accounts.deps import provide_refresh_token_service, provide_users_service
 from app.domain.accounts.guards import auth
+from app.domain.accounts.loaders import USER_AUTH
 from app.domain.admin.deps import provide_audit_log_service
 from app.lib.crypt import verify_backup_code, verify_totp_code
 
@@ -164,7 +165,9 @@ class MfaChallengeController(Controller):
         return user_email, user_id
 
     async def _load_mfa_user(self, users_service: UserService, user_email: str, user_id: str) -> m.User:
-        user = await users_service.get_one_or_none(email=user_email, load=[undefer_group("security_sensitive")])
+        user = await users_service.get_one_or_none(
+            email=user_email, load=[*USER_AUTH, undefer_group("security_sensitive")]
+        )
         if not user or str(user.id) != user_id:
             raise NotAuthorizedException(detail="Invalid challenge token")
         if not user.is_two_factor_enabled or not user.totp_secret:
@@ -21,6 +21,7 @@ from app.domain.accounts.deps import provide_users_service
 from app.domain.accounts.schemas import OAuthAuthorization
 from app.domain.accounts.services import UserOAuthAccountService
 from app.lib.deps import create_service_dependencies
+from app.lib.sessions import READ_ONLY_OPT
 from app.utils.oauth import OAuth2AuthorizeCallback, build_oauth_error_redirect, create_oauth_state, verify_oauth_state
 
 if TYPE_CHECKING:
@@ -180,7 +181,7 @@ class OAuthController(Controller):
             state=state,
         )
 
-    @get("/google/callback", name="oauth:google:callback")
+    @get("/google/callback", name="oauth:google:callback", opt={READ_ONLY_OPT: False})
     async def google_callback(
         self,
         request: Request[Any, Any, Any],
@@ -323,7 +324,7 @@ class OAuthController(Controller):
             state=state,
         )
 
-    @get("/github/callback", name="oauth:github:callback")
+    @get("/github/callback", name="oauth:github:callback", opt={READ_ONLY_OPT: False})
     async def github_callback(
         self,
         request: Request[Any, Any, Any],
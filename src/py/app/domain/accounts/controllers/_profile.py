@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import structlog
-from litestar import Controller, delete, get, patch
+from litestar import Controller, Request, Response, delete, get, patch
 from litestar.di import Provide
 
 from app.domain.accounts.deps import provide_users_service
+from app.domain.accounts.loaders import USER_LOAD_OPT
 from app.domain.accounts.schemas import PasswordUpdate, ProfileUpdate, User
+from app.lib.etag import conditional_response, make_etag
 from app.lib.schema import Message
+from app.lib.sessions import READ_REPLICA_OPT
 
 if TYPE_CHECKING:
+    from litestar.security.jwt import Token
+
     from app.db import models as m
     from app.domain.accounts.services import UserService
 
@@ -32,16 +37,28 @@ class ProfileController(Controller):
         path="/api/me",
         summary="User Profile",
         description="User profile information.",
+        opt={USER_LOAD_OPT: "profile", READ_REPLICA_OPT: True},
     )
-    async def get_profile(self, users_service: UserService, current_user: m.User) -> User:
+    async def get_profile(
+        self,
+        request: Request[m.User, Token, Any],
+        users_service: UserService,
+        current_user: m.User,
+    ) -> Response[User]:
         """User profile.
 
+        Answers ``If-None-Match`` revalidations with ``304`` before serialising the profile.
+
         Returns:
             User: The current user's profile.
         """
-        return users_service.to_schema(current_user, schema_type=User)
+        return await conditional_response(
+            request,
+            make_etag(*users_service.profile_version(current_user)),
+            lambda: users_service.to_schema(current_user, schema_type=User),
+        )
 
-    @patch(operation_id="AccountProfileUpdate", path="/api/me")
+    @patch(operation_id="AccountProfileUpdate", path="/api/me", opt={USER_LOAD_OPT: "profile"})
     async def update_profile(
         self,
         current_user: m.User,
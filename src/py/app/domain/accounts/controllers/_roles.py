@@ -16,6 +16,7 @@ from app.domain.accounts.schemas import Message, Role, RoleCreate, RoleUpdate, U
 from app.domain.accounts.services import RoleService, UserRoleService, UserService
 from app.lib.constants import DEFAULT_ACCESS_ROLE, SUPERUSER_ACCESS_ROLE
 from app.lib.deps import create_service_dependencies
+from app.lib.sessions import STATEMENT_TIMEOUT_OPT
 
 if TYPE_CHECKING:
     from advanced_alchemy.filters import FilterTypes
@@ -28,6 +29,7 @@ class RoleController(Controller):
     path = "/api/roles"
     tags = ["Roles"]
     guards = [requires_superuser]
+    opt = {STATEMENT_TIMEOUT_OPT: "admin"}
     dependencies = {
         **create_service_dependencies(
             RoleService,
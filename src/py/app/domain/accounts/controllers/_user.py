@@ -8,11 +8,13 @@ from uuid import UUID
 from litestar import Controller, delete, get, patch, post
 from litestar.params import Dependency, Parameter
 
-from app.db import models as m
 from app.domain.accounts.guards import requires_superuser
+from app.domain.accounts.loaders import USER_PROFILE
 from app.domain.accounts.schemas import User, UserCreate, UserUpdate
 from app.domain.accounts.services import UserService
 from app.lib.deps import create_service_dependencies
+from app.lib.search import trigram_search_dependency
+from app.lib.sessions import STATEMENT_TIMEOUT_OPT
 
 if TYPE_CHECKING:
     from advanced_alchemy.filters import FilterTypes
@@ -25,10 +27,11 @@ class UserController(Controller):
     path = "/api/users"
     tags = ["User Accounts"]
     guards = [requires_superuser]
+    opt = {STATEMENT_TIMEOUT_OPT: "admin"}
     dependencies = create_service_dependencies(
         UserService,
         key="users_service",
-        load=[m.User.roles, m.User.teams, m.User.oauth_accounts],
+        load=USER_PROFILE,
         filters={
             "id_filter": UUID,
             "search": "name,email",
@@ -39,7 +42,7 @@ class UserController(Controller):
             "sort_field": "name",
             "sort_order": "asc",
         },
-    )
+    ) | trigram_search_dependency("name,email")
 
     @get(operation_id="ListUsers")
     async def list_users(
@@ -87,7 +90,7 @@ class UserController(Controller):
             The created user.
         """
         db_obj = await users_service.create(data.to_dict())
-        return users_service.to_schema(db_obj, schema_type=User)
+        return users_service.to_schema(await users_service.get_profile(db_obj.id), schema_type=User)
 
     @patch(operation_id="UpdateUser", path="/{user_id:uuid}")
     async def update_user(
@@ -12,7 +12,9 @@ from litestar.status_codes import HTTP_202_ACCEPTED
 
 from app.domain.accounts.deps import provide_roles_service, provide_user_roles_service, provide_users_service
 from app.domain.accounts.guards import requires_superuser
+from app.domain.accounts.loaders import USER_AUTH
 from app.lib.schema import Message
+from app.lib.sessions import STATEMENT_TIMEOUT_OPT
 
 if TYPE_CHECKING:
     from app.domain.accounts.schemas import UserRoleAdd, UserRoleRevoke
@@ -25,6 +27,7 @@ class UserRoleController(Controller):
     path = "/api/users/roles"
     tags = ["User Account Roles"]
     guards = [requires_superuser]
+    opt = {STATEMENT_TIMEOUT_OPT: "admin"}
     dependencies = {
         "users_service": Provide(provide_users_service),
         "roles_service": Provide(provide_roles_service),
@@ -81,7 +84,7 @@ class UserRoleController(Controller):
         Returns:
             Message
         """
-        user_obj = await users_service.get_one(email=data.user_name)
+        user_obj = await users_service.get_one(email=data.user_name, load=USER_AUTH)
         removed_role: bool = False
         for user_role in user_obj.roles:
             if user_role.role_slug == role_slug:
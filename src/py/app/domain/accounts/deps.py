@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy.orm import joinedload, load_only, selectinload
+from sqlalchemy.orm import selectinload
 
 from app.db import models as m
 from app.domain.accounts.services import (
@@ -18,16 +18,9 @@ from app.lib.deps import create_service_provider
 
 provide_users_service = create_service_provider(
     UserService,
-    load=[
-        selectinload(m.User.roles).options(joinedload(m.UserRole.role, innerjoin=True)),
-        selectinload(m.User.oauth_accounts),
-        selectinload(m.User.teams).options(
-            joinedload(m.TeamMember.team, innerjoin=True).options(load_only(m.Team.name)),
-        ),
-    ],
-    uniquify=True,
     error_messages={"duplicate_key": "This user already exists.", "integrity": "User operation failed."},
 )
+"""Loads bare users; pass a profile from :mod:`app.domain.accounts.loaders` where relationships are needed."""
 
 provide_email_verification_service = create_service_provider(
     EmailVerificationTokenService,
@@ -10,6 +10,7 @@ from litestar.security.jwt import OAuth2PasswordBearerAuth
 
 from app.db import models as m
 from app.domain.accounts import deps
+from app.domain.accounts.loaders import USER_LOAD_OPT, USER_LOAD_PROFILES
 from app.lib import constants
 from app.lib.deps import provide_services
 from app.lib.settings import get_settings
@@ -95,7 +96,8 @@ def requires_superuser(connection: ASGIConnection[Any, m.User, Token, Any], _: B
 async def current_user_from_token(token: Token, connection: ASGIConnection[Any, Any, Any, Any]) -> m.User | None:
     """Lookup current user from local JWT token.
 
-    Fetches the user information from the database
+    Fetches the user information from the database, with the loader profile named by the route
+    handler's ``opt`` (``USER_AUTH`` by default).
 
     Args:
         token (str): JWT Token Object
@@ -104,8 +106,9 @@ async def current_user_from_token(token: Token, connection: ASGIConnection[Any,
     Returns:
         User: User record mapped to the JWT identifier
     """
+    profile = connection.route_handler.opt.get(USER_LOAD_OPT, "auth")
     async with provide_services(deps.provide_users_service, connection=connection) as (service,):
-        user = await service.get_one_or_none(email=token.sub)
+        user = await service.get_one_or_none(email=token.sub, load=USER_LOAD_PROFILES[profile])
         return user if user and user.is_active else None
 
 
@@ -0,0 +1,68 @@
+"""Named loader profiles for user queries.
+
+``User``'s relationships are ``raise`` by default, so a plain user query issues one statement and
+reading a relationship it did not load fails instead of issuing more. Callers that need
+relationships ask for a profile, either per call
+(``users_service.get(user_id, load=USER_PROFILE)``) or per provider
+(``create_service_dependencies(UserService, load=USER_PROFILE)``).
+
+The authenticated user is loaded with ``USER_AUTH`` unless the route handler asks for another
+profile through its ``opt``::
+
+    @get("/api/me", opt={USER_LOAD_OPT: "profile"})
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, Literal
+
+from sqlalchemy.orm import joinedload, lazyload, load_only, raiseload, selectinload, undefer, undefer_group
+
+from app.db import models as m
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm.strategy_options import _AbstractLoad  # pyright: ignore[reportPrivateUsage]
+
+__all__ = (
+    "USER_ADMIN_DETAIL",
+    "USER_AUTH",
+    "USER_LOAD_OPT",
+    "USER_LOAD_PROFILES",
+    "USER_MINIMAL",
+    "USER_PROFILE",
+    "UserLoadProfile",
+)
+
+UserLoadProfile = Literal["minimal", "auth", "profile", "admin-detail"]
+
+USER_LOAD_OPT: Final = "user_load"
+"""Route handler ``opt`` key naming the profile used to load the authenticated user."""
+
+_ROLES = selectinload(m.User.roles).options(
+    joinedload(m.UserRole.role, innerjoin=True),
+    lazyload(m.UserRole.user),
+)
+_TEAMS = selectinload(m.User.teams).options(
+    joinedload(m.TeamMember.team, innerjoin=True).options(load_only(m.Team.name, m.Team.updated_at), raiseload("*")),
+    lazyload(m.TeamMember.user),
+)
+
+USER_MINIMAL: Final[tuple[_AbstractLoad, ...]] = ()
+"""Columns only, for lookups and single-field updates."""
+USER_AUTH: Final[tuple[_AbstractLoad, ...]] = (_ROLES, _TEAMS)
+"""Role and team memberships, everything the guards and token claims read."""
+USER_PROFILE: Final[tuple[_AbstractLoad, ...]] = (
+    *USER_AUTH,
+    selectinload(m.User.oauth_accounts),
+    undefer(m.User.hashed_password),
+)
+"""Everything the ``User`` response schema serialises."""
+USER_ADMIN_DETAIL: Final[tuple[_AbstractLoad, ...]] = (*USER_PROFILE, undefer_group("security_sensitive"))
+"""The profile plus the deferred security columns shown on the admin user page."""
+
+USER_LOAD_PROFILES: Final[dict[UserLoadProfile, tuple[_AbstractLoad, ...]]] = {
+    "minimal": USER_MINIMAL,
+    "auth": USER_AUTH,
+    "profile": USER_PROFILE,
+    "admin-detail": USER_ADMIN_DETAIL,
+}
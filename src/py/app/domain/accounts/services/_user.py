@@ -8,8 +8,10 @@ from litestar.exceptions import ClientException, PermissionDeniedException
 from sqlalchemy.orm import undefer_group
 
 from app.db import models as m
+from app.domain.accounts.loaders import USER_AUTH, USER_PROFILE
 from app.lib import constants, crypt
 from app.lib.deps import CompositeServiceMixin
+from app.lib.projection import ProjectionServiceMixin
 from app.lib.validation import PasswordValidationError, validate_password_strength
 
 MAX_FAILED_RESET_ATTEMPTS = 5
@@ -22,7 +24,7 @@ if TYPE_CHECKING:
     from app.domain.accounts.services._user_oauth_account import UserOAuthAccountService
 
 
-class UserService(CompositeServiceMixin, service.SQLAlchemyAsyncRepositoryService[m.User]):
+class UserService(CompositeServiceMixin, ProjectionServiceMixin, service.SQLAlchemyAsyncRepositoryService[m.User]):
     """Handles database operations for users."""
 
     class Repo(repository.SQLAlchemyAsyncRepository[m.User]):
@@ -54,12 +56,12 @@ class UserService(CompositeServiceMixin, service.SQLAlchemyAsyncRepositoryServic
         """Authenticate a user against the stored hashed password.
 
         Returns:
-            The user object if authentication is successful.
+            The user object, loaded with ``USER_AUTH``, if authentication is successful.
 
         Raises:
             PermissionDeniedException: If the user is not found, the password is invalid, or the account is inactive.
         """
-        db_obj = await self.get_one_or_none(email=username, load=[undefer_group("security_sensitive")])
+        db_obj = await self.get_one_or_none(email=username, load=[*USER_AUTH, undefer_group("security_sensitive")])
         if db_obj is None:
             msg = "User not found or password invalid"
             raise PermissionDeniedException(detail=msg)
@@ -74,6 +76,17 @@ class UserService(CompositeServiceMixin, service.SQLAlchemyAsyncRepositoryServic
             raise PermissionDeniedException(detail=msg)
         return db_obj
 
+    async def get_profile(self, user_id: UUID) -> m.User:
+        """Load a user with ``USER_PROFILE``, replacing any copy already in the session.
+
+        Args:
+            user_id: The user's UUID
+
+        Returns:
+            The user, ready to serialise as the ``User`` schema
+        """
+        return await self.get(user_id, load=USER_PROFILE, execution_options={"populate_existing": True})
+
     async def verify_email(self, user_id: UUID, email: str) -> m.User:
         """Mark user's email as verified.
 
@@ -156,6 +169,23 @@ class UserService(CompositeServiceMixin, service.SQLAlchemyAsyncRepositoryServic
         """Return true if user has specified role ID"""
         return any(assigned_role.role_id for assigned_role in db_obj.roles if assigned_role.role_name == role_name)
 
+    @staticmethod
+    def profile_version(db_obj: m.User) -> tuple[Any, ...]:
+        """Return the values that version a user's profile.
+
+        Reads only relationships loaded by ``USER_PROFILE``, so no query is issued.
+        """
+        return (
+            db_obj.id,
+            db_obj.updated_at,
+            *(
+                (assigned_role.id, assigned_role.updated_at, assigned_role.role.updated_at)
+                for assigned_role in db_obj.roles
+            ),
+            *((membership.id, membership.updated_at, membership.team.updated_at) for membership in db_obj.teams),
+            *((account.id, account.updated_at) for account in db_obj.oauth_accounts),
+        )
+
     @staticmethod
     def is_superuser(user: m.User) -> bool:
         return bool(
@@ -322,7 +352,7 @@ class UserService(CompositeServiceMixin, service.SQLAlchemyAsyncRepositoryServic
             Tuple of (user, is_new_user)
         """
         email = oauth_data.get("email", "")
-        existing_user = await self.get_one_or_none(email=email) if email else None
+        existing_user = await self.get_one_or_none(email=email, load=USER_AUTH) if email else None
 
         if existing_user:
             await self.oauth_accounts.create_or_update_oauth_account(
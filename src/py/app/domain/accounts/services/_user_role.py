@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, cast
+
 from advanced_alchemy.extensions.litestar import repository, service
+from sqlalchemy import exists, func, insert, literal, select
 
 from app.db import models as m
 
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy import ColumnElement, CursorResult
+
 
 class UserRoleService(service.SQLAlchemyAsyncRepositoryService[m.UserRole]):
     """Handles database operations for user roles."""
@@ -14,3 +22,55 @@ class UserRoleService(service.SQLAlchemyAsyncRepositoryService[m.UserRole]):
         model_type = m.UserRole
 
     repository_type = Repo
+
+    async def assign_role_to_active_users(self, role_id: UUID, *, chunk_size: int = 10_000) -> int:
+        """Give every active user without ``role_id`` that role, set-based.
+
+        Users are walked in primary-key windows of ``chunk_size`` and each window is one
+        ``INSERT ... SELECT ... WHERE NOT EXISTS`` committed on its own, so huge tables never
+        hold one long transaction or round-trip per user.
+
+        Args:
+            role_id: The role to assign.
+            chunk_size: Users per window.
+
+        Returns:
+            The number of role assignments created.
+        """
+        session = self.repository.session
+        now = func.now()
+        assigned = 0
+        lower: UUID | None = None
+        while True:
+            boundary = select(m.User.id).order_by(m.User.id).offset(chunk_size - 1).limit(1)
+            window: list[ColumnElement[bool]] = [m.User.is_active.is_(True)]
+            if lower is not None:
+                boundary = boundary.where(m.User.id > lower)
+                window.append(m.User.id > lower)
+            upper = await session.scalar(boundary)
+            if upper is not None:
+                window.append(m.User.id <= upper)
+            missing = select(
+                func.gen_random_uuid(type_=m.UserRole.id.type),
+                m.User.id,
+                literal(role_id, m.UserRole.role_id.type),
+                now,
+                now,
+                now,
+            ).where(
+                *window,
+                ~exists().where(m.UserRole.user_id == m.User.id, m.UserRole.role_id == role_id),
+            )
+            result = cast(
+                "CursorResult[Any]",
+                await session.execute(
+                    insert(m.UserRole).from_select(
+                        ["id", "user_id", "role_id", "assigned_at", "created_at", "updated_at"], missing
+                    )
+                ),
+            )
+            await session.commit()
+            assigned += result.rowcount
+            if upper is None:
+                return assigned
+            lower = upper
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from contextlib import aclosing
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Annotated, Any, cast
 from uuid import UUID
 
@@ -10,12 +12,16 @@ from litestar.params import Dependency, Parameter
 
 from app.db import models as m
 from app.domain.accounts.guards import requires_superuser
+from app.domain.admin.deps import provide_audit_log_service
 from app.domain.admin.schemas import AuditLogEntry
 from app.domain.admin.services import AuditLogService
-from app.lib.deps import create_service_dependencies
+from app.lib.deps import create_service_dependencies, provide_services
+from app.lib.export import EXPORT_MEDIA_TYPES, ExportFormat, ExportStream, encode_export
+from app.lib.search import trigram_search_dependency
+from app.lib.sessions import READ_REPLICA_OPT, STATEMENT_TIMEOUT_OPT
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from collections.abc import AsyncGenerator
 
     from advanced_alchemy.extensions.litestar.providers import FilterConfig
     from advanced_alchemy.filters import FilterTypes
@@ -28,6 +34,7 @@ class AuditController(Controller):
     tags = ["Admin"]
     path = "/api/admin/audit"
     guards = [requires_superuser]
+    opt = {READ_REPLICA_OPT: True, STATEMENT_TIMEOUT_OPT: "admin"}
     dependencies = create_service_dependencies(
         AuditLogService,
         key="audit_service",
@@ -49,7 +56,7 @@ class AuditController(Controller):
                 "sort_order": "desc",
             },
         ),
-    )
+    ) | trigram_search_dependency("actor_email,action,target_label")
 
     @get(operation_id="AdminListAuditLogs", path="/")
     async def list_logs(
@@ -83,6 +90,52 @@ class AuditController(Controller):
             schema_type=AuditLogEntry,
         )
 
+    @get(operation_id="AdminExportAuditLogs", path="/export")
+    async def export_logs(
+        self,
+        filters: Annotated[list[FilterTypes], Dependency(skip_validation=True)],
+        export_format: ExportFormat = Parameter(query="format", default="ndjson"),  # noqa: B008
+        action: str | None = Parameter(query="action", required=False),
+        end_date: datetime | None = Parameter(query="end_date", required=False),  # noqa: B008
+    ) -> ExportStream:
+        """Export every audit log matching the list filters as NDJSON or CSV.
+
+        Pagination parameters are ignored; rows are streamed over a server-side cursor so
+        memory stays flat regardless of the size of the export. The stream has its own session,
+        closed when the response ends or the client disconnects.
+
+        Args:
+            filters: Filter and sort parameters, as for the list endpoint
+            export_format: ``ndjson`` (default) or ``csv``
+            action: Optional action filter
+            end_date: Optional upper bound for created_at
+
+        Returns:
+            Streamed export response
+        """
+        conditions: list[Any] = []
+        if action:
+            conditions.append(m.AuditLog.action == action)
+        if end_date:
+            conditions.append(m.AuditLog.created_at <= end_date)
+
+        async def _chunks() -> AsyncGenerator[list[AuditLogEntry], None]:
+            # The request session is released once the handler returns, before the body
+            # is sent, so the cursor needs a session that lives as long as the stream.
+            async with (
+                provide_services(provide_audit_log_service) as (audit_service,),
+                aclosing(audit_service.stream_as(AuditLogEntry, *filters, *conditions)) as chunks,
+            ):
+                async for chunk in chunks:
+                    yield chunk
+
+        filename = f"audit-log-{datetime.now(UTC):%Y%m%dT%H%M%SZ}.{export_format}"
+        return ExportStream(
+            encode_export(export_format, AuditLogEntry, _chunks()),
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
     @get(operation_id="AdminGetAuditLog", path="/{log_id:uuid}")
     async def get_log(
         self,
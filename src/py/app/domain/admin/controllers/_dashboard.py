@@ -14,6 +14,9 @@ from app.domain.accounts.guards import requires_superuser
 from app.domain.admin.deps import provide_audit_log_service
 from app.domain.admin.schemas import ActivityLogEntry, DashboardStats, RecentActivity
 from app.domain.teams.deps import provide_teams_service
+from app.lib.cache import DASHBOARD_CACHE_TAG, cached
+from app.lib.sessions import READ_REPLICA_OPT, STATEMENT_TIMEOUT_OPT
+from app.lib.settings import get_settings
 
 if TYPE_CHECKING:
     from litestar import Request
@@ -23,6 +26,8 @@ if TYPE_CHECKING:
     from app.domain.admin.services import AuditLogService
     from app.domain.teams.services import TeamService
 
+settings = get_settings()
+
 
 class DashboardController(Controller):
     """Admin dashboard endpoints for system statistics and activity monitoring."""
@@ -30,6 +35,7 @@ class DashboardController(Controller):
     tags = ["Admin"]
     path = "/api/admin/dashboard"
     guards = [requires_superuser]
+    opt = {READ_REPLICA_OPT: True, STATEMENT_TIMEOUT_OPT: "admin"}
     dependencies = {
         "users_service": Provide(provide_users_service),
         "teams_service": Provide(provide_teams_service),
@@ -37,6 +43,7 @@ class DashboardController(Controller):
     }
 
     @get(operation_id="GetDashboardStats", path="/stats")
+    @cached(DASHBOARD_CACHE_TAG, ttl=settings.cache.DASHBOARD_TTL)
     async def get_stats(
         self,
         request: Request[m.User, Token, Any],
@@ -46,6 +53,8 @@ class DashboardController(Controller):
     ) -> DashboardStats:
         """Get system statistics for admin dashboard.
 
+        Responses are shared between admins and cached until the next audit log write.
+
         Args:
             request: Request with authenticated superuser
             users_service: User service
@@ -81,6 +90,7 @@ class DashboardController(Controller):
         )
 
     @get(operation_id="GetRecentActivity", path="/activity")
+    @cached(DASHBOARD_CACHE_TAG, ttl=settings.cache.DASHBOARD_TTL)
     async def get_activity(
         self,
         request: Request[m.User, Token, Any],
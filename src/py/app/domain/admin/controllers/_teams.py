@@ -17,6 +17,8 @@ from app.domain.admin.schemas import AdminTeamDetail, AdminTeamSummary, AdminTea
 from app.domain.teams.services import TeamService
 from app.lib.deps import create_service_dependencies
 from app.lib.schema import Message
+from app.lib.search import trigram_search_dependency
+from app.lib.sessions import READ_REPLICA_OPT, STATEMENT_TIMEOUT_OPT
 
 if TYPE_CHECKING:
     from advanced_alchemy.filters import FilterTypes
@@ -33,26 +35,31 @@ class AdminTeamsController(Controller):
     tags = ["Admin"]
     path = "/api/admin/teams"
     guards = [requires_superuser]
-    dependencies = create_service_dependencies(
-        TeamService,
-        key="teams_service",
-        load=[selectinload(m.Team.members).options(joinedload(m.TeamMember.user, innerjoin=True))],
-        error_messages={"duplicate_key": "This team already exists.", "integrity": "Team operation failed."},
-        filters={
-            "id_filter": UUID,
-            "search": "name",
-            "pagination_type": "limit_offset",
-            "pagination_size": 25,
-            "created_at": True,
-            "updated_at": True,
-            "sort_field": "created_at",
-            "sort_order": "desc",
-        },
-    ) | {
-        "audit_service": Provide(provide_audit_log_service),
-    }
-
-    @get(operation_id="AdminListTeams", path="/")
+    opt = {STATEMENT_TIMEOUT_OPT: "admin"}
+    dependencies = (
+        create_service_dependencies(
+            TeamService,
+            key="teams_service",
+            load=[selectinload(m.Team.members).options(joinedload(m.TeamMember.user, innerjoin=True))],
+            error_messages={"duplicate_key": "This team already exists.", "integrity": "Team operation failed."},
+            filters={
+                "id_filter": UUID,
+                "search": "name",
+                "pagination_type": "limit_offset",
+                "pagination_size": 25,
+                "created_at": True,
+                "updated_at": True,
+                "sort_field": "created_at",
+                "sort_order": "desc",
+            },
+        )
+        | trigram_search_dependency("name")
+        | {
+            "audit_service": Provide(provide_audit_log_service),
+        }
+    )
+
+    @get(operation_id="AdminListTeams", path="/", opt={READ_REPLICA_OPT: True})
     async def list_teams(
         self,
         request: Request[m.User, Token, Any],
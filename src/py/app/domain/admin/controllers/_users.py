@@ -8,15 +8,16 @@ from uuid import UUID
 from litestar import Controller, delete, get, patch
 from litestar.di import Provide
 from litestar.params import Dependency
-from sqlalchemy.orm import joinedload, load_only, selectinload, undefer_group
 
-from app.db import models as m
 from app.domain.accounts.guards import requires_superuser
+from app.domain.accounts.loaders import USER_ADMIN_DETAIL
 from app.domain.accounts.services import UserService
 from app.domain.admin.deps import provide_audit_log_service
 from app.domain.admin.schemas import AdminUserDetail, AdminUserSummary, AdminUserUpdate
 from app.lib.deps import create_service_dependencies
 from app.lib.schema import Message
+from app.lib.search import trigram_search_dependency
+from app.lib.sessions import READ_REPLICA_OPT, STATEMENT_TIMEOUT_OPT
 
 if TYPE_CHECKING:
     from advanced_alchemy.filters import FilterTypes
@@ -24,6 +25,7 @@ if TYPE_CHECKING:
     from litestar import Request
     from litestar.security.jwt import Token
 
+    from app.db import models as m
     from app.domain.admin.services import AuditLogService
 
 
@@ -33,33 +35,30 @@ class AdminUsersController(Controller):
     tags = ["Admin"]
     path = "/api/admin/users"
     guards = [requires_superuser]
-    dependencies = create_service_dependencies(
-        UserService,
-        key="users_service",
-        load=[
-            selectinload(m.User.roles).options(joinedload(m.UserRole.role, innerjoin=True)),
-            selectinload(m.User.oauth_accounts),
-            selectinload(m.User.teams).options(
-                joinedload(m.TeamMember.team, innerjoin=True).options(load_only(m.Team.name)),
-            ),
-        ],
-        uniquify=True,
-        error_messages={"duplicate_key": "This user already exists.", "integrity": "User operation failed."},
-        filters={
-            "id_filter": UUID,
-            "search": "name,email",
-            "pagination_type": "limit_offset",
-            "pagination_size": 25,
-            "created_at": True,
-            "updated_at": True,
-            "sort_field": "created_at",
-            "sort_order": "desc",
-        },
-    ) | {
-        "audit_service": Provide(provide_audit_log_service),
-    }
-
-    @get(operation_id="AdminListUsers", path="/")
+    opt = {STATEMENT_TIMEOUT_OPT: "admin"}
+    dependencies = (
+        create_service_dependencies(
+            UserService,
+            key="users_service",
+            error_messages={"duplicate_key": "This user already exists.", "integrity": "User operation failed."},
+            filters={
+                "id_filter": UUID,
+                "search": "name,email",
+                "pagination_type": "limit_offset",
+                "pagination_size": 25,
+                "created_at": True,
+                "updated_at": True,
+                "sort_field": "created_at",
+                "sort_order": "desc",
+            },
+        )
+        | trigram_search_dependency("name,email")
+        | {
+            "audit_service": Provide(provide_audit_log_service),
+        }
+    )
+
+    @get(operation_id="AdminListUsers", path="/", opt={READ_REPLICA_OPT: True})
     async def list_users(
         self,
         request: Request[m.User, Token, Any],
@@ -76,13 +75,8 @@ class AdminUsersController(Controller):
         Returns:
             Paginated user list
         """
-        results, total = await users_service.list_and_count(*filters)
-        return users_service.to_schema(
-            data=results,
-            total=total,
-            filters=filters,
-            schema_type=AdminUserSummary,
-        )
+        results, total = await users_service.list_and_count_as(AdminUserSummary, *filters)
+        return users_service.to_schema(results, total, filters)  # type: ignore[type-var]
 
     @get(operation_id="AdminGetUser", path="/{user_id:uuid}")
     async def get_user(
@@ -101,30 +95,8 @@ class AdminUsersController(Controller):
         Returns:
             Detailed user information
         """
-        user = await users_service.get(user_id, load=[undefer_group("security_sensitive")])
-
-        return users_service.to_schema(
-            data={
-                "id": user.id,
-                "email": user.email,
-                "name": user.name,
-                "username": user.username,
-                "phone": user.phone,
-                "is_active": user.is_active,
-                "is_superuser": user.is_superuser,
-                "is_verified": user.is_verified,
-                "verified_at": user.verified_at,
-                "joined_at": user.joined_at,
-                "login_count": user.login_count,
-                "is_two_factor_enabled": user.is_two_factor_enabled,
-                "has_password": user.hashed_password is not None,
-                "roles": [r.role.name for r in user.roles if r.role] if user.roles else [],
-                "teams": [t.team.name for t in user.teams if t.team] if user.teams else [],
-                "oauth_providers": [a.oauth_name for a in user.oauth_accounts] if user.oauth_accounts else [],
-                "created_at": user.created_at,
-                "updated_at": user.updated_at,
-            },
-            schema_type=AdminUserDetail,
+        return _to_detail(
+            await users_service.get(user_id, load=USER_ADMIN_DETAIL, execution_options={"populate_existing": True})
         )
 
     @patch(operation_id="AdminUpdateUser", path="/{user_id:uuid}")
@@ -156,7 +128,8 @@ class AdminUsersController(Controller):
             if value is not msgspec.UNSET:
                 update_data[field] = value
 
-        user = await users_service.update(item_id=user_id, data=update_data, auto_commit=True)
+        await users_service.update(item_id=user_id, data=update_data, auto_commit=True)
+        user = await users_service.get(user_id, load=USER_ADMIN_DETAIL, execution_options={"populate_existing": True})
 
         await audit_service.log_admin_user_update(
             actor_id=request.user.id,
@@ -167,29 +140,7 @@ class AdminUsersController(Controller):
             request=request,
         )
 
-        return users_service.to_schema(
-            data={
-                "id": user.id,
-                "email": user.email,
-                "name": user.name,
-                "username": user.username,
-                "phone": user.phone,
-                "is_active": user.is_active,
-                "is_superuser": user.is_superuser,
-                "is_verified": user.is_verified,
-                "verified_at": user.verified_at,
-                "joined_at": user.joined_at,
-                "login_count": user.login_count,
-                "is_two_factor_enabled": user.is_two_factor_enabled,
-                "has_password": user.hashed_password is not None,
-                "roles": [r.role.name for r in user.roles if r.role] if user.roles else [],
-                "teams": [t.team.name for t in user.teams if t.team] if user.teams else [],
-                "oauth_providers": [a.oauth_name for a in user.oauth_accounts] if user.oauth_accounts else [],
-                "created_at": user.created_at,
-                "updated_at": user.updated_at,
-            },
-            schema_type=AdminUserDetail,
-        )
+        return _to_detail(user)
 
     @delete(operation_id="AdminDeleteUser", path="/{user_id:uuid}", status_code=200)
     async def delete_user(
@@ -232,3 +183,27 @@ class AdminUsersController(Controller):
         )
 
         return Message(message=f"User {user_email} deleted successfully")
+
+
+def _to_detail(user: m.User) -> AdminUserDetail:
+    """Build the admin detail view of a user loaded with ``USER_ADMIN_DETAIL``."""
+    return AdminUserDetail(
+        id=user.id,
+        email=user.email,
+        name=user.name,
+        username=user.username,
+        phone=user.phone,
+        is_active=user.is_active,
+        is_superuser=user.is_superuser,
+        is_verified=user.is_verified,
+        verified_at=user.verified_at,
+        joined_at=user.joined_at,
+        login_count=user.login_count,
+        is_two_factor_enabled=user.is_two_factor_enabled,
+        has_password=user.hashed_password is not None,
+        roles=[assigned_role.role.name for assigned_role in user.roles],
+        teams=[membership.team.name for membership in user.teams],
+        oauth_providers=[account.oauth_name for account in user.oauth_accounts],
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 from advanced_alchemy.extensions.litestar import repository, service
 
 from app.db import models as m
+from app.lib.cache import DASHBOARD_CACHE_TAG, invalidate_on_commit
+from app.lib.projection import ProjectionServiceMixin
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -15,7 +17,7 @@ if TYPE_CHECKING:
     from litestar import Request
 
 
-class AuditLogService(service.SQLAlchemyAsyncRepositoryService[m.AuditLog]):
+class AuditLogService(ProjectionServiceMixin, service.SQLAlchemyAsyncRepositoryService[m.AuditLog]):
     """Service for audit log operations."""
 
     class Repo(repository.SQLAlchemyAsyncRepository[m.AuditLog]):
@@ -62,7 +64,7 @@ class AuditLogService(service.SQLAlchemyAsyncRepositoryService[m.AuditLog]):
             if user_agent is None:
                 user_agent = request.headers.get("user-agent")
 
-        return await self.create(
+        db_obj = await self.create(
             {
                 "action": action,
                 "actor_id": actor_id,
@@ -75,6 +77,9 @@ class AuditLogService(service.SQLAlchemyAsyncRepositoryService[m.AuditLog]):
                 "user_agent": user_agent,
             }
         )
+        # Every audited write can move the dashboard's numbers, once it is committed.
+        invalidate_on_commit(self.repository.session, DASHBOARD_CACHE_TAG)
+        return db_obj
 
     async def count_recent_actions(
         self,
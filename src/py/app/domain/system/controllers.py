@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 import structlog
-from litestar import Controller, MediaType, get
+from litestar import Controller, MediaType, Request, get
 from litestar.response import Response
 from sqlalchemy import text
 
 from app.domain.system import schemas as s
+from app.domain.system.guards import requires_metrics_token
+from app.lib.etag import PUBLIC_REVALIDATE, conditional_response, make_etag
+from app.lib.metrics import CONTENT_TYPE, REGISTRY
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -81,13 +84,43 @@ class SystemController(Controller):
         exclude_from_auth=True,
         security=[],  # Public endpoint - no auth required
     )
-    async def get_oauth_config(self, settings: AppSettings) -> s.OAuthConfig:
+    async def get_oauth_config(self, request: Request[Any, Any, Any], settings: AppSettings) -> Response[s.OAuthConfig]:
         """Get OAuth provider configuration for frontend.
 
         Args:
+            request: The current request.
             settings: Application settings.
 
         Returns:
             OAuth configuration indicating which providers are enabled.
         """
-        return s.OAuthConfig(google_enabled=settings.google_oauth_enabled, github_enabled=settings.github_oauth_enabled)
+        config = s.OAuthConfig(
+            google_enabled=settings.google_oauth_enabled, github_enabled=settings.github_oauth_enabled
+        )
+        return await conditional_response(
+            request,
+            make_etag(config.google_enabled, config.github_enabled),
+            lambda: config,
+            cache_control=PUBLIC_REVALIDATE,
+        )
+
+
+class MetricsController(Controller):
+    """Prometheus metrics, registered when ``METRICS_ENABLED`` is set."""
+
+    include_in_schema = False
+
+    @get(
+        operation_id="Metrics",
+        name="system:metrics",
+        path="/metrics",
+        exclude_from_auth=True,
+        guards=[requires_metrics_token],
+    )
+    async def get_metrics(self) -> Response[str]:
+        """Render this process's metrics in the Prometheus text format.
+
+        Returns:
+            The exposition text.
+        """
+        return Response(content=await REGISTRY.collect(), media_type=CONTENT_TYPE)
@@ -0,0 +1,33 @@
+"""System domain guards."""
+
+from __future__ import annotations
+
+import secrets
+from typing import TYPE_CHECKING, Any
+
+from litestar.exceptions import NotAuthorizedException
+
+from app.lib.settings import get_settings
+
+if TYPE_CHECKING:
+    from litestar.connection import ASGIConnection
+    from litestar.handlers.base import BaseRouteHandler
+
+
+def requires_metrics_token(connection: ASGIConnection[Any, Any, Any, Any], _: BaseRouteHandler) -> None:
+    """Verify the scraper sent the configured ``METRICS_TOKEN`` as a bearer token.
+
+    Args:
+        connection (ASGIConnection): Request/Connection object.
+        _ (BaseRouteHandler): Route handler.
+
+    Raises:
+        NotAuthorizedException: The token is missing or wrong.
+    """
+    token = get_settings().metrics.TOKEN
+    if not token:
+        return
+    scheme, _sep, credentials = connection.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and secrets.compare_digest(credentials.encode(), token.encode()):
+        return
+    raise NotAuthorizedException(detail="Invalid metrics token")
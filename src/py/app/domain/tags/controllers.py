@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
-from litestar import Controller, delete, get, patch, post
+from litestar import Controller, Request, Response, delete, get, patch, post
 from litestar.params import Dependency, Parameter
 
 from app.db import models as m
@@ -13,10 +13,12 @@ from app.domain.accounts.guards import requires_active_user, requires_superuser
 from app.domain.tags import schemas as s
 from app.domain.tags.services import TagService
 from app.lib.deps import create_service_dependencies
+from app.lib.etag import conditional_response, make_etag
 
 if TYPE_CHECKING:
     from advanced_alchemy.filters import FilterTypes
     from advanced_alchemy.service import OffsetPagination
+    from litestar.security.jwt import Token
 
 
 class TagController(Controller):
@@ -43,20 +45,30 @@ class TagController(Controller):
     @get(operation_id="ListTags")
     async def list_tags(
         self,
+        request: Request[m.User, Token, Any],
         tags_service: TagService,
         filters: Annotated[list[FilterTypes], Dependency(skip_validation=True)],
-    ) -> OffsetPagination[s.Tag]:
+    ) -> Response[OffsetPagination[s.Tag]]:
         """List tags.
 
+        The ETag covers the whole tag collection plus the query string, so a revalidation costs one
+        aggregate query instead of the page query, count and serialisation.
+
         Args:
+            request: The current request.
             filters: The filters to apply to the list of tags.
             tags_service: The tag service.
 
         Returns:
             The list of tags.
         """
-        results, total = await tags_service.list_and_count(*filters)
-        return tags_service.to_schema(data=results, total=total, filters=filters, schema_type=s.Tag)
+
+        async def list_page() -> OffsetPagination[s.Tag]:
+            results, total = await tags_service.list_and_count(*filters)
+            return tags_service.to_schema(data=results, total=total, filters=filters, schema_type=s.Tag)
+
+        etag = make_etag(request.url.query, *await tags_service.get_version())
+        return await conditional_response(request, etag, list_page)
 
     @get(operation_id="GetTag", path="/{tag_id:uuid}")
     async def get_tag(
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from typing import Any
+
 from advanced_alchemy import repository, service
+from sqlalchemy import func, select
 
 from app.db import models as m
 
@@ -33,3 +36,11 @@ class TagService(service.SQLAlchemyAsyncRepositoryService[m.Tag]):
         if service.is_dict_without_field(data, "slug") and (tag_name := data.get("name")) is not None:
             data["slug"] = await self.repository.get_available_slug(tag_name)
         return data
+
+    async def get_version(self) -> tuple[Any, ...]:
+        """Return the values that version the tag collection.
+
+        Creates and renames move ``max(updated_at)``; deletes change the count.
+        """
+        row = (await self.repository.session.execute(select(func.count(), func.max(m.Tag.updated_at)))).one()
+        return tuple(row)
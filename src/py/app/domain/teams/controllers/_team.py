@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
-from litestar import Controller, delete, get, patch, post
+from litestar import Controller, Request, Response, delete, get, patch, post
+from litestar.exceptions import NotFoundException
 from litestar.params import Dependency, Parameter
 from sqlalchemy import select
 
@@ -14,10 +15,14 @@ from app.domain.teams.guards import requires_team_admin, requires_team_membershi
 from app.domain.teams.schemas import Team, TeamCreate, TeamUpdate
 from app.domain.teams.services import TeamService
 from app.lib.deps import create_service_dependencies
+from app.lib.etag import conditional_response, make_etag
+from app.lib.search import trigram_search_dependency
+from app.lib.sessions import READ_REPLICA_OPT
 
 if TYPE_CHECKING:
     from advanced_alchemy.filters import FilterTypes
     from advanced_alchemy.service.pagination import OffsetPagination
+    from litestar.security.jwt import Token
 
 
 class TeamController(Controller):
@@ -38,9 +43,9 @@ class TeamController(Controller):
             "sort_field": "name",
             "sort_order": "asc",
         },
-    )
+    ) | trigram_search_dependency("name")
 
-    @get(component="team/list", operation_id="ListTeams", path="/api/teams")
+    @get(component="team/list", operation_id="ListTeams", path="/api/teams", opt={READ_REPLICA_OPT: True})
     async def list_teams(
         self,
         teams_service: TeamService,
@@ -88,20 +93,34 @@ class TeamController(Controller):
     @get(operation_id="GetTeam", path="/api/teams/{team_id:uuid}", guards=[requires_team_membership])
     async def get_team(
         self,
+        request: Request[m.User, Token, Any],
         teams_service: TeamService,
         team_id: Annotated[UUID, Parameter(title="Team ID", description="The team to retrieve.")],
-    ) -> Team:
+    ) -> Response[Team]:
         """Get details about a team.
 
+        A version probe answers ``If-None-Match`` revalidations without loading the team.
+
         Args:
+            request: The current request.
             teams_service: Team Service
             team_id: Team ID
 
+        Raises:
+            NotFoundException: If the team does not exist.
+
         Returns:
             Team
         """
-        db_obj = await teams_service.get(team_id)
-        return teams_service.to_schema(db_obj, schema_type=Team)
+        version = await teams_service.get_version(team_id)
+        if version is None:
+            raise NotFoundException(detail="Team not found")
+
+        async def load_team() -> Team:
+            db_obj = await teams_service.get(team_id)
+            return teams_service.to_schema(db_obj, schema_type=Team)
+
+        return await conditional_response(request, make_etag(*version), load_team)
 
     @patch(operation_id="UpdateTeam", path="/api/teams/{team_id:uuid}", guards=[requires_team_admin])
     async def update_team(
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from advanced_alchemy.exceptions import RepositoryError
 from advanced_alchemy.extensions.litestar import repository, service
+from sqlalchemy import func, select
 
 from app.db import models as m
 from app.lib import constants
@@ -50,6 +52,35 @@ class TeamService(CompositeServiceMixin, service.SQLAlchemyAsyncRepositoryServic
         data = await self._populate_slug(data)
         return await self._populate_with_owner_and_tags(data, "upsert")
 
+    async def get_version(self, team_id: UUID) -> tuple[Any, ...] | None:
+        """Return the values that version a team's detail view, or ``None`` if it does not exist.
+
+        A single aggregate query over the team, its members (and their users) and its tags, so a
+        conditional GET can be answered without loading and serialising the team.
+        """
+        members = (
+            select(m.TeamMember.updated_at, m.User.updated_at.label("user_updated_at"))
+            .join(m.User, m.User.id == m.TeamMember.user_id)
+            .where(m.TeamMember.team_id == team_id)
+            .subquery()
+        )
+        tags = (
+            select(m.Tag.updated_at)
+            .join(m.team_tag, m.team_tag.c.tag_id == m.Tag.id)
+            .where(m.team_tag.c.team_id == team_id)
+            .subquery()
+        )
+        statement = select(
+            m.Team.updated_at,
+            select(func.count()).select_from(members).scalar_subquery(),
+            select(func.max(members.c.updated_at)).scalar_subquery(),
+            select(func.max(members.c.user_updated_at)).scalar_subquery(),
+            select(func.count()).select_from(tags).scalar_subquery(),
+            select(func.max(tags.c.updated_at)).scalar_subquery(),
+        ).where(m.Team.id == team_id)
+        row = (await self.repository.session.execute(statement)).one_or_none()
+        return None if row is None else (team_id, *row)
+
     @staticmethod
     def can_view_all(user: m.User) -> bool:
         return bool(
@@ -82,6 +113,11 @@ class TeamService(CompositeServiceMixin, service.SQLAlchemyAsyncRepositoryServic
             msg = "'owner_id' is required to create a team."
             raise RepositoryError(msg)
 
+        # Replacing the tag collection changes no team column, so touch ``updated_at`` explicitly
+        # to keep the version used for conditional GETs honest.
+        if operation == "update" and input_tags is not None:
+            data["updated_at"] = datetime.now(UTC)
+
         data = await super().to_model(data)
 
         # For create, add the owner as an admin member
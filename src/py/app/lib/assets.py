@@ -0,0 +1,308 @@
+"""Precompressed static asset serving for the production Vite bundle.
+
+Vite emits content-hashed file names (``index-BxYz12Ab.js``), so every asset can be compressed once at
+build time (``tools/manage_assets.py --compress-assets``) and cached by browsers forever.  This module
+indexes the bundle directory once, negotiates the best precompressed sibling from ``Accept-Encoding``
+and hands the file to the server with the ASGI ``pathsend`` extension when available.
+
+Only the files Vite hashed are cached as ``immutable``: those listed in the build's manifest, or,
+without a manifest, those under its ``assets/`` directory. Files copied from ``public/`` keep their
+names across builds (``site.webmanifest``, ``apple-touch-icon.png``) and are revalidated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mimetypes
+from dataclasses import dataclass
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any, Final
+
+import anyio
+from anyio import to_thread
+from litestar import HttpMethod, Request, Router, route
+from litestar.exceptions import NotFoundException
+from litestar.response.base import ASGIResponse
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
+
+from app.lib.etag import etag_matches
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from litestar.types import HTTPResponseBodyEvent, Receive, Scope, Send
+
+__all__ = (
+    "Asset",
+    "AssetIndex",
+    "AssetVariant",
+    "PrecompressedFileResponse",
+    "create_assets_router",
+    "is_hashed_asset",
+    "manifest_files",
+    "parse_accept_encoding",
+)
+
+MANIFEST_PATHS: Final = (".vite/manifest.json", "manifest.json")
+"""Bundle-relative locations of the Vite manifest, for Vite 5+ and earlier."""
+HASHED_ASSETS_DIR: Final = "assets"
+"""Vite's ``build.assetsDir``, where it writes hashed files."""
+PRECOMPRESSED_ENCODINGS: Final = (("br", ".br"), ("gzip", ".gz"))
+"""Content codings in server preference order, paired with the sibling file suffix."""
+IDENTITY: Final = "identity"
+IMMUTABLE_CACHE_CONTROL: Final = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL: Final = "public, no-cache"
+PATHSEND_EXTENSION: Final = "http.response.pathsend"
+CHUNK_SIZE: Final = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class AssetVariant:
+    """A single on-disk representation of an asset."""
+
+    path: Path
+    size: int
+    etag: str
+
+
+@dataclass(frozen=True, slots=True)
+class Asset:
+    """An indexed asset and all of its available encodings."""
+
+    media_type: str
+    cache_control: str
+    variants: dict[str, AssetVariant]
+
+    def select(self, accept_encoding: str | None) -> tuple[str, AssetVariant]:
+        """Pick the best representation acceptable to the client.
+
+        Args:
+            accept_encoding: The raw ``Accept-Encoding`` request header.
+
+        Returns:
+            The selected content coding and its variant.
+        """
+        if accept_encoding and len(self.variants) > 1:
+            accepted = parse_accept_encoding(accept_encoding)
+            wildcard = accepted.get("*", 0.0)
+            for encoding, _ in PRECOMPRESSED_ENCODINGS:
+                if encoding in self.variants and accepted.get(encoding, wildcard) > 0:
+                    return encoding, self.variants[encoding]
+        return IDENTITY, self.variants[IDENTITY]
+
+
+def manifest_files(directory: Path) -> frozenset[str] | None:
+    """Read the bundle-relative paths of every file a Vite build manifest lists.
+
+    Args:
+        directory: The bundle directory.
+
+    Returns:
+        The entry, CSS and asset files of every chunk, or ``None`` without a manifest.
+    """
+    for relative in MANIFEST_PATHS:
+        manifest_path = directory / relative
+        if manifest_path.is_file():
+            chunks: dict[str, dict[str, Any]] = json.loads(manifest_path.read_bytes())
+            return frozenset(
+                file
+                for chunk in chunks.values()
+                for file in (chunk.get("file"), *chunk.get("css", ()), *chunk.get("assets", ()))
+                if file
+            )
+    return None
+
+
+def is_hashed_asset(path: str | PurePath, hashed_files: Collection[str] | None = None) -> bool:
+    """Return True if Vite hashed the file, so it is immutable.
+
+    Args:
+        path: A bundle-relative path.
+        hashed_files: The files listed in the build manifest; see :func:`manifest_files`.
+            Without it, files under :data:`HASHED_ASSETS_DIR` count as hashed.
+
+    Returns:
+        Whether the file is a hashed build output.
+    """
+    path = PurePath(path)
+    if hashed_files is not None:
+        return path.as_posix() in hashed_files
+    return len(path.parts) > 1 and path.parts[0] == HASHED_ASSETS_DIR
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Parse an ``Accept-Encoding`` header into a mapping of coding to quality value.
+
+    Args:
+        header: The raw header value.
+
+    Returns:
+        Lower-cased codings mapped to their ``q`` value (``1.0`` when omitted).
+    """
+    accepted: dict[str, float] = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    return accepted
+
+
+class AssetIndex:
+    """In-memory index of a bundle directory.
+
+    The bundle is immutable for the lifetime of a deployment, so the directory is scanned and
+    hashed exactly once, on first use, off the event loop.
+    """
+
+    __slots__ = ("_assets", "_lock", "directory")
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._assets: dict[str, Asset] | None = None
+        self._lock = anyio.Lock()
+
+    async def get(self, path: str) -> Asset | None:
+        """Return the indexed asset for a bundle-relative POSIX path."""
+        if self._assets is None:
+            async with self._lock:
+                if self._assets is None:
+                    self._assets = await to_thread.run_sync(self.build)
+        return self._assets.get(path)
+
+    def build(self) -> dict[str, Asset]:
+        """Scan the bundle directory.
+
+        Returns:
+            Assets keyed by their bundle-relative POSIX path.
+        """
+        assets: dict[str, Asset] = {}
+        if not self.directory.is_dir():
+            return assets
+        suffixes = {suffix for _, suffix in PRECOMPRESSED_ENCODINGS}
+        hashed_files = manifest_files(self.directory)
+        for file_path in sorted(self.directory.rglob("*")):
+            if not file_path.is_file() or file_path.suffix in suffixes:
+                continue
+            digest = hashlib.blake2b(file_path.read_bytes(), digest_size=12).hexdigest()
+            variants = {IDENTITY: AssetVariant(path=file_path, size=file_path.stat().st_size, etag=f'"{digest}"')}
+            for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+                sibling = file_path.with_name(file_path.name + suffix)
+                if sibling.is_file():
+                    variants[encoding] = AssetVariant(
+                        path=sibling,
+                        size=sibling.stat().st_size,
+                        etag=f'"{digest}-{suffix.lstrip(".")}"',
+                    )
+            media_type, _ = mimetypes.guess_type(file_path.name)
+            relative_path = file_path.relative_to(self.directory).as_posix()
+            assets[relative_path] = Asset(
+                media_type=media_type or "application/octet-stream",
+                cache_control=(
+                    IMMUTABLE_CACHE_CONTROL
+                    if is_hashed_asset(relative_path, hashed_files)
+                    else REVALIDATE_CACHE_CONTROL
+                ),
+                variants=variants,
+            )
+        return assets
+
+
+class PrecompressedFileResponse(ASGIResponse):
+    """Send a file from disk, using zero-copy ``pathsend`` when the server supports it."""
+
+    __slots__ = ("file_path", "use_pathsend")
+
+    def __init__(
+        self,
+        *,
+        file_path: Path,
+        content_length: int,
+        headers: dict[str, str],
+        media_type: str,
+        is_head_response: bool = False,
+    ) -> None:
+        super().__init__(
+            content_length=content_length,
+            headers=headers,
+            media_type=media_type,
+            is_head_response=is_head_response,
+        )
+        self.file_path = file_path
+        self.use_pathsend = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.use_pathsend = PATHSEND_EXTENSION in (scope.get("extensions") or {})  # pyright: ignore[reportUnknownMemberType]
+        await super().__call__(scope, receive, send)
+
+    async def send_body(self, send: Send, receive: Receive) -> None:
+        if self.use_pathsend:
+            await send({"type": PATHSEND_EXTENSION, "path": str(self.file_path)})  # type: ignore[arg-type]
+            return
+        async with await anyio.open_file(self.file_path, "rb") as file:
+            chunk = await file.read(CHUNK_SIZE)
+            while chunk:
+                next_chunk = await file.read(CHUNK_SIZE)
+                event: HTTPResponseBodyEvent = {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": bool(next_chunk),
+                }
+                await send(event)
+                chunk = next_chunk
+        if self.content_length == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def _serve(index: AssetIndex, request: Request[Any, Any, Any], file_path: PurePath) -> ASGIResponse:
+    asset = await index.get(file_path.as_posix().lstrip("/"))
+    if asset is None:
+        raise NotFoundException(detail=f"No asset found at {file_path}")
+    encoding, variant = asset.select(request.headers.get("accept-encoding"))
+    headers = {"cache-control": asset.cache_control, "etag": variant.etag}
+    if len(asset.variants) > 1:
+        headers["vary"] = "Accept-Encoding"
+    if etag_matches(request.headers.get("if-none-match"), variant.etag):
+        return ASGIResponse(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    if encoding != IDENTITY:
+        headers["content-encoding"] = encoding
+    return PrecompressedFileResponse(
+        file_path=variant.path,
+        content_length=variant.size,
+        headers=headers,
+        media_type=asset.media_type,
+        is_head_response=request.method == "HEAD",
+    )
+
+
+def create_assets_router(path: str, directory: Path, *, name: str = "vite") -> Router:
+    """Create a router serving a built bundle with precompressed, immutable responses.
+
+    Args:
+        path: URL prefix to mount the bundle under.
+        directory: The bundle directory.
+        name: Route handler name prefix.
+
+    Returns:
+        A router with a ``GET``/``HEAD`` handler for the bundle.
+    """
+    index = AssetIndex(directory)
+
+    @route("/{file_path:path}", http_method=[HttpMethod.GET, HttpMethod.HEAD], name=name)
+    async def serve_asset(request: Request[Any, Any, Any], file_path: PurePath) -> ASGIResponse:
+        return await _serve(index, request, file_path)
+
+    return Router(
+        path=path,
+        route_handlers=[serve_asset],
+        include_in_schema=False,
+        opt={"exclude_from_auth": True},
+    )
@@ -0,0 +1,304 @@
+"""Response caching for expensive, read-mostly endpoints.
+
+Handlers opt in with :func:`cached`, which stores the serialised response body in a Litestar
+:class:`~litestar.stores.base.Store` (a bounded in-process LRU by default, Redis when configured).
+Concurrent misses for the same key share one computation (single-flight), and writers invalidate a
+whole tag at once by rotating the tag's version token, so stale entries simply stop being read and
+age out through their TTL.
+
+Writers inside a database transaction call :func:`invalidate_on_commit` rather than invalidating
+right away: a miss between the invalidation and the commit would otherwise recompute from the
+pre-commit data and cache it for the whole TTL. The request session's ``autocommit`` handler runs
+the invalidations once the transaction has committed, and again after
+``DATABASE_REPLICA_STICKY_SECONDS`` when replicas are configured, so a miss served by a lagging
+replica in between is not kept either.
+
+Only request sessions run the invalidations. Writes made elsewhere (CLI commands such as
+``create-roles`` and the user import, fixture loads, SAQ background jobs) leave cached responses in
+place until their TTL expires, and so does a write handled by another worker while the cache is the
+per-process memory backend.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from datetime import timedelta
+from functools import cache, wraps
+from typing import TYPE_CHECKING, Any, Final, ParamSpec, TypeVar
+
+import anyio
+from litestar import MediaType, Response
+from litestar.serialization import encode_json, get_serializer
+from litestar.stores.base import Store
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.lib.metrics import CACHE_REQUESTS
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from litestar import Request
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = (
+    "DASHBOARD_CACHE_TAG",
+    "LRUMemoryStore",
+    "ResponseCache",
+    "cached",
+    "get_response_cache",
+    "invalidate_on_commit",
+    "run_commit_invalidations",
+)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+DASHBOARD_CACHE_TAG: Final = "admin-dashboard"
+"""Tag shared by the admin dashboard endpoints; invalidated when a request writes an audit log."""
+
+_PENDING_INVALIDATIONS: Final = "cache_invalidations_pending"
+_COMMITTED_INVALIDATIONS: Final = "cache_invalidations"
+
+
+class LRUMemoryStore(Store):
+    """A bounded, in-process store that evicts the least recently used key once full."""
+
+    __slots__ = ("_data", "_lock", "max_entries")
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._lock = anyio.Lock()
+
+    @staticmethod
+    def _expires_at(expires_in: int | timedelta | None) -> float | None:
+        if expires_in is None:
+            return None
+        if isinstance(expires_in, timedelta):
+            expires_in = int(expires_in.total_seconds())
+        return time.monotonic() + expires_in
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        if isinstance(value, str):
+            value = value.encode()
+        async with self._lock:
+            self._data[key] = (value, self._expires_at(expires_in))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        async with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            if renew_for is not None and expires_at is not None:
+                self._data[key] = (value, self._expires_at(renew_for))
+            self._data.move_to_end(key)
+            return value
+
+    async def delete(self, key: str) -> None:
+        async with self._lock:
+            self._data.pop(key, None)
+
+    async def delete_all(self) -> None:
+        async with self._lock:
+            self._data.clear()
+
+    async def exists(self, key: str) -> bool:
+        return await self.get(key) is not None
+
+    async def expires_in(self, key: str) -> int | None:
+        async with self._lock:
+            item = self._data.get(key)
+        if item is None or item[1] is None:
+            return None
+        return max(int(item[1] - time.monotonic()), 0)
+
+
+class _Flight:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: bytes | None = None
+        self.error: BaseException | None = None
+
+
+class ResponseCache:
+    """Tagged, single-flight cache of serialised responses on top of a Litestar store."""
+
+    __slots__ = ("_delayed", "_flights", "namespace", "store")
+
+    def __init__(self, store: Store, namespace: str = "response-cache") -> None:
+        self.store = store
+        self.namespace = namespace
+        self._flights: dict[str, _Flight] = {}
+        self._delayed: set[asyncio.Task[None]] = set()
+
+    def _version_key(self, tag: str) -> str:
+        return f"{self.namespace}:{tag}:version"
+
+    async def _versioned_key(self, tag: str, key: str) -> str:
+        version = await self.store.get(self._version_key(tag))
+        return f"{self.namespace}:{tag}:{(version or b'0').decode()}:{key}"
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]],
+        *,
+        tag: str,
+        ttl: int,
+    ) -> bytes:
+        """Return the cached value for ``key``, computing it at most once per process on a miss.
+
+        Args:
+            key: Cache key, unique within ``tag``.
+            compute: Produces the value on a miss.
+            tag: Invalidation group the key belongs to.
+            ttl: Seconds to keep the value.
+
+        Raises:
+            Exception: Whatever ``compute`` raised, re-raised in every waiting caller.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        cache_key = await self._versioned_key(tag, key)
+        if (value := await self.store.get(cache_key)) is not None:
+            CACHE_REQUESTS.inc(tag, "hit")
+            return value
+        if (flight := self._flights.get(cache_key)) is not None:
+            CACHE_REQUESTS.inc(tag, "shared")
+            await flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            if flight.result is None:  # the leader was cancelled; take over
+                return await self.get_or_compute(key, compute, tag=tag, ttl=ttl)
+            return flight.result
+        CACHE_REQUESTS.inc(tag, "miss")
+        flight = self._flights[cache_key] = _Flight()
+        try:
+            flight.result = await compute()
+            await self.store.set(cache_key, flight.result, expires_in=ttl)
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            del self._flights[cache_key]
+            flight.done.set()
+        return flight.result
+
+    async def invalidate(self, *tags: str) -> None:
+        """Drop every entry of the given tags by rotating their version tokens."""
+        for tag in tags:
+            await self.store.set(self._version_key(tag), uuid.uuid4().hex)
+
+    def invalidate_later(self, delay: float, *tags: str) -> None:
+        """Invalidate ``tags`` again after ``delay`` seconds, without waiting for it."""
+
+        async def invalidate() -> None:
+            await anyio.sleep(delay)
+            await self.invalidate(*tags)
+
+        task = asyncio.ensure_future(invalidate())
+        self._delayed.add(task)
+        task.add_done_callback(self._delayed.discard)
+
+
+@cache
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, built from :class:`~app.lib.settings.CacheSettings`."""
+    from app.lib.settings import get_settings
+
+    return ResponseCache(get_settings().cache.get_store())
+
+
+def invalidate_on_commit(session: AsyncSession | Session, *tags: str) -> None:
+    """Invalidate ``tags`` once the session's transaction commits; nothing happens on rollback.
+
+    Run by :func:`run_commit_invalidations`, which the request session's ``autocommit`` handler
+    calls after committing.
+    """
+    session.info.setdefault(_PENDING_INVALIDATIONS, set()).update(tags)
+
+
+async def run_commit_invalidations(session: AsyncSession | Session, *, replica_lag: float = 0) -> None:
+    """Invalidate the tags queued with :func:`invalidate_on_commit` by transactions that committed.
+
+    Args:
+        session: The session that committed.
+        replica_lag: Seconds after which to invalidate again, for misses served by a replica that
+            had not caught up with the commit yet.
+    """
+    tags: set[str] | None = session.info.pop(_COMMITTED_INVALIDATIONS, None)
+    if not tags:
+        return
+    response_cache = get_response_cache()
+    await response_cache.invalidate(*sorted(tags))
+    if replica_lag:
+        response_cache.invalidate_later(replica_lag, *sorted(tags))
+
+
+@event.listens_for(Session, "after_commit")
+def _commit_invalidations(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    if pending := session.info.pop(_PENDING_INVALIDATIONS, None):
+        session.info.setdefault(_COMMITTED_INVALIDATIONS, set()).update(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+def _path_and_query(request: Request[Any, Any, Any]) -> str:
+    return f"{request.url.path}?{'&'.join(sorted(request.url.query.split('&')))}"
+
+
+def cached(
+    tag: str,
+    *,
+    ttl: int,
+    key: Callable[[Request[Any, Any, Any]], str] = _path_and_query,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Cache a route handler's serialised response.
+
+    The handler must accept a ``request`` parameter. Its result is encoded with the route's own
+    serializer, so hits skip both the handler and serialisation.
+
+    Invalidation only follows writes made through request sessions (see the module docstring);
+    changes made by the CLI or background jobs can be served stale for up to ``ttl`` seconds.
+
+    Args:
+        tag: Invalidation group, see :meth:`ResponseCache.invalidate`.
+        ttl: Seconds to keep a response.
+        key: Builds the cache key from the request; defaults to the path and sorted query string.
+
+    Returns:
+        A decorator for the handler function.
+    """
+
+    def decorator(fn: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            request: Request[Any, Any, Any] = kwargs["request"]  # type: ignore[assignment]
+
+            async def compute() -> bytes:
+                serializer = get_serializer(request.route_handler.resolve_type_encoders())
+                return encode_json(await fn(*args, **kwargs), serializer)
+
+            body = await get_response_cache().get_or_compute(key(request), compute, tag=tag, ttl=ttl)
+            return Response(content=body, media_type=MediaType.JSON)  # type: ignore[return-value]
+
+        return wrapper
+
+    return decorator
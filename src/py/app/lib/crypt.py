@@ -5,20 +5,35 @@ import base64
 import importlib
 import secrets
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Literal, cast, overload
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast, overload
 
 import pyotp
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 
+from app.lib.metrics import ARGON2_IN_FLIGHT
+
 qrcode: Any = importlib.import_module("qrcode")
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from PIL.Image import Image
 
+T = TypeVar("T")
+
 hasher = PasswordHash((Argon2Hasher(),))
 
 
+async def _run_hasher(func: Callable[..., T], *args: Any) -> T:
+    """Run an Argon2 operation in the default executor, tracking how many are queued or running."""
+    ARGON2_IN_FLIGHT.inc()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+    finally:
+        ARGON2_IN_FLIGHT.dec()
+
+
 def get_encryption_key(secret: str) -> bytes:
     """Get Encryption Key.
 
@@ -42,7 +57,7 @@ async def get_password_hash(password: str | bytes) -> str:
     Returns:
         str: Hashed password
     """
-    return await asyncio.get_running_loop().run_in_executor(None, hasher.hash, password)
+    return await _run_hasher(hasher.hash, password)
 
 
 async def verify_password(plain_password: str | bytes, hashed_password: str) -> bool:
@@ -55,12 +70,7 @@ async def verify_password(plain_password: str | bytes, hashed_password: str) ->
     Returns:
         bool: True if password matches hash.
     """
-    valid, _ = await asyncio.get_running_loop().run_in_executor(
-        None,
-        hasher.verify_and_update,
-        plain_password,
-        hashed_password,
-    )
+    valid, _ = await _run_hasher(hasher.verify_and_update, plain_password, hashed_password)
     return bool(valid)
 
 
@@ -53,9 +53,11 @@ async def get_task_queue() -> Queue:
     Returns:
         dict[str,Queue]: A list of queues
     """
+    from app.lib.tracing import inject_job_context
     from app.server import plugins
 
     task_queues = plugins.get_saq_plugin().get_queue("background-tasks")
+    task_queues.register_before_enqueue(inject_job_context)
     await task_queues.connect()
 
     return task_queues
@@ -0,0 +1,91 @@
+"""Cancel reads whose client went away.
+
+Without this, a handler keeps its connection (and its statement running on the server) until it
+finishes, even though nobody is left to receive the response. :func:`CancelOnDisconnectMiddleware`
+reads the ASGI ``receive`` channel itself and cancels the handler as soon as ``http.disconnect``
+arrives. Both psycopg and asyncpg send a cancel request to the server for a statement whose
+coroutine is cancelled, so the query stops too.
+
+Only ``GET`` and ``HEAD`` requests are cancelled: cancelling a write halfway through could roll
+back work, such as emails already sent, that the client may still have caused.
+
+A cancelled request sends no response, so advanced-alchemy's ``before_send`` handler never sees
+the event it closes the request session on. The middleware closes that session itself, returning
+its connection to the pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Final
+
+import structlog
+from advanced_alchemy.extensions.litestar._utils import get_aa_scope_state
+from advanced_alchemy.extensions.litestar.plugins.init.config.common import SESSION_SCOPE_KEY
+from litestar.enums import ScopeType
+
+if TYPE_CHECKING:
+    from litestar.types.asgi_types import ASGIApp, Message, Receive, ReceiveMessage, Scope, Send
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = ("CancelOnDisconnectMiddleware",)
+
+logger = structlog.get_logger()
+
+_SAFE_METHODS: Final = frozenset({"GET", "HEAD"})
+
+
+def CancelOnDisconnectMiddleware(app: ASGIApp, session_scope_key: str = SESSION_SCOPE_KEY) -> ASGIApp:  # noqa: N802
+    """Run ``GET``/``HEAD`` handlers in a task that is cancelled when the client disconnects.
+
+    Args:
+        app: The next ASGI app.
+        session_scope_key: Scope key of the advanced-alchemy request session to close on cancel.
+
+    Returns:
+        The middleware.
+    """
+
+    async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != ScopeType.HTTP or scope["method"] not in _SAFE_METHODS:
+            await app(scope, receive, send)
+            return
+
+        messages: asyncio.Queue[ReceiveMessage] = asyncio.Queue()
+        responded = disconnected = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal responded
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                responded = True
+            await send(message)
+
+        handler = asyncio.ensure_future(app(scope, messages.get, send_wrapper))
+
+        async def pump() -> None:
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                # Once the response is out, the rest (background tasks, hooks) runs to completion.
+                if message["type"] == "http.disconnect":
+                    disconnected = not responded
+                    if disconnected:
+                        handler.cancel()
+                    return
+
+        reader = asyncio.ensure_future(pump())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if not disconnected or (current is not None and current.cancelling()):
+                raise
+            session: AsyncSession | None = get_aa_scope_state(scope, session_scope_key, pop=True)
+            if session is not None:
+                await session.close()
+            await logger.ainfo("Cancelled request after client disconnect", path=scope["path"])
+        finally:
+            reader.cancel()
+
+    return middleware
@@ -9,11 +9,14 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, Protocol
 
 from litestar_email import EmailMultiAlternatives
 
+from app.lib.metrics import EMAIL_SEND_DURATION
 from app.lib.settings import BASE_DIR, get_settings
+from app.lib.tracing import start_span
 
 if TYPE_CHECKING:
     from litestar_email import EmailService
@@ -124,12 +127,16 @@ class AppEmailService:
             reply_to=[reply_to] if reply_to else [],
         )
 
+        start = perf_counter()
         try:
-            num_sent = await self._mailer.send_message(message)
+            with start_span("email.send", **{"email.recipients": len(recipients)}):
+                num_sent = await self._mailer.send_message(message)
         except Exception:
+            EMAIL_SEND_DURATION.observe(perf_counter() - start, "error")
             logger.exception("Failed to send email to %s", to_email)
             raise
         else:
+            EMAIL_SEND_DURATION.observe(perf_counter() - start, "sent" if num_sent else "rejected")
             return num_sent > 0
 
     async def send_verification_email(self, user: UserProtocol, verification_token: str) -> bool:
@@ -0,0 +1,95 @@
+"""Conditional GET helpers.
+
+Resources polled by the SPA derive a weak ``ETag`` from the version columns that
+``UUIDv7AuditBase`` maintains (``updated_at``) rather than from the response body, so an
+``If-None-Match`` revalidation can be answered with ``304 Not Modified`` before the
+response is serialised and, where a cheap version probe exists, before it is loaded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Final, TypeVar, cast
+
+from litestar.datastructures import ETag
+from litestar.response import Response
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from litestar.connection import ASGIConnection
+
+__all__ = (
+    "PRIVATE_REVALIDATE",
+    "PUBLIC_REVALIDATE",
+    "conditional_response",
+    "etag_matches",
+    "make_etag",
+)
+
+T = TypeVar("T")
+
+PRIVATE_REVALIDATE: Final = "private, no-cache"
+"""Per-user resources: the browser may store them but must revalidate every use."""
+PUBLIC_REVALIDATE: Final = "public, no-cache"
+"""Shared resources: any cache may store them but must revalidate every use."""
+
+
+def make_etag(*parts: Any) -> ETag:
+    """Build a weak ETag from the values that version a resource.
+
+    Args:
+        *parts: Identifiers and version columns (``updated_at``, counts, ...) of the resource.
+
+    Returns:
+        A weak ETag whose value changes whenever any of ``parts`` changes.
+    """
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return ETag(weak=True, value=digest)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag using the weak comparison function.
+
+    Args:
+        if_none_match: The raw request header, if present.
+        etag: The current ETag header value of the resource.
+
+    Returns:
+        True if the client's cached representation is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+async def conditional_response(
+    connection: ASGIConnection[Any, Any, Any, Any],
+    etag: ETag,
+    build: Callable[[], T | Awaitable[T]],
+    *,
+    cache_control: str = PRIVATE_REVALIDATE,
+) -> Response[T]:
+    """Answer a GET with ``304 Not Modified`` or the freshly built content.
+
+    Args:
+        connection: The current request.
+        etag: The resource's current ETag.
+        build: Produces (or loads) the response content; only called when the client's copy is stale.
+        cache_control: The ``Cache-Control`` header to send.
+
+    Returns:
+        A ``304`` response without a body, or a ``200`` response with ``build()``'s result.
+    """
+    headers = {"etag": etag.to_header(), "cache-control": cache_control}
+    if etag_matches(connection.headers.get("if-none-match"), headers["etag"]):
+        return Response(content=None, status_code=HTTP_304_NOT_MODIFIED, headers=headers)  # type: ignore[arg-type]
+    content = build()
+    if isawaitable(content):
+        content = await content
+    return Response(content=cast("T", content), headers=headers)
@@ -23,8 +23,9 @@ from litestar.exceptions.responses import (
 from litestar.exceptions.responses import (
     create_exception_response as _create_exception_response,  # pyright: ignore[reportUnknownVariableType]
 )
+from litestar.plugins.problem_details import ProblemDetailsException
 from litestar.repository.exceptions import ConflictError, NotFoundError, RepositoryError
-from litestar.status_codes import HTTP_409_CONFLICT, HTTP_500_INTERNAL_SERVER_ERROR
+from litestar.status_codes import HTTP_409_CONFLICT, HTTP_500_INTERNAL_SERVER_ERROR, HTTP_503_SERVICE_UNAVAILABLE
 from structlog.contextvars import bind_contextvars
 
 if TYPE_CHECKING:
@@ -38,6 +39,8 @@ __all__ = (
     "ApplicationError",
     "AuthorizationError",
     "HealthCheckConfigurationError",
+    "ReadOnlyTransactionError",
+    "StatementTimeoutError",
     "after_exception_hook_handler",
 )
 
@@ -87,6 +90,34 @@ class AuthorizationError(ApplicationClientError):
     """A user tried to do something they shouldn't have."""
 
 
+class StatementTimeoutError(ApplicationError):
+    """A statement ran into the ``statement_timeout`` of its request."""
+
+    detail = "The database did not answer within this request's time budget."
+
+    def __init__(self, *args: Any, timeout_ms: int, elapsed_ms: int, detail: str = "") -> None:
+        """Initialize ``StatementTimeoutError``.
+
+        Args:
+            *args: args are converted to :class:`str` before passing to :class:`Exception`
+            timeout_ms: The statement timeout in milliseconds.
+            elapsed_ms: Milliseconds the transaction had run when the statement was cancelled.
+            detail: detail of the exception.
+        """
+        super().__init__(*args, detail=detail)
+        self.timeout_ms = timeout_ms
+        self.elapsed_ms = elapsed_ms
+
+
+class ReadOnlyTransactionError(ApplicationError):
+    """A read-only request session was asked to write."""
+
+    detail = (
+        "GET and HEAD requests run in read-only transactions; opt the route handler out with "
+        "opt={READ_ONLY_OPT: False} to write."
+    )
+
+
 class HealthCheckConfigurationError(ApplicationError):
     """An error occurred while registering an health check."""
 
@@ -139,6 +170,13 @@ def exception_to_http_response(
     Returns:
         Exception response appropriate to the type of original exception.
     """
+    if isinstance(exc, StatementTimeoutError):
+        return ProblemDetailsException(
+            detail=exc.detail,
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "1"},
+            extra={"statement_timeout_ms": exc.timeout_ms, "elapsed_ms": exc.elapsed_ms},
+        ).to_response(request)
     http_exc: type[HTTPException]
     if isinstance(exc, NotFoundError):
         http_exc = NotFoundException
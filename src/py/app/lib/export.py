@@ -0,0 +1,165 @@
+"""Streaming export encoders.
+
+Exports are produced chunk by chunk from :meth:`ProjectionServiceMixin.stream_as` and encoded
+as they arrive, so a response body of any size never sits in memory. Each chunk of structs is
+encoded in one call, reusing a module-level msgspec encoder rather than one per row.
+
+Litestar stops iterating a stream when the client disconnects but leaves the iterator open, so
+whatever it holds (a database session and its cursor) would wait for garbage collection.
+:class:`ExportStream` closes the iterator however the response ends, and the encoders close the
+chunks they read from, so the close reaches the source.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import itertools
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+import anyio
+import msgspec
+from litestar.enums import MediaType
+from litestar.response import Stream
+from litestar.response.streaming import ASGIStreamingResponse
+from litestar.utils.helpers import get_enum_string_value
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from litestar import Litestar, Request
+    from litestar.background_tasks import BackgroundTask, BackgroundTasks
+    from litestar.datastructures import Cookie
+    from litestar.response.base import ASGIResponse
+    from litestar.types import Send, TypeEncodersMap
+
+__all__ = (
+    "EXPORT_MEDIA_TYPES",
+    "ExportFormat",
+    "ExportStream",
+    "encode_export",
+)
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: Final[dict[str, str]] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+_json_encoder = msgspec.json.Encoder()
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return _json_encoder.encode(value).decode()
+    return value
+
+
+async def _encode_ndjson(chunks: AsyncGenerator[Sequence[msgspec.Struct], None]) -> AsyncGenerator[bytes, None]:
+    async with aclosing(chunks):
+        async for items in chunks:
+            if items:
+                yield _json_encoder.encode_lines(items)  # pyright: ignore[reportUnknownMemberType]
+
+
+async def _encode_csv(
+    schema_type: type[msgspec.Struct],
+    chunks: AsyncGenerator[Sequence[msgspec.Struct], None],
+) -> AsyncGenerator[bytes, None]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(field.encode_name for field in msgspec.structs.fields(schema_type))
+    async with aclosing(chunks):
+        yield buffer.getvalue().encode()
+        async for items in chunks:
+            if not items:
+                continue
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(
+                [_csv_cell(value) for value in row]
+                for row in msgspec.to_builtins([msgspec.structs.astuple(item) for item in items])
+            )
+            yield buffer.getvalue().encode()
+
+
+def encode_export(
+    export_format: ExportFormat,
+    schema_type: type[msgspec.Struct],
+    chunks: AsyncGenerator[Sequence[msgspec.Struct], None],
+) -> AsyncGenerator[bytes, None]:
+    """Encode chunks of structs into an NDJSON or CSV byte stream.
+
+    NDJSON lines and the CSV header use the struct's encoded (camelised) field names.
+    Nested values such as JSON columns are written to CSV cells as compact JSON.
+
+    Args:
+        export_format: ``ndjson`` or ``csv``.
+        schema_type: The struct type of every item, used for the CSV header.
+        chunks: The structs to encode, a list at a time. Closed with the returned generator.
+
+    Returns:
+        An async generator of encoded byte chunks, one per input chunk.
+    """
+    if export_format == "csv":
+        return _encode_csv(schema_type, chunks)
+    return _encode_ndjson(chunks)
+
+
+class _ClosingStreamingResponse(ASGIStreamingResponse):
+    __slots__ = ()
+
+    async def _stream(self, send: Send) -> None:
+        try:
+            await super()._stream(send)
+        finally:
+            iterator: Any = self.iterator
+            if isinstance(iterator, AsyncGenerator):
+                # Shielded, as a disconnect cancels the stream and the iterator's cleanup awaits.
+                with anyio.CancelScope(shield=True):
+                    await iterator.aclose()
+
+
+class ExportStream(Stream):
+    """A :class:`~litestar.response.Stream` that closes its iterator when the response ends.
+
+    The iterator is closed after the last chunk, on an error and when the client disconnects
+    mid-stream, releasing whatever the iterator holds straight away.
+    """
+
+    __slots__ = ()
+
+    def to_asgi_response(
+        self,
+        app: Litestar | None,
+        request: Request[Any, Any, Any],
+        *,
+        background: BackgroundTask | BackgroundTasks | None = None,
+        cookies: Iterable[Cookie] | None = None,
+        encoded_headers: Iterable[tuple[bytes, bytes]] | None = None,
+        headers: dict[str, str] | None = None,
+        is_head_response: bool = False,
+        media_type: MediaType | str | None = None,
+        status_code: int | None = None,
+        type_encoders: TypeEncodersMap | None = None,
+    ) -> ASGIResponse:
+        iterator = self.iterator
+        if callable(iterator):
+            iterator = iterator()
+        return _ClosingStreamingResponse(
+            background=self.background or background,
+            content_length=0,
+            cookies=self.cookies if cookies is None else itertools.chain(self.cookies, cookies),
+            encoded_headers=encoded_headers,
+            encoding=self.encoding,
+            headers={**headers, **self.headers} if headers is not None else self.headers,
+            is_head_response=is_head_response,
+            iterator=iterator,
+            media_type=get_enum_string_value(media_type or self.media_type or MediaType.JSON),
+            status_code=self.status_code or status_code,
+        )
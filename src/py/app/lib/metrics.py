@@ -0,0 +1,377 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Recording is a dictionary update on the event loop thread, cheap enough to leave on everywhere:
+request latency and in-flight requests (:func:`MetricsMiddleware`), connection pool waits, hold
+times and connection ages (``app.lib.pool``), SAQ job pickup and runtime (``app.lib.worker``),
+Argon2 executor depth (``app.lib.crypt``), email sends (``app.lib.email``) and response cache
+lookups (``app.lib.cache``). Values that are cheaper to read than to track, like the pool's
+checked-out count or the queue depth, are sampled by collectors when ``/metrics`` is scraped.
+
+Values are per process: with several Granian workers each worker reports its own series, so scrape
+every worker or aggregate with ``sum()`` in queries.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left
+from contextvars import ContextVar
+from inspect import isawaitable
+from time import perf_counter
+from typing import TYPE_CHECKING, Final, TypeVar
+
+import structlog
+from litestar.enums import ScopeType
+from sqlalchemy.pool import QueuePool
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator, Sequence
+
+    from litestar.types.asgi_types import ASGIApp, Message, Receive, Scope, Send
+    from saq import Queue
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+__all__ = (
+    "CONTENT_TYPE",
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "current_route",
+    "parse_metrics",
+    "watch_pool",
+    "watch_queue",
+)
+
+logger = structlog.get_logger()
+
+CONTENT_TYPE: Final = "text/plain; version=0.0.4; charset=utf-8"
+"""Media type of the Prometheus text exposition format."""
+
+DEFAULT_BUCKETS: Final = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Latency buckets in seconds, suited to HTTP requests and database waits."""
+
+JOB_BUCKETS: Final = (0.01, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0)
+"""Buckets in seconds for background jobs, which run for much longer than requests."""
+
+_SAMPLE = re.compile(r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(?P<labels>.*)\})? (?P<value>\S+)$")
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+_ESCAPED = re.compile(r"\\(.)")
+
+current_route: ContextVar[str] = ContextVar("metrics_route", default="none")
+"""Route template of the request being served, set by :func:`MetricsMiddleware`."""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)) + "}"
+
+
+def _unescape(value: str) -> str:
+    return _ESCAPED.sub(lambda match: "\n" if match[1] == "n" else match[1], value)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    __slots__ = ("documentation", "labelnames", "name")
+
+    kind: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+        return header + "".join(f"{sample}\n" for sample in self.samples())
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class Counter(_Metric):
+    """A monotonically increasing value per label set."""
+
+    __slots__ = ("_values",)
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Add ``amount`` to the series identified by ``labels``."""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the current value of a series."""
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterator[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}_total{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """A value per label set that can go up and down."""
+
+    __slots__ = ("_values",)
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        """Replace the value of the series identified by ``labels``."""
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Add ``amount`` to the series identified by ``labels``."""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        """Subtract ``amount`` from the series identified by ``labels``."""
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels: str) -> float:
+        """Return the current value of a series."""
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterator[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets per label set."""
+
+    __slots__ = ("_series", "buckets")
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [count per bucket (+Inf last)..., sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation for the series identified by ``labels``."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        """Return the number of observations of a series."""
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> Iterator[str]:
+        bucket_labels = (*self.labelnames, "le")
+        bounds = [*map(_format_value, self.buckets), "+Inf"]
+        for labels, series in self._series.items():
+            cumulative = 0.0
+            for bound, observed in zip(bounds, series[:-1], strict=True):
+                cumulative += observed
+                yield f"{self.name}_bucket{_format_labels(bucket_labels, (*labels, bound))} {_format_value(cumulative)}"
+            label_text = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(series[-1])}"
+            yield f"{self.name}_count{label_text} {_format_value(cumulative)}"
+
+
+class MetricsRegistry:
+    """The metrics of one process and the collectors that refresh sampled values before a scrape."""
+
+    __slots__ = ("_collectors", "_metrics")
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Awaitable[None] | None]] = []
+
+    def register(self, metric: M) -> M:
+        """Add a metric, returning it so that it can be assigned in one statement."""
+        if metric.name in self._metrics:
+            msg = f"Metric {metric.name!r} is already registered"
+            raise ValueError(msg)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Awaitable[None] | None]) -> None:
+        """Run ``collector`` before every scrape to refresh sampled gauges."""
+        self._collectors.append(collector)
+
+    async def collect(self) -> str:
+        """Refresh sampled values and render every metric in the text exposition format."""
+        for collector in self._collectors:
+            try:
+                result = collector()
+                if isawaitable(result):
+                    await result
+            except Exception as e:  # noqa: BLE001
+                await logger.awarning("Metrics collector failed", collector=collector.__name__, reason=str(e))
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+REGISTRY = MetricsRegistry()
+"""The process-wide registry served at ``/metrics``."""
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status.",
+    ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge("http_requests_in_flight", "HTTP requests currently being served.")
+DB_POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled database connection.", ("pool",)
+)
+DB_POOL_HOLD = REGISTRY.histogram(
+    "db_pool_connection_hold_seconds", "Time a pooled connection stayed checked out, by route.", ("pool", "route")
+)
+DB_POOL_CONNECTION_AGE = REGISTRY.histogram(
+    "db_pool_connection_age_seconds",
+    "Age of pooled connections when checked out.",
+    ("pool",),
+    buckets=(1.0, 10.0, 60.0, 300.0, 900.0, 3600.0),
+)
+DB_POOL_OVERFLOW_CONNECTS = REGISTRY.counter(
+    "db_pool_overflow_connects", "Connections opened beyond the pool size to serve a checkout.", ("pool",)
+)
+DB_POOL_CHECKED_OUT = REGISTRY.gauge("db_pool_checked_out", "Pooled connections currently checked out.", ("pool",))
+DB_POOL_OVERFLOW = REGISTRY.gauge("db_pool_overflow", "Connections open beyond the pool size.", ("pool",))
+DB_POOL_SIZE = REGISTRY.gauge("db_pool_size", "Configured connection pool size.", ("pool",))
+QUEUE_DEPTH = REGISTRY.gauge("saq_queue_depth", "Jobs waiting to be picked up.", ("queue",))
+JOB_PICKUP = REGISTRY.histogram(
+    "saq_job_pickup_seconds",
+    "Time from enqueue until a worker started the job.",
+    ("queue", "function"),
+    JOB_BUCKETS,
+)
+JOB_RUNTIME = REGISTRY.histogram(
+    "saq_job_runtime_seconds", "Job execution time by final status.", ("queue", "function", "status"), JOB_BUCKETS
+)
+ARGON2_IN_FLIGHT = REGISTRY.gauge(
+    "argon2_executor_in_flight", "Password hash operations queued or running in the executor."
+)
+EMAIL_SEND_DURATION = REGISTRY.histogram("email_send_duration_seconds", "Email delivery latency.", ("status",))
+CACHE_REQUESTS = REGISTRY.counter(
+    "response_cache_requests", "Response cache lookups by tag and result.", ("tag", "result")
+)
+
+
+def parse_metrics(text: str) -> dict[str, list[tuple[dict[str, str], float]]]:
+    """Parse the text exposition format into samples by name, for tools reading ``/metrics``."""
+    samples: dict[str, list[tuple[dict[str, str], float]]] = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#") or not (match := _SAMPLE.match(line)):
+            continue
+        labels = {name: _unescape(value) for name, value in _LABEL.findall(match["labels"] or "")}
+        samples.setdefault(match["name"], []).append((labels, float(match["value"])))
+    return samples
+
+
+def watch_pool(engine: AsyncEngine, label: str = "primary") -> None:
+    """Sample the engine's pool occupancy on every scrape, under the ``pool`` label ``label``."""
+    pool = engine.pool
+
+    def collect_pool() -> None:
+        if not isinstance(pool, QueuePool):
+            return
+        DB_POOL_SIZE.set(pool.size(), label)
+        DB_POOL_CHECKED_OUT.set(pool.checkedout(), label)
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0), label)
+
+    REGISTRY.add_collector(collect_pool)
+
+
+def watch_queue(get_queue: Callable[[], Awaitable[Queue]]) -> None:
+    """Sample a SAQ queue's depth on every scrape."""
+
+    async def collect_queue_depth() -> None:
+        queue = await get_queue()
+        QUEUE_DEPTH.set(await queue.count("queued"), queue.name)
+
+    REGISTRY.add_collector(collect_queue_depth)
+
+
+# Named like a class so that it reads properly in the middleware stack, as ``StructlogMiddleware`` does.
+def MetricsMiddleware(app: ASGIApp) -> ASGIApp:  # noqa: N802
+    """Middleware recording latency and in-flight counts of HTTP requests.
+
+    Requests are labelled with the matched route template rather than the raw path, so path
+    parameters do not create a series per resource.
+
+    Args:
+        app: The previous ASGI app in the call chain.
+
+    Returns:
+        A new ASGI app that records request metrics.
+    """
+
+    async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != ScopeType.HTTP:
+            await app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        route = scope.get("path_template", scope["path"])  # pyright: ignore[reportUnknownMemberType]
+        token = current_route.set(route)
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = perf_counter()
+        try:
+            await app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            current_route.reset(token)
+            HTTP_REQUEST_DURATION.observe(perf_counter() - start, scope["method"], route, status)
+
+    return middleware
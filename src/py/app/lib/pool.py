@@ -0,0 +1,164 @@
+"""Instrumented connection pool.
+
+:class:`InstrumentedAsyncAdaptedQueuePool` records, into ``app.lib.metrics``, how long each checkout
+waited for a connection, how long connections stay checked out per route, how old connections are
+when handed out and how often a checkout had to open an overflow connection. Together with the
+sampled pool gauges these explain ``pool_timeout`` errors: long waits with long hold times on a few
+routes point at those routes, long waits with short hold times at a pool that is too small.
+
+Every series carries a ``pool`` label naming the engine, ``primary`` or ``replica<n>`` in the order
+of ``DATABASE_REPLICA_URLS``, so replica checkouts are not mixed into the primary's. The pool keeps
+its configured size; ``app perf pool-advice`` turns the recorded metrics of a running worker into
+``DATABASE_POOL_SIZE`` and ``DATABASE_MAX_POOL_OVERFLOW`` settings.
+"""
+
+from __future__ import annotations
+
+import math
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Final, cast
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.lib import metrics
+
+if TYPE_CHECKING:
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+__all__ = (
+    "PRIMARY_POOL",
+    "InstrumentedAsyncAdaptedQueuePool",
+    "PoolAdvice",
+    "advise_pool_size",
+    "replica_pool",
+)
+
+PRIMARY_POOL: Final = "primary"
+"""``pool`` label of the primary engine's metrics."""
+
+_CONNECTED_AT: Final = "pool_connected_at"
+_CHECKED_OUT: Final = "pool_checked_out"
+
+
+def replica_pool(index: int) -> str:
+    """``pool`` label of the metrics of the replica at ``index`` in ``DATABASE_REPLICA_URLS``."""
+    return f"replica{index}"
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool recording checkout metrics under its :attr:`label`."""
+
+    label: str = PRIMARY_POOL
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        overflow = self.overflow()
+        start = perf_counter()
+        try:
+            record = super()._do_get()
+        finally:
+            metrics.DB_POOL_CHECKOUT_WAIT.observe(perf_counter() - start, self.label)
+            if self.overflow() > max(overflow, 0):
+                metrics.DB_POOL_OVERFLOW_CONNECTS.inc(self.label)
+        # ``info`` is cleared whenever the connection is replaced, so this is its first checkout.
+        connected_at = record.info.setdefault(_CONNECTED_AT, monotonic())
+        metrics.DB_POOL_CONNECTION_AGE.observe(monotonic() - connected_at, self.label)
+        record.info[_CHECKED_OUT] = (perf_counter(), metrics.current_route.get())
+        return record
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        if (checked_out := record.info.pop(_CHECKED_OUT, None)) is not None:
+            start, route = checked_out
+            metrics.DB_POOL_HOLD.observe(perf_counter() - start, self.label, route)
+        super()._do_return_conn(record)
+
+    def recreate(self) -> InstrumentedAsyncAdaptedQueuePool:
+        pool = cast("InstrumentedAsyncAdaptedQueuePool", super().recreate())
+        pool.label = self.label
+        return pool
+
+
+class PoolAdvice:
+    """Pool sizing derived from two scrapes of a worker's ``/metrics``."""
+
+    __slots__ = ("checkouts", "in_use", "overflow_connects", "pool_size", "routes", "slow_waits")
+
+    def __init__(
+        self,
+        *,
+        pool_size: int,
+        in_use: float,
+        checkouts: int,
+        slow_waits: int,
+        overflow_connects: int,
+        routes: list[tuple[str, float]],
+    ) -> None:
+        self.pool_size = pool_size
+        self.in_use = in_use
+        self.checkouts = checkouts
+        self.slow_waits = slow_waits
+        self.overflow_connects = overflow_connects
+        self.routes = routes
+
+    @property
+    def recommended_size(self) -> int:
+        """Average connections in use with 50% headroom, and at least the current size if checkouts waited."""
+        size = max(2, math.ceil(self.in_use * 1.5))
+        return max(size, self.pool_size + 1) if self.slow_waits else size
+
+    @property
+    def recommended_overflow(self) -> int:
+        """Burst capacity on top of the recommended size."""
+        return max(2, math.ceil(self.recommended_size / 2))
+
+
+def _total(samples: dict[str, list[tuple[dict[str, str], float]]], name: str, **labels: str) -> float:
+    return sum(
+        value
+        for sample_labels, value in samples.get(name, [])
+        if all(sample_labels.get(key) == wanted for key, wanted in labels.items())
+    )
+
+
+def advise_pool_size(
+    before: str, after: str, interval: float, *, pool: str = PRIMARY_POOL, slow_wait: str = "0.025"
+) -> PoolAdvice:
+    """Compare two ``/metrics`` scrapes taken ``interval`` seconds apart, for one engine's pool.
+
+    The connections in use on average follow from Little's law: the hold time accumulated during
+    the interval divided by its length.
+
+    Args:
+        before: The first scrape.
+        after: The second scrape.
+        interval: Seconds between the scrapes.
+        pool: ``pool`` label of the engine to size.
+        slow_wait: Checkout wait bucket (``le`` label) above which a wait counts as slow.
+
+    Returns:
+        The observed load and the recommended sizes.
+    """
+    first, second = metrics.parse_metrics(before), metrics.parse_metrics(after)
+
+    def delta(name: str, **labels: str) -> float:
+        return _total(second, name, pool=pool, **labels) - _total(first, name, pool=pool, **labels)
+
+    checkouts = delta("db_pool_checkout_wait_seconds_count")
+    fast = delta("db_pool_checkout_wait_seconds_bucket", le=slow_wait)
+    routes = {
+        labels["route"]
+        for labels, _ in second.get("db_pool_connection_hold_seconds_sum", [])
+        if labels.get("pool") == pool
+    }
+    held = sorted(
+        ((route, delta("db_pool_connection_hold_seconds_sum", route=route)) for route in routes),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return PoolAdvice(
+        pool_size=int(_total(second, "db_pool_size", pool=pool)),
+        in_use=delta("db_pool_connection_hold_seconds_sum") / interval,
+        checkouts=int(checkouts),
+        slow_waits=int(checkouts - fast),
+        overflow_connects=int(delta("db_pool_overflow_connects_total")),
+        routes=[(route, seconds) for route, seconds in held if seconds > 0],
+    )
@@ -0,0 +1,138 @@
+"""Column-projected list queries for read-only list endpoints.
+
+``list_and_count`` followed by ``to_schema`` builds a full ORM instance per row (identity map,
+attribute instrumentation, relationship loaders) only to copy a few attributes into a msgspec
+struct. :class:`ProjectionServiceMixin` selects just the struct's columns and builds the structs
+straight from the result rows, either a page at a time or streamed over a server-side cursor.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+import msgspec
+from advanced_alchemy.filters import OrderBy, PaginationFilter, StatementFilter
+from sqlalchemy import ColumnElement, func, inspect, select
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from sqlalchemy import Select
+    from sqlalchemy.orm import InstrumentedAttribute, Mapper
+
+__all__ = ("ProjectionServiceMixin",)
+
+S = TypeVar("S", bound=msgspec.Struct)
+
+
+@cache
+def _projected_columns(model: type[Any], schema_type: type[msgspec.Struct]) -> tuple[InstrumentedAttribute[Any], ...]:
+    mapped = cast("Mapper[Any]", inspect(model)).column_attrs.keys()
+    if missing := [name for name in schema_type.__struct_fields__ if name not in mapped]:
+        msg = f"{schema_type.__name__} fields {missing} are not columns of {model.__name__}"
+        raise ValueError(msg)
+    return tuple(getattr(model, name) for name in schema_type.__struct_fields__)
+
+
+def _projected_statement(
+    model: Any,
+    schema_type: type[msgspec.Struct],
+    filters: tuple[StatementFilter | ColumnElement[bool], ...],
+    kwargs: dict[str, Any],
+) -> tuple[Select[Any], list[StatementFilter]]:
+    """Build the filtered column select, holding back pagination and ordering filters.
+
+    Returns:
+        The filtered statement and the pagination/ordering filters still to apply.
+    """
+    statement = select(*_projected_columns(model, schema_type)).filter_by(**kwargs)
+    page_filters: list[StatementFilter] = []
+    for filter_ in filters:
+        if isinstance(filter_, ColumnElement):
+            statement = statement.where(filter_)
+        elif isinstance(filter_, (PaginationFilter, OrderBy)):
+            page_filters.append(filter_)
+        else:
+            statement = filter_.append_to_statement(statement, model)
+    return statement, page_filters
+
+
+class ProjectionServiceMixin:
+    """Mixin for repository services that serve list pages without loading ORM instances.
+
+    Example:
+        ```python
+        items, total = await users_service.list_and_count_as(AdminUserSummary, *filters)
+        return users_service.to_schema(items, total, filters)
+        ```
+    """
+
+    async def list_and_count_as(
+        self,
+        schema_type: type[S],
+        *filters: StatementFilter | ColumnElement[bool],
+        **kwargs: Any,
+    ) -> tuple[list[S], int]:
+        """List rows as ``schema_type`` instances, selecting only the struct's columns.
+
+        Every field of ``schema_type`` must be a column of the service's model.
+
+        Args:
+            schema_type: The struct to build from each row.
+            *filters: Statement filters or where clauses, as for ``list_and_count``.
+            **kwargs: Column equality filters.
+
+        Returns:
+            The page of structs and the total number of matching rows.
+        """
+        repository = cast("Any", self).repository
+        model = repository.model_type
+        statement, page_filters = _projected_statement(model, schema_type, filters, kwargs)
+        matching = statement
+        statement = statement.add_columns(func.count().over())
+        for filter_ in page_filters:
+            statement = filter_.append_to_statement(statement, model)
+
+        rows = (await repository.session.execute(statement)).all()
+        if not rows:
+            total = await repository.session.scalar(select(func.count()).select_from(matching.subquery()))
+            return [], total or 0
+        names = schema_type.__struct_fields__
+        return [schema_type(**dict(zip(names, row, strict=False))) for row in rows], rows[0][-1]
+
+    async def stream_as(
+        self,
+        schema_type: type[S],
+        *filters: StatementFilter | ColumnElement[bool],
+        chunk_size: int = 1000,
+        **kwargs: Any,
+    ) -> AsyncGenerator[list[S], None]:
+        """Stream every matching row as ``schema_type`` instances over a server-side cursor.
+
+        Pagination filters are ignored so the full result set is returned; ordering filters
+        still apply. At most ``chunk_size`` rows are held in memory at a time.
+
+        Args:
+            schema_type: The struct to build from each row.
+            *filters: Statement filters or where clauses, as for ``list_and_count``.
+            chunk_size: Rows fetched from the cursor per round trip.
+            **kwargs: Column equality filters.
+
+        Yields:
+            Lists of at most ``chunk_size`` structs, in query order.
+        """
+        repository = cast("Any", self).repository
+        model = repository.model_type
+        statement, page_filters = _projected_statement(model, schema_type, filters, kwargs)
+        for filter_ in page_filters:
+            if isinstance(filter_, OrderBy):
+                statement = filter_.append_to_statement(statement, model)
+
+        names = schema_type.__struct_fields__
+        result = await repository.session.stream(statement.execution_options(yield_per=chunk_size))
+        try:
+            async for rows in result.partitions():
+                yield [schema_type(**dict(zip(names, row, strict=False))) for row in rows]
+        finally:
+            await result.close()
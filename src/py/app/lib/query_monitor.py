@@ -0,0 +1,240 @@
+"""Opt-in per-request SQL instrumentation for spotting N+1 patterns and slow statements.
+
+When ``DATABASE_QUERY_MONITOR`` is enabled the engine gets ``before_cursor_execute`` /
+``after_cursor_execute`` listeners that time every statement and file it under the request
+currently being served. :func:`QueryMonitorMiddleware` opens that per-request scope, binds a
+summary (statement count, time spent in the database, repeated statement shapes) to the structlog
+context so it lands on the request's log line, and warns when one shape runs often enough to look
+like a query per row. Statements slower than ``DATABASE_SLOW_QUERY_MS`` are logged on their own,
+with their ``EXPLAIN (ANALYZE, BUFFERS)`` plan when ``DATABASE_EXPLAIN_SLOW_QUERIES`` is set.
+
+This is meant for staging: the plan capture re-runs the slow statement.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from contextvars import ContextVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Final
+
+import structlog
+from litestar.enums import ScopeType
+from sqlalchemy import event
+from structlog.contextvars import bind_contextvars
+
+if TYPE_CHECKING:
+    from litestar.types.asgi_types import ASGIApp, Message, Receive, Scope, Send
+    from sqlalchemy.engine import Connection, ExecutionContext
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from app.lib.settings import DatabaseSettings
+
+__all__ = (
+    "QueryMonitorMiddleware",
+    "RequestQueries",
+    "current_request_queries",
+    "install_query_monitor",
+    "statement_shape",
+)
+
+logger = structlog.get_logger()
+
+_START_TIMES: Final = "query_monitor_start"
+_EXPLAIN_SAVEPOINT: Final = "query_monitor_explain"
+_EXPLAINABLE = re.compile(r"\A\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_NUMBER = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_current: ContextVar[RequestQueries | None] = ContextVar("query_monitor_request", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """Reduce a statement to its shape, so statements differing only in values compare equal.
+
+    Literals and bind placeholders of every paramstyle become ``?``, expanded ``IN`` lists of any
+    length become ``(?, ...)`` and whitespace is collapsed.
+
+    Args:
+        statement: The SQL sent to the driver.
+
+    Returns:
+        The normalised statement.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _VALUE_LIST.sub("(?, ...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class RequestQueries:
+    """Statements executed while serving one request, grouped by shape."""
+
+    __slots__ = ("duration_ms", "shapes", "slow")
+
+    def __init__(self) -> None:
+        self.shapes: Counter[str] = Counter()
+        self.duration_ms = 0.0
+        self.slow = 0
+
+    @property
+    def count(self) -> int:
+        """Total number of statements executed."""
+        return self.shapes.total()
+
+    def record(self, statement: str, elapsed_ms: float, *, slow: bool = False) -> None:
+        """Add one executed statement.
+
+        Args:
+            statement: The SQL sent to the driver.
+            elapsed_ms: Time the driver spent executing it.
+            slow: Whether it exceeded the slow statement threshold.
+        """
+        self.shapes[statement_shape(statement)] += 1
+        self.duration_ms += elapsed_ms
+        self.slow += slow
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Return the shapes executed at least ``threshold`` times, most frequent first."""
+        return {shape: count for shape, count in self.shapes.most_common() if count >= threshold}
+
+    def summary(self, threshold: int) -> dict[str, Any]:
+        """Summarise the request's database work for the log context.
+
+        Args:
+            threshold: Executions of one shape that count as repeated.
+
+        Returns:
+            Statement and distinct shape counts, total database time, slow statements and the
+            repeated shapes with their counts.
+        """
+        return {
+            "count": self.count,
+            "shapes": len(self.shapes),
+            "duration_ms": round(self.duration_ms, 2),
+            "slow": self.slow,
+            "repeated": self.repeated(threshold),
+        }
+
+
+def current_request_queries() -> RequestQueries | None:
+    """Return the statements recorded for the request being served, if the monitor is active."""
+    return _current.get()
+
+
+def _explain(conn: Connection, statement: str, parameters: Any) -> list[str] | None:
+    """Capture the plan of a slow statement on the connection and transaction that ran it.
+
+    The ``EXPLAIN`` runs inside a savepoint on a raw DBAPI cursor, so it neither fires the engine
+    events again nor leaves the caller's transaction aborted if it fails.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            plan = [row[0] for row in cursor.fetchall()]
+        except Exception:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            raise
+        cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Could not explain slow statement", reason=f"{type(e).__name__}: {e}")
+        return None
+    finally:
+        cursor.close()
+    return plan
+
+
+def install_query_monitor(engine: AsyncEngine, settings: DatabaseSettings) -> None:
+    """Attach the statement timing listeners to an engine.
+
+    Args:
+        engine: The engine built by :func:`app.utils.engine_factory.create_sqlalchemy_engine`.
+        settings: Database settings holding the thresholds.
+    """
+    slow_ms = settings.SLOW_QUERY_MS
+    explain = settings.EXPLAIN_SLOW_QUERIES and engine.dialect.name == "postgresql"
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn: Connection, *_: Any) -> None:  # pyright: ignore[reportUnusedFunction]
+        conn.info.setdefault(_START_TIMES, []).append(perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(  # pyright: ignore[reportUnusedFunction]
+        conn: Connection,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        elapsed_ms = (perf_counter() - conn.info[_START_TIMES].pop()) * 1000
+        slow = elapsed_ms >= slow_ms
+        queries = _current.get()
+        if queries is not None:
+            queries.record(statement, elapsed_ms, slow=slow)
+        if not slow:
+            return
+        plan = None
+        if explain and not executemany and _EXPLAINABLE.match(statement):
+            plan = _explain(conn, statement, parameters)
+        logger.warning(
+            "Slow statement",
+            duration_ms=round(elapsed_ms, 2),
+            statement=statement_shape(statement),
+            plan=plan,
+        )
+
+
+# Named like a class so that it reads properly in the middleware stack, as ``StructlogMiddleware`` does.
+def QueryMonitorMiddleware(app: ASGIApp) -> ASGIApp:  # noqa: N802
+    """Middleware collecting the statements each HTTP request executes.
+
+    The summary is bound to the structlog context when the response starts, so the request log
+    line carries it. Statements run after that (the autocommit ``COMMIT``) are included in the
+    repeated-shape warning, which is emitted once the request has finished.
+
+    Args:
+        app: The previous ASGI app in the call chain.
+
+    Returns:
+        A new ASGI app that records the request's statements.
+    """
+    from app.lib.settings import get_settings
+
+    threshold = get_settings().db.REPEATED_QUERY_THRESHOLD
+
+    async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != ScopeType.HTTP:
+            await app(scope, receive, send)
+            return
+
+        queries = RequestQueries()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                bind_contextvars(queries=queries.summary(threshold))
+            await send(message)
+
+        token = _current.set(queries)
+        try:
+            await app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            if repeated := queries.repeated(threshold):
+                await logger.awarning(
+                    "Repeated statements",
+                    method=scope["method"],
+                    path=scope["path"],
+                    count=queries.count,
+                    repeated=repeated,
+                )
+
+    return middleware
@@ -0,0 +1,121 @@
+"""Trigram-indexed text search for list endpoints.
+
+advanced-alchemy's ``search`` filter turns ``searchString`` into ``LIKE '%term%'`` clauses, which
+PostgreSQL can only answer with a sequential scan unless the columns have ``pg_trgm`` GIN indexes
+(``gin_trgm_ops`` serves both ``LIKE`` and ``ILIKE``). :class:`TrigramSearchFilter` keeps those
+clauses, so it matches exactly what the plain filter matched, and additionally orders the rows by
+``word_similarity`` so the closest matches come first, ahead of the endpoint's configured sort.
+
+A term shorter than a trigram has no trigrams to look up and would scan the whole index, so terms
+shorter than ``min_length`` are ignored, as if no search had been given. On other dialects, SQLite
+in the tests, the rank compiles to ``NULL`` and only the ``LIKE`` clauses apply.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from advanced_alchemy.filters import SearchFilter
+from litestar.di import Provide
+from litestar.params import Parameter
+from sqlalchemy import Float, Select, literal, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+if TYPE_CHECKING:
+    from advanced_alchemy.filters import ModelT, StatementTypeT
+    from sqlalchemy.sql.compiler import SQLCompiler
+
+__all__ = (
+    "MIN_SEARCH_LENGTH",
+    "TrigramSearchFilter",
+    "search_rank",
+    "trigram_search_dependency",
+)
+
+MIN_SEARCH_LENGTH: Final = 3
+"""Shortest term searched for: the length of a trigram."""
+
+
+class search_rank(FunctionElement[float]):  # noqa: N801
+    """Best ``word_similarity`` of a term within any of the given columns (``NULL`` off PostgreSQL)."""
+
+    type = Float()
+    name = "search_rank"
+    inherit_cache = True
+
+
+@compiles(search_rank)
+def _compile_search_rank(element: search_rank, compiler: SQLCompiler, **kw: Any) -> str:  # noqa: ARG001  # pyright: ignore[reportUnusedFunction]
+    return "NULL"
+
+
+@compiles(search_rank, "postgresql")
+def _compile_search_rank_postgresql(element: search_rank, compiler: SQLCompiler, **kw: Any) -> str:  # pyright: ignore[reportUnusedFunction]
+    term, *columns = element.clauses
+    similarities = [
+        f"word_similarity({compiler.process(term, **kw)}, {compiler.process(column, **kw)})" for column in columns
+    ]
+    return similarities[0] if len(similarities) == 1 else f"greatest({', '.join(similarities)})"
+
+
+@dataclass
+class TrigramSearchFilter(SearchFilter):
+    """:class:`~advanced_alchemy.filters.SearchFilter` ordered by similarity, ignoring short terms."""
+
+    min_length: int = MIN_SEARCH_LENGTH
+    """Terms shorter than this (after stripping whitespace) are not searched for."""
+
+    def append_to_statement(self, statement: StatementTypeT, model: type[ModelT]) -> StatementTypeT:
+        if len(self.value.strip()) < self.min_length:
+            return statement
+        search_clauses = self.get_search_clauses(model)
+        if not search_clauses:
+            return statement
+        columns = [
+            self._get_instrumented_attr(model, field_name)
+            for field_name in sorted(self.normalized_field_names)
+            if hasattr(model, field_name)
+        ]
+        statement = cast("StatementTypeT", statement.where(or_(*search_clauses)))
+        if isinstance(statement, Select):
+            statement = cast("StatementTypeT", statement.order_by(search_rank(literal(self.value), *columns).desc()))
+        return statement
+
+
+def trigram_search_dependency(fields: str, *, min_length: int = MIN_SEARCH_LENGTH) -> dict[str, Provide]:
+    """Replace the ``search`` filter of ``create_service_dependencies`` with :class:`TrigramSearchFilter`.
+
+    The query parameters stay the same (``searchString``, ``searchIgnoreCase``). Merge the result
+    into dependencies created with the same ``search`` fields::
+
+        dependencies = create_service_dependencies(..., filters={"search": "name,email", ...}) | (
+            trigram_search_dependency("name,email")
+        )
+
+    Args:
+        fields: Comma-separated model attributes to search, as for the ``search`` filter.
+        min_length: Shortest term that is searched for.
+
+    Returns:
+        The ``search_filter`` dependency.
+    """
+    field_names = set(fields.split(","))
+
+    def provide_search_filter(
+        search_string: str | None = Parameter(
+            title="Field to search", query="searchString", default=None, required=False
+        ),
+        ignore_case: bool | None = Parameter(
+            title="Search should be case sensitive", query="searchIgnoreCase", default=False, required=False
+        ),
+    ) -> SearchFilter:
+        return TrigramSearchFilter(
+            field_name=field_names,
+            value=search_string,  # type: ignore[arg-type]
+            ignore_case=ignore_case or False,
+            min_length=min_length,
+        )
+
+    return {"search_filter": Provide(provide_search_filter, sync_to_thread=False)}
@@ -0,0 +1,407 @@
+"""Request-scoped session routing.
+
+Sessions are :class:`RoutingSession` instances, provided by :class:`RoutingSQLAlchemyConfig`.
+
+Every session tracks whether it wrote: a flush, DML, ``SELECT ... FOR UPDATE`` or raw text marks
+it, and from then on all of its statements use the primary. The config's ``"autocommit"`` handler
+only commits (or rolls back) sessions that wrote. A session that only read is just closed, and the
+pool's reset-on-return ends its transaction, so it pays no flush or ``COMMIT``. A session that never
+executed anything never checks out a connection.
+
+Sessions of ``GET``/``HEAD`` requests are read-only: on PostgreSQL they run in ``READ ONLY``
+transactions, set through the driver (``BEGIN READ ONLY``) without an extra round trip. Such a
+session keeps the first connection it gets, on the primary or a replica, for every statement of
+the request. A flush, DML or ``SELECT ... FOR UPDATE`` in it raises
+:class:`~app.lib.exceptions.ReadOnlyTransactionError` instead of quietly opening a second, writable
+connection, and PostgreSQL rejects writes by raw SQL. Handlers that write on ``GET``, like the
+OAuth callbacks, opt out with ``opt={READ_ONLY_OPT: False}``.
+
+With ``DATABASE_REPLICA_URLS`` set, a session reads from a replica once it has been marked, either
+for ``GET``/``HEAD`` requests whose route handler opts in::
+
+    @get("/api/teams", opt={READ_REPLICA_OPT: True})
+
+or around explicitly read-only service calls::
+
+    with replica_reads(users_service.repository.session):
+        total = await users_service.count()
+
+Marked sessions send plain ``SELECT`` statements to one replica, picked round-robin and kept for the
+rest of the session, until the session writes. ``replica_reads`` does not move a read-only session
+off the connection it already has. A client that committed a write also reads from the
+primary for ``DATABASE_REPLICA_STICKY_SECONDS`` afterwards, keyed by its credential; this window is
+kept per worker process.
+
+Replica pools ping connections on checkout, and a replica whose connections fail is skipped for
+``DATABASE_REPLICA_COOLDOWN`` seconds before it is tried again; with no healthy replica the primary
+serves the reads.
+
+On PostgreSQL every transaction of a request session starts with ``SET LOCAL statement_timeout``,
+so a runaway statement gives its connection back instead of holding it for minutes. The budget
+comes from ``RoutingSQLAlchemyConfig.statement_timeouts``: ``"public"`` for requests without an
+authenticated user, ``"authenticated"`` otherwise. The authentication middleware loads the user
+through the request session before it sets ``scope["user"]``, so that lookup runs on the public
+budget; the budget is checked again before each statement and the transaction's timeout raised
+once the user is known. A route handler (or its controller) picks another budget or a number of
+milliseconds (``0`` for none)::
+
+    class AdminUsersController(Controller):
+        opt = {STATEMENT_TIMEOUT_OPT: "admin"}
+
+A statement cancelled by its timeout raises
+:class:`~app.lib.exceptions.StatementTimeoutError`, with the budget and the time the transaction
+had run, instead of advanced-alchemy's generic repository error.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Final
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
+from advanced_alchemy.extensions.litestar._utils import delete_aa_scope_state, get_aa_scope_state
+from advanced_alchemy.extensions.litestar.plugins.init.config.common import SESSION_TERMINUS_ASGI_EVENTS
+from litestar.constants import HTTP_RESPONSE_START
+from litestar.datastructures import Headers
+from litestar.enums import ScopeType
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import Executable
+
+from app.lib.cache import run_commit_invalidations
+from app.lib.exceptions import ReadOnlyTransactionError, StatementTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Coroutine, Iterator, Sequence
+
+    from litestar import Litestar
+    from litestar.datastructures import State
+    from litestar.types import Message, Scope
+    from sqlalchemy.engine import Connection, Dialect, ExceptionContext
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+    from sqlalchemy.orm import ORMExecuteState, SessionTransaction
+    from sqlalchemy.pool import ConnectionPoolEntry
+    from sqlalchemy.sql import ClauseElement
+
+__all__ = (
+    "READ_ONLY_OPT",
+    "READ_REPLICA_OPT",
+    "STATEMENT_TIMEOUT_OPT",
+    "ReplicaSet",
+    "RoutingSQLAlchemyConfig",
+    "RoutingSession",
+    "replica_reads",
+)
+
+READ_ONLY_OPT: Final = "read_only"
+"""Route handler ``opt`` key; ``False`` keeps ``GET`` requests to the handler out of read-only transactions."""
+READ_REPLICA_OPT: Final = "read_replica"
+"""Route handler ``opt`` key letting ``GET`` requests to the handler read from a replica."""
+STATEMENT_TIMEOUT_OPT: Final = "statement_timeout"
+"""Route handler ``opt`` key: a ``statement_timeouts`` budget name, or milliseconds, for the handler's statements."""
+
+_REPLICAS: Final = "replicas"
+_READ_REPLICA: Final = "read_replica"
+_READ_BIND: Final = "read_bind"
+_PINNED_BIND: Final = "pinned_bind"
+_READ_ONLY: Final = "read_only"
+_WROTE: Final = "wrote"
+_CLIENT: Final = "replica_client"
+_STATEMENT_TIMEOUT: Final = "statement_timeout"
+_STATEMENT_BUDGET: Final = "statement_budget"
+_TIMEOUT_CONNECTIONS: Final = "statement_timeout_connections"
+_QUERY_CANCELED: Final = "57014"
+_SAFE_METHODS: Final = frozenset({"GET", "HEAD"})
+_MAX_RECENT_WRITERS: Final = 10_000
+_READ_ONLY_ENGINES: dict[Engine, Engine] = {}
+
+
+class ReplicaSet:
+    """Replica engines, with round-robin selection, health tracking and read-your-writes windows."""
+
+    __slots__ = ("_down_until", "_engines", "_next", "_recent_writes", "cooldown", "sticky_seconds")
+
+    def __init__(self, engines: Sequence[AsyncEngine], *, sticky_seconds: int, cooldown: int) -> None:
+        self._engines = tuple(engines)
+        self._next = 0
+        self._down_until: dict[Engine, float] = {}
+        self._recent_writes: dict[str, float] = {}
+        self.sticky_seconds = sticky_seconds
+        self.cooldown = cooldown
+        for engine in self._engines:
+            self._watch(engine.sync_engine)
+
+    @property
+    def engines(self) -> tuple[AsyncEngine, ...]:
+        return self._engines
+
+    def choose(self) -> AsyncEngine | None:
+        """Return the next healthy replica, or ``None`` when every replica is cooling down."""
+        now = monotonic()
+        for _ in self._engines:
+            engine = self._engines[self._next % len(self._engines)]
+            self._next += 1
+            if self._down_until.get(engine.sync_engine, 0.0) <= now:
+                return engine
+        return None
+
+    def mark_down(self, engine: Engine) -> None:
+        """Skip a replica until its cooldown has passed."""
+        self._down_until[engine] = monotonic() + self.cooldown
+
+    def _watch(self, engine: Engine) -> None:
+        @event.listens_for(engine, "do_connect")
+        def _connect(  # pyright: ignore[reportUnusedFunction]
+            dialect: Dialect, _conn_rec: ConnectionPoolEntry, cargs: Any, cparams: Any
+        ) -> Any:
+            try:
+                return dialect.connect(*cargs, **cparams)
+            except Exception:
+                self.mark_down(engine)
+                raise
+
+        @event.listens_for(engine, "handle_error")
+        def _handle_error(context: ExceptionContext) -> None:  # pyright: ignore[reportUnusedFunction]
+            if context.is_disconnect:
+                self.mark_down(engine)
+
+    def note_write(self, client: str) -> None:
+        """Start the read-your-writes window of a client that committed a write."""
+        now = monotonic()
+        if len(self._recent_writes) >= _MAX_RECENT_WRITERS:
+            self._recent_writes = {key: until for key, until in self._recent_writes.items() if until > now}
+        self._recent_writes[client] = now + self.sticky_seconds
+
+    def is_sticky(self, client: str | None) -> bool:
+        """Check whether a client wrote recently enough that replicas may not have its write yet."""
+        return client is not None and self._recent_writes.get(client, 0.0) > monotonic()
+
+    async def dispose(self) -> None:
+        for engine in self._engines:
+            await engine.dispose()
+
+
+class RoutingSession(Session):
+    """Session tracking its writes and routing reads to a replica or a read-only connection."""
+
+    def get_bind(self, mapper: Any = None, *, clause: ClauseElement | None = None, **kw: Any) -> Engine | Connection:
+        if self.info.get(_READ_ONLY):
+            return self._pinned_bind(mapper, clause, **kw)
+        if self._flushing or (clause is not None and not _is_plain_select(clause)):
+            self.info[_WROTE] = True
+        elif clause is not None and not self.info.get(_WROTE):
+            if _READ_BIND not in self.info:
+                self.info[_READ_BIND] = self._read_bind(super().get_bind(mapper, clause=clause, **kw).engine)
+            read_bind: Engine | None = self.info[_READ_BIND]
+            if read_bind is not None:
+                return read_bind
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _pinned_bind(self, mapper: Any, clause: ClauseElement | None, **kw: Any) -> Engine:
+        if self._flushing or (clause is not None and _is_write(clause)):
+            raise ReadOnlyTransactionError
+        bind: Engine | None = self.info.get(_PINNED_BIND)
+        if bind is None:
+            primary = super().get_bind(mapper, clause=clause, **kw).engine
+            bind = self.info[_PINNED_BIND] = self._read_bind(primary) or primary
+        return bind
+
+    def _read_bind(self, primary: Engine) -> Engine | None:
+        replicas: ReplicaSet | None = self.info.get(_REPLICAS)
+        replica = replicas.choose() if replicas is not None and self.info.get(_READ_REPLICA) else None
+        if not self.info.get(_READ_ONLY):
+            return replica.sync_engine if replica is not None else None
+        engine = replica.sync_engine if replica is not None else primary
+        return _read_only_engine(engine) if engine.dialect.name == "postgresql" else engine
+
+
+def _read_only_engine(engine: Engine) -> Engine:
+    if (read_only := _READ_ONLY_ENGINES.get(engine)) is None:
+        read_only = _READ_ONLY_ENGINES[engine] = engine.execution_options(postgresql_readonly=True)
+    return read_only
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _after_commit(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    replicas: ReplicaSet | None = session.info.get(_REPLICAS)
+    client = session.info.get(_CLIENT)
+    if replicas is not None and client is not None and session.info.get(_WROTE):
+        replicas.note_write(client)
+
+
+def _statement_timeout(info: dict[Any, Any]) -> int:
+    timeout: int | Callable[[], int] = info.get(_STATEMENT_TIMEOUT, 0)
+    return timeout() if callable(timeout) else timeout
+
+
+def _apply_statement_timeout(session: Session, connection: Connection, started: float) -> None:
+    """Set the session's current budget on a connection of its transaction, if it changed."""
+    timeout = _statement_timeout(session.info)
+    connections: dict[Connection, tuple[int, float]] = session.info.setdefault(_TIMEOUT_CONNECTIONS, {})
+    applied = connections.get(connection, (0, started))[0]
+    connections[connection] = (timeout, started)
+    if timeout == applied:
+        return
+    connection.execution_options(**{_STATEMENT_BUDGET: (timeout, started) if timeout else None})
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout:d}")
+
+
+@event.listens_for(RoutingSession, "after_begin")
+def _after_begin(session: Session, _transaction: Any, connection: Connection) -> None:  # pyright: ignore[reportUnusedFunction]
+    if _STATEMENT_TIMEOUT in session.info:
+        _apply_statement_timeout(session, connection, monotonic())
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _do_orm_execute(state: ORMExecuteState) -> None:  # pyright: ignore[reportUnusedFunction]
+    _refresh_statement_timeouts(state.session)
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _before_flush(session: Session, _flush_context: Any, _instances: Any) -> None:  # pyright: ignore[reportUnusedFunction]
+    _refresh_statement_timeouts(session)
+
+
+def _refresh_statement_timeouts(session: Session) -> None:
+    connections: dict[Connection, tuple[int, float]] | None = session.info.get(_TIMEOUT_CONNECTIONS)
+    for connection, (_, started) in list((connections or {}).items()):
+        _apply_statement_timeout(session, connection, started)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _after_transaction_end(session: Session, transaction: SessionTransaction) -> None:  # pyright: ignore[reportUnusedFunction]
+    if transaction.parent is None:
+        session.info.pop(_TIMEOUT_CONNECTIONS, None)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_statement_timeout(context: ExceptionContext) -> StatementTimeoutError | None:  # pyright: ignore[reportUnusedFunction]
+    if context.connection is None or getattr(context.original_exception, "sqlstate", None) != _QUERY_CANCELED:
+        return None
+    budget: tuple[int, float] | None = context.connection.get_execution_options().get(_STATEMENT_BUDGET)
+    if budget is None:
+        return None
+    timeout, started = budget
+    return StatementTimeoutError(timeout_ms=timeout, elapsed_ms=round((monotonic() - started) * 1000))
+
+
+def _is_plain_select(clause: ClauseElement) -> bool:
+    return isinstance(clause, Executable) and clause.is_select and getattr(clause, "_for_update_arg", None) is None
+
+
+def _is_write(clause: ClauseElement) -> bool:
+    return clause.is_dml or getattr(clause, "_for_update_arg", None) is not None
+
+
+def _client_key(scope: Scope) -> str | None:
+    credential = Headers.from_scope(scope).get("authorization")
+    if not credential:
+        return None
+    return hashlib.blake2b(credential.encode(), digest_size=16).hexdigest()
+
+
+@contextmanager
+def replica_reads(session: AsyncSession | Session) -> Iterator[None]:
+    """Let the reads inside the block use a replica, unless the session's client wrote recently.
+
+    A no-op without replicas.
+    """
+    info = session.info
+    replicas: ReplicaSet | None = info.get(_REPLICAS)
+    previous = info.get(_READ_REPLICA, False)
+    info[_READ_REPLICA] = replicas is not None and not replicas.is_sticky(info.get(_CLIENT))
+    info.pop(_READ_BIND, None)
+    try:
+        yield
+    finally:
+        info[_READ_REPLICA] = previous
+        info.pop(_READ_BIND, None)
+
+
+def _autocommit_handler_maker(session_scope_key: str) -> Callable[[Message, Scope], Coroutine[Any, Any, None]]:
+    """Like advanced-alchemy's ``autocommit`` handler, but only for sessions that wrote.
+
+    Cache invalidations queued by committed transactions run before the response starts.
+    """
+    commit_range = range(200, 300)
+
+    async def handler(message: Message, scope: Scope) -> None:
+        session: AsyncSession | None = get_aa_scope_state(scope, session_scope_key)
+        try:
+            if session is not None and message["type"] == HTTP_RESPONSE_START:
+                if _has_writes(session):
+                    if message["status"] in commit_range:
+                        await session.commit()
+                    else:
+                        await session.rollback()
+                replicas: ReplicaSet | None = session.info.get(_REPLICAS)
+                await run_commit_invalidations(
+                    session, replica_lag=replicas.sticky_seconds if replicas is not None else 0
+                )
+        finally:
+            if session is not None and message["type"] in SESSION_TERMINUS_ASGI_EVENTS:
+                await session.close()
+                delete_aa_scope_state(scope, session_scope_key)
+
+    return handler
+
+
+def _has_writes(session: AsyncSession) -> bool:
+    if not isinstance(session.sync_session, RoutingSession):
+        return True
+    return bool(session.info.get(_WROTE) or session.new or session.dirty or session.deleted)
+
+
+@dataclass
+class RoutingSQLAlchemyConfig(SQLAlchemyAsyncConfig):
+    """SQLAlchemy config providing :class:`RoutingSession` request sessions."""
+
+    replicas: ReplicaSet | None = None
+    statement_timeouts: dict[str, int] = field(default_factory=dict[str, int])
+    """Statement timeout budgets in milliseconds by name; see :data:`STATEMENT_TIMEOUT_OPT`."""
+
+    def __post_init__(self) -> None:
+        autocommit = self.before_send_handler == "autocommit"
+        self.session_config.sync_session_class = RoutingSession
+        if self.replicas is not None:
+            self.session_config.info = {_REPLICAS: self.replicas}
+        super().__post_init__()
+        if autocommit:
+            self.before_send_handler = _autocommit_handler_maker(self.session_scope_key)
+
+    def provide_session(self, state: State, scope: Scope) -> AsyncSession:
+        session = super().provide_session(state, scope)
+        info = session.info
+        if _CLIENT in info or scope["type"] != ScopeType.HTTP:
+            return session
+        client = info[_CLIENT] = _client_key(scope)
+        opt = scope["route_handler"].opt
+        budget = opt.get(STATEMENT_TIMEOUT_OPT)
+        if budget is None:
+            timeouts = self.statement_timeouts
+            info[_STATEMENT_TIMEOUT] = lambda: timeouts.get("authenticated" if "user" in scope else "public", 0)
+        else:
+            info[_STATEMENT_TIMEOUT] = budget if isinstance(budget, int) else self.statement_timeouts.get(budget, 0)
+        safe = scope["method"] in _SAFE_METHODS
+        info[_READ_ONLY] = safe and opt.get(READ_ONLY_OPT, True) is not False
+        info[_READ_REPLICA] = (
+            safe
+            and self.replicas is not None
+            and bool(opt.get(READ_REPLICA_OPT))
+            and not self.replicas.is_sticky(client)
+        )
+        return session
+
+    @asynccontextmanager
+    async def lifespan(self, app: Litestar) -> AsyncGenerator[None, None]:
+        try:
+            async with super().lifespan(app):
+                yield
+        finally:
+            if self.replicas is not None:
+                await self.replicas.dispose()
@@ -0,0 +1,212 @@
+"""OpenTelemetry tracing, enabled by ``ENABLE_INSTRUMENTATION``.
+
+Spans cover Litestar requests (Litestar's OpenTelemetry middleware), SQL statements
+(:func:`instrument_engine`), SAQ jobs (:func:`start_job_span` / :func:`end_job_span`, continuing the
+trace that enqueued the job through ``job.meta``), outbound httpx calls such as the OAuth token
+exchanges (``opentelemetry-instrumentation-httpx``, when installed) and email sends
+(:func:`start_span`).
+
+OpenTelemetry is not a dependency of the app; install the ``opentelemetry`` extra
+(``app[opentelemetry]``) where tracing is wanted. The modules are imported only by
+:func:`configure_tracing`, and while tracing is off :func:`start_span` is a no-op, so nothing here
+costs anything by default. Tests pass an
+``InMemorySpanExporter`` to :func:`configure_tracing`, which also makes it easy to measure the
+overhead of tracing locally.
+"""
+
+from __future__ import annotations
+
+import importlib
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Final
+
+import structlog
+from sqlalchemy import event
+
+from app.lib.query_monitor import statement_shape
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from saq import Job
+    from sqlalchemy.engine import Connection, ExceptionContext
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from app.lib.settings import AppSettings
+
+__all__ = (
+    "configure_tracing",
+    "end_job_span",
+    "inject_job_context",
+    "instrument_engine",
+    "shutdown_tracing",
+    "start_job_span",
+    "start_span",
+)
+
+logger = structlog.get_logger()
+
+_SPANS: Final = "otel_spans"
+_JOB_SPAN: Final = "otel_span"
+_JOB_CONTEXT: Final = "otel_context"
+
+
+class _Tracing:
+    __slots__ = ("httpx_instrumentor", "provider", "tracer")
+
+    def __init__(self) -> None:
+        self.provider: Any = None
+        self.tracer: Any = None
+        self.httpx_instrumentor: Any = None
+
+
+_state = _Tracing()
+
+
+def _otel(module: str) -> Any:
+    return importlib.import_module(f"opentelemetry.{module}")
+
+
+def configure_tracing(settings: AppSettings, *, exporter: Any = None) -> Any:
+    """Create the tracer provider and start tracing, replacing any earlier configuration.
+
+    Args:
+        settings: Application settings with the sampling rate and exporter.
+        exporter: Span exporter to use instead of the configured one; spans are exported
+            synchronously to it, which is what tests with an ``InMemorySpanExporter`` want.
+
+    Returns:
+        The ``TracerProvider``, for Litestar's OpenTelemetry middleware.
+    """
+    shutdown_tracing()
+    sdk_trace = _otel("sdk.trace")
+    export = _otel("sdk.trace.export")
+    sampling = _otel("sdk.trace.sampling")
+    resources = _otel("sdk.resources")
+
+    provider = sdk_trace.TracerProvider(
+        resource=resources.Resource.create({"service.name": settings.slug, "service.version": settings.VERSION}),
+        sampler=sampling.ParentBased(sampling.TraceIdRatioBased(settings.TRACE_SAMPLE_PERCENT / 100)),
+    )
+    if exporter is not None:
+        provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    elif settings.TRACE_EXPORTER == "otlp":
+        otlp = _otel("exporter.otlp.proto.http.trace_exporter")
+        provider.add_span_processor(export.BatchSpanProcessor(otlp.OTLPSpanExporter()))
+    elif settings.TRACE_EXPORTER == "console":
+        provider.add_span_processor(export.BatchSpanProcessor(export.ConsoleSpanExporter()))
+
+    _state.provider = provider
+    _state.tracer = provider.get_tracer("app", settings.VERSION)
+    try:
+        _state.httpx_instrumentor = _otel("instrumentation.httpx").HTTPXClientInstrumentor()
+    except ImportError:
+        logger.info("opentelemetry-instrumentation-httpx is not installed; outbound HTTP calls are not traced")
+    else:
+        _state.httpx_instrumentor.instrument(tracer_provider=provider)
+    return provider
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and stop tracing."""
+    if _state.httpx_instrumentor is not None:
+        _state.httpx_instrumentor.uninstrument()
+    if _state.provider is not None:
+        _state.provider.shutdown()
+    _state.provider = _state.tracer = _state.httpx_instrumentor = None
+
+
+@contextmanager
+def start_span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Run the block in a child span of the current one, or do nothing while tracing is off.
+
+    Yields:
+        The span, or ``None`` when tracing is off.
+    """
+    if _state.tracer is None:
+        yield None
+        return
+    with _state.tracer.start_as_current_span(name, attributes=attributes) as span:
+        yield span
+
+
+def _before_cursor_execute(conn: Connection, _cursor: Any, statement: str, *_: Any) -> None:
+    if _state.tracer is None:
+        return
+    system = conn.engine.dialect.name
+    operation = statement.split(None, 1)[0].upper() if statement.strip() else "SQL"
+    span = _state.tracer.start_span(
+        f"{operation} {system}",
+        kind=_otel("trace").SpanKind.CLIENT,
+        attributes={"db.system": system, "db.operation": operation, "db.statement": statement_shape(statement)},
+    )
+    conn.info.setdefault(_SPANS, []).append(span)
+
+
+def _after_cursor_execute(conn: Connection, *_: Any) -> None:
+    if spans := conn.info.get(_SPANS):
+        spans.pop().end()
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    if context.connection is None or not (spans := context.connection.info.get(_SPANS)):
+        return
+    trace = _otel("trace")
+    span = spans.pop()
+    span.record_exception(context.original_exception)
+    span.set_status(trace.Status(trace.StatusCode.ERROR))
+    span.end()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record a span for every statement the engine executes; calling it again is a no-op.
+
+    Statements are recorded by shape (see :func:`~app.lib.query_monitor.statement_shape`), so bound
+    values never reach the trace backend.
+    """
+    if event.contains(engine.sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+async def inject_job_context(job: Job) -> None:
+    """Carry the enqueuing trace into the job, as a SAQ ``before_enqueue`` callback."""
+    if _state.tracer is None:
+        return
+    _otel("propagate").inject(job.meta)
+
+
+def start_job_span(job: Job, ctx: dict[str, Any]) -> None:
+    """Start the span of a job as the current span, continuing the trace that enqueued it."""
+    if _state.tracer is None:
+        return
+    trace = _otel("trace")
+    parent = _otel("propagate").extract(job.meta)
+    span = _state.tracer.start_span(
+        f"saq.job {job.function}",
+        context=parent,
+        kind=trace.SpanKind.CONSUMER,
+        attributes={
+            "messaging.system": "saq",
+            "messaging.destination.name": job.queue.name if job.queue else "",
+            "saq.job.function": job.function,
+            "saq.job.attempts": job.attempts,
+        },
+    )
+    ctx[_JOB_SPAN] = span
+    ctx[_JOB_CONTEXT] = _otel("context").attach(trace.set_span_in_context(span))
+
+
+def end_job_span(job: Job, ctx: dict[str, Any]) -> None:
+    """End the span started by :func:`start_job_span` with the job's final status."""
+    span = ctx.pop(_JOB_SPAN, None)
+    if span is None:
+        return
+    _otel("context").detach(ctx.pop(_JOB_CONTEXT))
+    span.set_attribute("saq.job.status", job.status.value)
+    if job.error:
+        trace = _otel("trace")
+        span.set_status(trace.Status(trace.StatusCode.ERROR, job.error.strip().splitlines()[-1]))
+    span.end()
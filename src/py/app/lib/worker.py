@@ -8,6 +8,9 @@ import structlog
 from saq import Status
 from saq.utils import seconds
 
+from app.lib.metrics import JOB_PICKUP, JOB_RUNTIME
+from app.lib.tracing import end_job_span, inject_job_context, start_job_span
+
 if TYPE_CHECKING:
     from saq import Job
     from saq.types import Context
@@ -37,6 +40,7 @@ async def on_shutdown(ctx: Context) -> None:
 async def on_startup(ctx: Context) -> None:
     """Startup events for each worker."""
     worker = cast("Any", ctx["worker"])
+    worker.queue.register_before_enqueue(inject_job_context)
     await logger.ainfo("🚀 Launching background workers for queue", queue=worker.queue.name)
 
 
@@ -46,6 +50,7 @@ async def before_process(ctx: Context) -> None:
     ctx_dict = cast("dict[str, Any]", ctx)
     job = cast("Job | None", ctx_dict.get("job"))
     if job:
+        start_job_span(job, ctx_dict)
         await logger.ainfo(f"starting job {job.function} with id {job.id}", task=job.function)
 
 
@@ -55,12 +60,16 @@ async def after_process(ctx: Context) -> None:
     ctx_dict = cast("dict[str, Any]", ctx)
     job = cast("Job | None", ctx_dict.get("job"))
     if job:
+        end_job_span(job, ctx_dict)
         log_ctx = {k: getattr(job, k) for k in LOGGED_JOB_FIELDS}
         # add duration measures
         log_ctx["pickup_time_ms"] = job.started - job.queued
         log_ctx["total_runtime_ms"] = job.completed - job.started
         log_ctx["total_time_ms"] = job.completed - job.queued
         total_runtime_ms = seconds(log_ctx["total_runtime_ms"])
+        queue_name = job.queue.name if job.queue else ""
+        JOB_PICKUP.observe(log_ctx["pickup_time_ms"] / 1000, queue_name, job.function)
+        JOB_RUNTIME.observe(total_runtime_ms, queue_name, job.function, job.status.value)
         if job.status == Status.FAILED:
             msg = f"job {job.function} with id '{job.id}' failed after {total_runtime_ms} seconds."
             await logger.aerror(msg, **log_ctx)
@@ -51,12 +51,14 @@ class ApplicationCore(InitPluginProtocol, CLIPluginProtocol):
     app_slug: str
 
     def on_cli_init(self, cli: Group) -> None:
-        from app.cli.commands import user_management_group
+        from app.cli.commands import diagnostics_group, perf_group, user_management_group
         from app.lib.settings import get_settings
 
         settings = get_settings()
         self.app_slug = settings.app.slug
         cli.add_command(user_management_group)
+        cli.add_command(diagnostics_group)
+        cli.add_command(perf_group)
 
     def on_app_init(self, app_config: AppConfig) -> AppConfig:
         """Configure application for use with SQLAlchemy.
@@ -170,6 +172,8 @@ class ApplicationCore(InitPluginProtocol, CLIPluginProtocol):
                 DashboardController,
             ],
         )
+        if settings.vite.serve_precompressed_assets:
+            app_config.route_handlers.append(settings.vite.get_assets_router())
         self._configure_signature_namespace(
             app_config,
             token=Token,
@@ -212,6 +216,7 @@ class ApplicationCore(InitPluginProtocol, CLIPluginProtocol):
         )
         self._configure_dependencies(app_config, provide_user=provide_user, provide_app_settings=provide_app_settings)
         self._configure_listeners(app_config, account_signals=account_signals, team_signals=team_signals)
+        self._configure_instrumentation(app_config, settings=settings)
         return app_config
 
     def _configure_openapi(
@@ -356,6 +361,48 @@ class ApplicationCore(InitPluginProtocol, CLIPluginProtocol):
         }
         app_config.dependencies.update(dependencies)
 
+    def _configure_instrumentation(self, app_config: AppConfig, *, settings: Settings) -> None:
+        if settings.db.CANCEL_ON_DISCONNECT:
+            from litestar.middleware import DefineMiddleware
+
+            from app.config import alchemy
+            from app.lib.disconnect import CancelOnDisconnectMiddleware
+
+            app_config.middleware.append(
+                DefineMiddleware(CancelOnDisconnectMiddleware, session_scope_key=alchemy.session_scope_key)
+            )
+        if settings.app.ENABLE_INSTRUMENTATION:
+            from litestar.contrib.opentelemetry import OpenTelemetryConfig
+
+            from app.lib.tracing import configure_tracing, instrument_engine, shutdown_tracing
+
+            provider = configure_tracing(settings.app)
+            instrument_engine(settings.db.get_engine())
+            if replicas := settings.db.get_replicas():
+                for engine in replicas.engines:
+                    instrument_engine(engine)
+            app_config.middleware.append(
+                OpenTelemetryConfig(tracer_provider=provider, exclude=["/health", "/metrics"]).middleware
+            )
+            app_config.on_shutdown.append(shutdown_tracing)
+        if settings.metrics.ENABLED:
+            from app.domain.system.controllers import MetricsController
+            from app.lib.deps import get_task_queue
+            from app.lib.metrics import MetricsMiddleware, watch_pool, watch_queue
+            from app.lib.pool import PRIMARY_POOL, replica_pool
+
+            app_config.route_handlers.append(MetricsController)
+            app_config.middleware.append(MetricsMiddleware)
+            watch_pool(settings.db.get_engine(), PRIMARY_POOL)
+            if replicas := settings.db.get_replicas():
+                for index, engine in enumerate(replicas.engines):
+                    watch_pool(engine, replica_pool(index))
+            watch_queue(get_task_queue)
+        if settings.db.QUERY_MONITOR:
+            from app.lib.query_monitor import QueryMonitorMiddleware
+
+            app_config.middleware.append(QueryMonitorMiddleware)
+
     def _configure_listeners(
         self,
         app_config: AppConfig,
@@ -1,84 +1,132 @@
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
 from litestar.serialization import decode_json, encode_json
 from sqlalchemy import NullPool, event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+from app.lib.pool import PRIMARY_POOL, InstrumentedAsyncAdaptedQueuePool
+
 if TYPE_CHECKING:
     from app.lib.settings import DatabaseSettings
 
 
-def create_sqlalchemy_engine(settings: "DatabaseSettings") -> "AsyncEngine":
+def _encode_json_text(value: Any) -> str:
+    """JSON as ``str``, which asyncpg's default ``json``/``jsonb`` codecs expect."""
+    return encode_json(value).decode()
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4().hex}__"
+
+
+def _set_asyncpg_json_codecs(  # pragma: no cover
+    dbapi_connection: Any,
+    _: Any,
+) -> Any:  # pragma: no cover
+    """Using msgspec for serialization of the json column values means that the
+    output is binary, not `str` like `json.dumps` would output.
+    SQLAlchemy expects that the json serializer returns `str` and calls `.encode()` on the value to
+    turn it to bytes before writing to the JSONB column. I'd need to either wrap `serialization.to_json` to
+    return a `str` so that SQLAlchemy could then convert it to binary, or do the following, which
+    changes the behaviour of the dialect to expect a binary value from the serializer.
+    See Also https://github.com/sqlalchemy/sqlalchemy/blob/14bfbadfdf9260a1c40f63b31641b27fe9de12a0/lib/sqlalchemy/dialects/postgresql/asyncpg.py#L934  pylint: disable=line-too-long
+    """
+
+    def encoder(bin_value: bytes) -> bytes:
+        return b"\x01" + bin_value
+
+    def decoder(bin_value: bytes) -> Any:
+        # the byte is the \x01 prefix for jsonb used by PostgreSQL.
+        # asyncpg returns it when format='binary'
+        return decode_json(bin_value[1:])
+
+    dbapi_connection.await_(
+        dbapi_connection.driver_connection.set_type_codec(
+            "jsonb",
+            encoder=encoder,
+            decoder=decoder,
+            schema="pg_catalog",
+            format="binary",
+        ),
+    )
+    dbapi_connection.await_(
+        dbapi_connection.driver_connection.set_type_codec(
+            "json",
+            encoder=encoder,
+            decoder=decoder,
+            schema="pg_catalog",
+            format="binary",
+        ),
+    )
+
+
+def _prepare_threshold(settings: "DatabaseSettings") -> int | None:
+    """Executions of a statement on one connection before psycopg prepares it server-side.
+
+    Prepared statements would not exist on the server connection PgBouncer picks for the next
+    transaction, so they are off in PgBouncer mode, as with a negative setting.
+    """
+    if settings.PGBOUNCER or settings.PREPARE_THRESHOLD < 0:
+        return None
+    return settings.PREPARE_THRESHOLD
+
+
+def _pool_kwargs(settings: "DatabaseSettings") -> dict[str, Any]:
+    """Pool arguments; pool sizing arguments are invalid with ``NullPool``."""
+    if settings.POOL_DISABLED or (settings.PGBOUNCER and not settings.PGBOUNCER_POOL_SIZE):
+        return {"poolclass": NullPool}
+    if settings.PGBOUNCER:
+        # PgBouncer does the pooling; a few warm connections only save the client handshake.
+        return {
+            "max_overflow": 0,
+            "pool_size": settings.PGBOUNCER_POOL_SIZE,
+            "pool_timeout": settings.POOL_TIMEOUT,
+            "pool_use_lifo": True,
+            "poolclass": InstrumentedAsyncAdaptedQueuePool,
+        }
+    return {
+        "max_overflow": settings.POOL_MAX_OVERFLOW,
+        "pool_size": settings.POOL_SIZE,
+        "pool_timeout": settings.POOL_TIMEOUT,
+        "pool_use_lifo": True,
+        "poolclass": InstrumentedAsyncAdaptedQueuePool,
+    }
+
+
+def create_sqlalchemy_engine(settings: "DatabaseSettings", *, pool_label: str = PRIMARY_POOL) -> "AsyncEngine":
     url = settings.URL.replace("postgresql://", "postgresql+psycopg://")
     if url.startswith("postgresql+asyncpg"):
         # Build engine kwargs - pool args are invalid with NullPool
         engine_kwargs: dict[str, Any] = {
             "url": url,
             "future": True,
-            "json_serializer": encode_json,
+            "json_serializer": _encode_json_text if settings.PGBOUNCER else encode_json,
             "json_deserializer": decode_json,
             "echo": settings.ECHO,
             "echo_pool": settings.ECHO_POOL,
             "pool_recycle": settings.POOL_RECYCLE,
             "pool_pre_ping": settings.POOL_PRE_PING,
         }
-        if settings.POOL_DISABLED:
-            engine_kwargs["poolclass"] = NullPool
-        else:
-            engine_kwargs.update(
-                {
-                    "max_overflow": settings.POOL_MAX_OVERFLOW,
-                    "pool_size": settings.POOL_SIZE,
-                    "pool_timeout": settings.POOL_TIMEOUT,
-                    "pool_use_lifo": True,
-                }
-            )
+        if settings.PGBOUNCER:
+            # A transaction pooler hands each transaction to any server connection, so statements
+            # prepared on one are unknown (or, with asyncpg's fixed names, different) on the next.
+            engine_kwargs["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            }
+        engine_kwargs.update(_pool_kwargs(settings))
         engine = create_async_engine(**engine_kwargs)
         """Database session factory.
 
         See [`async_sessionmaker()`][sqlalchemy.ext.asyncio.async_sessionmaker].
         """
 
-        @event.listens_for(engine.sync_engine, "connect")
-        def _sqla_on_connect(  # pragma: no cover # pyright: ignore[reportUnusedFunction]
-            dbapi_connection: Any,
-            _: Any,
-        ) -> Any:  # pragma: no cover
-            """Using msgspec for serialization of the json column values means that the
-            output is binary, not `str` like `json.dumps` would output.
-            SQLAlchemy expects that the json serializer returns `str` and calls `.encode()` on the value to
-            turn it to bytes before writing to the JSONB column. I'd need to either wrap `serialization.to_json` to
-            return a `str` so that SQLAlchemy could then convert it to binary, or do the following, which
-            changes the behaviour of the dialect to expect a binary value from the serializer.
-            See Also https://github.com/sqlalchemy/sqlalchemy/blob/14bfbadfdf9260a1c40f63b31641b27fe9de12a0/lib/sqlalchemy/dialects/postgresql/asyncpg.py#L934  pylint: disable=line-too-long
-            """
-
-            def encoder(bin_value: bytes) -> bytes:
-                return b"\x01" + bin_value
-
-            def decoder(bin_value: bytes) -> Any:
-                # the byte is the \x01 prefix for jsonb used by PostgreSQL.
-                # asyncpg returns it when format='binary'
-                return decode_json(bin_value[1:])
-
-            dbapi_connection.await_(
-                dbapi_connection.driver_connection.set_type_codec(
-                    "jsonb",
-                    encoder=encoder,
-                    decoder=decoder,
-                    schema="pg_catalog",
-                    format="binary",
-                ),
-            )
-            dbapi_connection.await_(
-                dbapi_connection.driver_connection.set_type_codec(
-                    "json",
-                    encoder=encoder,
-                    decoder=decoder,
-                    schema="pg_catalog",
-                    format="binary",
-                ),
-            )
+        # The binary codecs are installed with introspection queries on every new connection,
+        # which without a long-lived pool of our own means on every checkout.
+        if not settings.PGBOUNCER:
+            event.listen(engine.sync_engine, "connect", _set_asyncpg_json_codecs)
 
     elif url.startswith("sqlite+aiosqlite"):
         engine = create_async_engine(
@@ -123,16 +171,16 @@ def create_sqlalchemy_engine(settings: "DatabaseSettings") -> "AsyncEngine":
             "pool_recycle": settings.POOL_RECYCLE,
             "pool_pre_ping": settings.POOL_PRE_PING,
         }
-        if settings.POOL_DISABLED:
-            engine_kwargs["poolclass"] = NullPool
-        else:
-            engine_kwargs.update(
-                {
-                    "max_overflow": settings.POOL_MAX_OVERFLOW,
-                    "pool_size": settings.POOL_SIZE,
-                    "pool_timeout": settings.POOL_TIMEOUT,
-                    "pool_use_lifo": True,
-                }
-            )
+        if url.startswith("postgresql+psycopg"):
+            # JSON already goes through msgspec here: SQLAlchemy registers ``json_serializer`` and
+            # ``json_deserializer`` as the dumps/loads of psycopg's adapters, which accept bytes.
+            engine_kwargs["connect_args"] = {"prepare_threshold": _prepare_threshold(settings)}
+        engine_kwargs.update(_pool_kwargs(settings))
         engine = create_async_engine(**engine_kwargs)
+    if isinstance(engine.pool, InstrumentedAsyncAdaptedQueuePool):
+        engine.pool.label = pool_label
+    if settings.QUERY_MONITOR:
+        from app.lib.query_monitor import install_query_monitor
+
+        install_query_monitor(engine, settings)
     return engine
@@ -0,0 +1,104 @@
+"""Streaming fixture loading.
+
+``advanced_alchemy.utils.fixtures.open_fixture_async`` reads a whole JSON array into memory
+and ``upsert_many`` matches it row by row. For large fixtures, :func:`iter_fixture_chunks`
+streams ``<name>.jsonl`` (optionally gzipped) a chunk at a time and :func:`bulk_upsert` writes
+each chunk with a single ``INSERT ... ON CONFLICT DO UPDATE``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import DeclarativeBase
+
+__all__ = ("bulk_upsert", "iter_fixture_chunks")
+
+_decoder = msgspec.json.Decoder(dict[str, Any])
+
+
+def _open(path: Path) -> Any:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def iter_fixture_chunks(fixtures_path: Path, name: str, chunk_size: int = 5000) -> Iterator[list[dict[str, Any]]]:
+    """Read the ``name`` fixture in chunks of at most ``chunk_size`` rows.
+
+    ``<name>.jsonl`` / ``<name>.jsonl.gz`` files are streamed line by line. ``<name>.json`` /
+    ``<name>.json.gz`` arrays are still parsed whole, then chunked.
+
+    Args:
+        fixtures_path: The fixture directory.
+        name: The fixture name, without suffix.
+        chunk_size: Rows per chunk.
+
+    Raises:
+        FileNotFoundError: If no fixture file with a supported suffix exists.
+
+    Yields:
+        Lists of fixture rows.
+    """
+    for suffix in (".jsonl", ".jsonl.gz"):
+        path = fixtures_path / f"{name}{suffix}"
+        if path.exists():
+            chunk: list[dict[str, Any]] = []
+            with _open(path) as handle:
+                for line in handle:
+                    if line.strip():
+                        chunk.append(_decoder.decode(line))
+                    if len(chunk) >= chunk_size:
+                        yield chunk
+                        chunk = []
+            if chunk:
+                yield chunk
+            return
+    for suffix in (".json", ".json.gz"):
+        path = fixtures_path / f"{name}{suffix}"
+        if path.exists():
+            with _open(path) as handle:
+                rows = json.load(handle)
+            for start in range(0, len(rows), chunk_size):
+                yield rows[start : start + chunk_size]
+            return
+    msg = f"Could not find the {name} fixture in {fixtures_path}"
+    raise FileNotFoundError(msg)
+
+
+async def bulk_upsert(
+    session: AsyncSession,
+    model: type[DeclarativeBase],
+    rows: list[dict[str, Any]],
+    *,
+    index_elements: list[str],
+) -> None:
+    """Insert ``rows`` or update the rows that conflict on ``index_elements``.
+
+    Every column present in the rows, other than the conflict columns, is overwritten and
+    ``updated_at`` is bumped. Column defaults (ids, audit timestamps) apply to new rows.
+
+    Args:
+        session: The session to execute on; the caller commits.
+        model: The mapped class to upsert into.
+        rows: Column-keyed rows, all with the same keys.
+        index_elements: Columns of the unique constraint to match on.
+    """
+    if not rows:
+        return
+    statement = insert(model)
+    updates: dict[str, Any] = {column: statement.excluded[column] for column in rows[0] if column not in index_elements}
+    if "updated_at" in model.__table__.c:
+        updates["updated_at"] = func.now()
+    await session.execute(statement.on_conflict_do_update(index_elements=index_elements, set_=updates), rows)
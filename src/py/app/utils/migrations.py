@@ -0,0 +1,278 @@
+"""Online-safe schema changes for Alembic migrations.
+
+A plain ``CREATE INDEX`` blocks writes to the table for the whole build, and an ``ALTER TABLE``
+that queues behind a long transaction for its ``ACCESS EXCLUSIVE`` lock blocks every query that
+arrives after it. On a table the size of ``audit_log`` either is an outage. The helpers here are
+meant to be called from a migration's ``schema_upgrades``/``data_upgrades``:
+
+* :func:`create_index_concurrently` / :func:`drop_index_concurrently` build and drop indexes
+  without blocking writes, outside any transaction, replacing an ``INVALID`` index left behind by
+  a failed earlier build. They run without ``lock_timeout``: a concurrent build waits for every
+  older transaction (a long export stream, say) without blocking anyone, and timing it out would
+  only leave an ``INVALID`` index to rebuild from scratch.
+* :func:`guarded` runs DDL that takes ``ACCESS EXCLUSIVE`` locks with a short ``lock_timeout``
+  and retries it with exponential backoff when it could not get its locks, so it gives way to
+  running transactions instead of stalling the queries behind it.
+* :func:`backfill` updates rows in primary key ordered batches, each committed on its own, pausing
+  between batches so replicas and autovacuum keep up.
+
+``env.py`` applies ``DATABASE_MIGRATION_LOCK_TIMEOUT`` and ``DATABASE_MIGRATION_STATEMENT_TIMEOUT``
+to the migration connection (:func:`timeout_statements`) and commits each migration on its own.
+On other dialects the helpers fall back to the plain operations.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import TYPE_CHECKING, Any, Final, TypeVar
+
+import structlog
+from alembic import op
+from sqlalchemy import select, text, update
+from sqlalchemy.exc import DBAPIError
+
+from app.lib.settings import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+    from sqlalchemy import ColumnElement, Table, TableClause
+
+    from app.lib.settings import DatabaseSettings
+
+__all__ = (
+    "backfill",
+    "create_index_concurrently",
+    "drop_index_concurrently",
+    "guarded",
+    "timeout_statements",
+)
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+_RETRIED_SQLSTATES: Final = frozenset({"55P03", "40P01"})
+"""``lock_not_available`` (``lock_timeout`` expired) and ``deadlock_detected``."""
+
+_INVALID_INDEX = text(
+    "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE c.relname = :name AND c.relnamespace = current_schema()::regnamespace AND NOT i.indisvalid"
+)
+
+
+def timeout_statements(
+    settings: DatabaseSettings, *, lock_timeout: int | None = None, statement_timeout: int | None = None
+) -> list[str]:
+    """``SET`` statements applying the migration timeouts (in milliseconds) to a PostgreSQL session.
+
+    Args:
+        settings: Database settings with the defaults.
+        lock_timeout: Overrides ``MIGRATION_LOCK_TIMEOUT``.
+        statement_timeout: Overrides ``MIGRATION_STATEMENT_TIMEOUT``.
+
+    Returns:
+        The statements.
+    """
+    lock_timeout = settings.MIGRATION_LOCK_TIMEOUT if lock_timeout is None else lock_timeout
+    statement_timeout = settings.MIGRATION_STATEMENT_TIMEOUT if statement_timeout is None else statement_timeout
+    return [f"SET lock_timeout = {lock_timeout:d}", f"SET statement_timeout = {statement_timeout:d}"]
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _in_autocommit() -> bool:
+    context = op.get_context()
+    return not context.as_sql and context.bind is not None and context.bind.get_isolation_level() == "AUTOCOMMIT"
+
+
+@contextmanager
+def _autocommit() -> Iterator[None]:
+    """Leave the migration's transaction unless already outside one (PostgreSQL only).
+
+    Offline there is no way to tell, and the migration template already wraps every migration in
+    an autocommit block, so nothing is emitted.
+    """
+    if not _is_postgresql() or op.get_context().as_sql or _in_autocommit():
+        yield
+        return
+    with op.get_context().autocommit_block():
+        yield
+
+
+@contextmanager
+def _timeouts(lock_timeout: int | None, statement_timeout: int | None) -> Iterator[None]:
+    if not _is_postgresql():
+        yield
+        return
+    settings = get_settings().db
+    for statement in timeout_statements(settings, lock_timeout=lock_timeout, statement_timeout=statement_timeout):
+        op.execute(statement)
+    try:
+        yield
+    finally:
+        for statement in timeout_statements(settings):
+            op.execute(statement)
+
+
+def guarded(
+    operation: Callable[[], T],
+    *,
+    lock_timeout: int | None = None,
+    statement_timeout: int | None = None,
+    attempts: int | None = None,
+    backoff: float = 1.0,
+) -> T:
+    """Run ``operation`` with a short ``lock_timeout``, retrying while it cannot get its locks.
+
+    Each failed attempt waits ``backoff * 2 ** (attempt - 1)`` seconds before the next. Inside a
+    transaction every attempt runs in a savepoint, so a failed one can be retried; in an
+    autocommit block each statement commits on its own, so ``operation`` should be a single
+    statement or safe to repeat.
+
+    Args:
+        operation: Callable issuing the DDL, typically a lambda around an ``op`` call.
+        lock_timeout: Milliseconds to wait for locks; defaults to ``DATABASE_MIGRATION_LOCK_TIMEOUT``.
+        statement_timeout: Milliseconds the statement may run; defaults to
+            ``DATABASE_MIGRATION_STATEMENT_TIMEOUT``.
+        attempts: Tries before giving up; defaults to ``DATABASE_MIGRATION_LOCK_RETRIES``.
+        backoff: Seconds to wait after the first failed attempt.
+
+    Returns:
+        What ``operation`` returned.
+    """
+    attempts = get_settings().db.MIGRATION_LOCK_RETRIES if attempts is None else attempts
+    context = op.get_context()
+    with _timeouts(lock_timeout, statement_timeout):
+        if context.as_sql:
+            return operation()
+        attempt = 1
+        while True:
+            savepoint = nullcontext() if _in_autocommit() or context.bind is None else context.bind.begin_nested()
+            try:
+                with savepoint:
+                    return operation()
+            except DBAPIError as exc:
+                if getattr(exc.orig, "sqlstate", None) not in _RETRIED_SQLSTATES or attempt >= attempts:
+                    raise
+                delay = backoff * 2 ** (attempt - 1)
+                logger.warning("Migration statement could not get its locks, retrying", attempt=attempt, delay=delay)
+                time.sleep(delay)
+                attempt += 1
+
+
+def _drop_invalid_index(index_name: str, table_name: str) -> None:
+    context = op.get_context()
+    if (
+        context.as_sql
+        or context.bind is None
+        or context.bind.execute(_INVALID_INDEX, {"name": index_name}).first() is None
+    ):
+        return
+    logger.warning("Dropping invalid index left by a failed concurrent build", index=index_name)
+    op.drop_index(index_name, table_name=table_name, if_exists=True, postgresql_concurrently=True)
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    *,
+    unique: bool = False,
+    where: str | None = None,
+    **kw: Any,
+) -> None:
+    """Build an index with ``CREATE INDEX CONCURRENTLY``, without blocking writes.
+
+    The build runs with ``lock_timeout = 0``, waiting as long as older transactions need.
+
+    Args:
+        index_name: Name of the index.
+        table_name: Table to index.
+        columns: Columns (or expressions) to index.
+        unique: Whether the index is unique.
+        where: Predicate of a partial index, as SQL.
+        **kw: Further dialect options for ``op.create_index``, e.g. ``postgresql_using``.
+    """
+    predicate = text(where) if where else None
+    with _autocommit(), _timeouts(lock_timeout=0, statement_timeout=None):
+        _drop_invalid_index(index_name, table_name)
+        op.create_index(
+            index_name,
+            table_name,
+            list(columns),
+            unique=unique,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+            postgresql_where=predicate,
+            sqlite_where=predicate,
+            **kw,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index with ``DROP INDEX CONCURRENTLY``, without blocking reads or writes.
+
+    Like :func:`create_index_concurrently`, the drop runs with ``lock_timeout = 0``.
+
+    Args:
+        index_name: Name of the index.
+        table_name: Table of the index.
+    """
+    with _autocommit(), _timeouts(lock_timeout=0, statement_timeout=None):
+        op.drop_index(index_name, table_name=table_name, if_exists=True, postgresql_concurrently=True)
+
+
+def backfill(
+    table: Table | TableClause,
+    values: dict[str, Any],
+    where: ColumnElement[bool],
+    *,
+    key: str = "id",
+    batch_size: int = 5_000,
+    pause: float = 0.1,
+) -> int:
+    """Update the rows matching ``where`` in batches, committing and pausing after each.
+
+    Batches follow the ``key`` column, so every row is visited once and each batch reads only the
+    rows after the previous one. Rows changed by the application while the backfill runs are
+    picked up if they still match when their batch is reached. Offline (``--sql``), a single
+    ``UPDATE`` is emitted instead.
+
+    Args:
+        table: The table, e.g. ``sa.table("audit_log", sa.column("id"), ...)``.
+        values: Column values or SQL expressions to set.
+        where: Rows to update; should stop matching once updated.
+        key: Unique, ordered column to batch by.
+        batch_size: Rows per batch (and transaction).
+        pause: Seconds to sleep between batches.
+
+    Returns:
+        The number of rows updated.
+    """
+    column = table.c[key]
+    context = op.get_context()
+    if context.as_sql:
+        op.execute(update(table).where(where).values(values))
+        return 0
+    total = 0
+    last: Any = None
+    with _autocommit():
+        bind = op.get_bind()
+        while True:
+            batch = select(column).where(where).order_by(column).limit(batch_size)
+            if last is not None:
+                batch = batch.where(column > last)
+            keys = list(bind.execute(batch).scalars())
+            if not keys:
+                break
+            guarded(partial(bind.execute, update(table).where(column.in_(keys)).values(values)))
+            total, last = total + len(keys), keys[-1]
+            logger.info("Backfilled batch", table=table.name, rows=total)
+            if pause:
+                time.sleep(pause)
+    return total
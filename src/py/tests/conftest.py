@@ -24,7 +24,7 @@ os.environ.update(
 import pytest
 from advanced_alchemy.base import UUIDAuditBase
 from litestar_email import EmailConfig, EmailService, InMemoryBackend
-from sqlalchemy import URL
+from sqlalchemy import URL, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
@@ -106,6 +106,8 @@ async def fx_db_schema(engine: AsyncEngine) -> AsyncGenerator[None, None]:
     """
     metadata = UUIDAuditBase.registry.metadata
     async with engine.begin() as conn:
+        # The trigram search indexes need pg_trgm, which migrations install.
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(metadata.create_all)
     yield
     async with engine.begin() as conn:
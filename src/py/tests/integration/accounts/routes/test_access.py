@@ -538,6 +538,54 @@ async def test_get_current_user_fixture(authenticated_client: AsyncTestClient, t
     assert "hashedPassword" not in user_data
 
 
+@pytest.mark.anyio
+async def test_get_profile_conditional(authenticated_client: AsyncTestClient) -> None:
+    """Test that the profile revalidates with ETags and changes after an update."""
+    response = await authenticated_client.get("/api/me")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    not_modified = await authenticated_client.get("/api/me", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+
+    await authenticated_client.patch("/api/me", json={"name": "Renamed User"})
+
+    modified = await authenticated_client.get("/api/me", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.json()["name"] == "Renamed User"
+
+
+@pytest.mark.anyio
+async def test_get_profile_etag_follows_oauth_accounts(
+    authenticated_client: AsyncTestClient, session: AsyncSession, test_user: m.User, test_team: m.Team
+) -> None:
+    """Test that linking or unlinking an OAuth account changes the profile ETag.
+
+    ``test_team`` gives the user a membership, whose team is part of the version too.
+    """
+    response = await authenticated_client.get("/api/me")
+    assert response.status_code == 200
+    assert response.json()["teams"]
+    unlinked = response.headers["etag"]
+
+    account = m.UserOAuthAccount(
+        user_id=test_user.id, oauth_name="github", account_id="42", account_email=test_user.email, access_token="x"
+    )
+    session.add(account)
+    await session.commit()
+
+    linked = await authenticated_client.get("/api/me", headers={"If-None-Match": unlinked})
+    assert linked.status_code == 200
+    assert [item["oauthName"] for item in linked.json()["oauthAccounts"]] == ["github"]
+
+    await session.delete(account)
+    await session.commit()
+
+    relinked = await authenticated_client.get("/api/me", headers={"If-None-Match": linked.headers["etag"]})
+    assert relinked.status_code == 200
+    assert relinked.json()["oauthAccounts"] == []
+
+
 @pytest.mark.anyio
 async def test_update_profile_success(
     client: AsyncClient,
@@ -0,0 +1,134 @@
+"""SQL statement budgets for the user-loading endpoints.
+
+Each route loads users with a named loader profile (see :mod:`app.domain.accounts.loaders`), so these
+counts only change when a profile or the route's own queries change.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.db import models as m
+from app.lib.crypt import get_password_hash
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_login_queries(client: AsyncClient, test_user: m.User, test_team: m.Team, queries: list[str]) -> None:
+    queries.clear()
+    response = await client.post(
+        "/api/access/login",
+        data={"username": test_user.email, "password": "TestPassword123!"},
+    )
+
+    assert response.status_code == 201
+    # user, roles, team memberships; then the refresh token insert and reload
+    assert len(queries) == 5
+
+
+async def test_refresh_queries(authenticated_client: AsyncClient, test_team: m.Team, queries: list[str]) -> None:
+    queries.clear()
+    response = await authenticated_client.post("/api/access/refresh")
+
+    assert response.status_code == 201
+    # ten for refresh token rotation, three for the USER_AUTH reload
+    assert len(queries) == 13
+
+
+async def test_profile_queries(authenticated_client: AsyncClient, test_team: m.Team, queries: list[str]) -> None:
+    queries.clear()
+    response = await authenticated_client.get("/api/me")
+
+    assert response.status_code == 200
+    assert response.json()["teams"][0]["teamName"] == test_team.name
+    # USER_PROFILE: user, roles, team memberships, oauth accounts
+    assert len(queries) == 4
+
+
+async def test_team_detail_queries(authenticated_client: AsyncClient, test_team: m.Team, queries: list[str]) -> None:
+    queries.clear()
+    response = await authenticated_client.get(f"/api/teams/{test_team.id}")
+
+    assert response.status_code == 200
+    assert len(queries) == 7
+
+
+async def test_verify_email_queries(
+    client: AsyncClient,
+    test_verification_token: m.EmailVerificationToken,
+    queries: list[str],
+) -> None:
+    queries.clear()
+    response = await client.post(
+        "/api/email-verification/verify",
+        json={"token": test_verification_token.raw_token},  # type: ignore[attr-defined]
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["isVerified"] is True
+    assert len(queries) == 15
+
+
+@pytest.fixture(name="admin_client")
+async def fx_admin_client(client: AsyncClient, session: AsyncSession) -> AsyncClient:
+    admin = m.User(
+        email="admin.queries@example.com",
+        name="Admin",
+        hashed_password=await get_password_hash("TestPassword123!"),
+        is_active=True,
+        is_verified=True,
+        is_superuser=True,
+    )
+    session.add(admin)
+    await session.commit()
+    login = await client.post(
+        "/api/access/login",
+        data={"username": admin.email, "password": "TestPassword123!"},
+    )
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+    return client
+
+
+async def test_admin_user_detail_queries(
+    admin_client: AsyncClient,
+    test_user: m.User,
+    test_team: m.Team,
+    queries: list[str],
+) -> None:
+    queries.clear()
+    response = await admin_client.get(f"/api/admin/users/{test_user.id}")
+
+    assert response.status_code == 200
+    assert response.json()["teams"] == [test_team.name]
+    assert len(queries) == 7
+
+
+async def test_admin_user_list_queries(
+    admin_client: AsyncClient,
+    test_user: m.User,
+    test_team: m.Team,
+    queries: list[str],
+) -> None:
+    queries.clear()
+    response = await admin_client.get("/api/admin/users/", params={"pageSize": 10})
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
+    assert {item["email"] for item in response.json()["items"]} == {test_user.email, "admin.queries@example.com"}
+    # USER_AUTH for the admin, then one projected select with a windowed count
+    assert len(queries) == 4
+
+
+async def test_profile_update_queries(authenticated_client: AsyncClient, test_team: m.Team, queries: list[str]) -> None:
+    queries.clear()
+    response = await authenticated_client.patch("/api/me", json={"name": "Renamed"})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["teams"][0]["teamName"] == test_team.name
+    assert len(queries) == 12
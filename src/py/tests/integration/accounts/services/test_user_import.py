@@ -0,0 +1,69 @@
+"""Tests for the bulk user import."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import undefer_group
+
+from app import config
+from app.cli._user_import import import_users
+from app.db import models as m
+from app.lib.crypt import get_password_hash, verify_password
+from tests.factories import RoleFactory, UserFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+pytestmark = [pytest.mark.anyio, pytest.mark.integration, pytest.mark.services]
+
+
+async def test_import_users_copies_and_merges(
+    session: AsyncSession,
+    engine: AsyncEngine,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(config.alchemy, "engine_instance", engine)
+    default_role = RoleFactory.build(name="Application Access", slug="user")
+    admin_role = RoleFactory.build(name="Superuser", slug="superuser")
+    existing = UserFactory.build(email="existing@example.com", username="taken")
+    session.add_all([default_role, admin_role, existing])
+    await session.commit()
+    legacy_hash = await get_password_hash("Legacy-Secret-42!")
+    source = tmp_path / "users.csv"
+    source.write_text(
+        "email,name,username,password,hashed_password,roles\n"
+        "alice@example.com,Alice,alice,Correct-Horse-9!,,\n"
+        f"bob@example.com,Bob,,,{legacy_hash},superuser;user\n"
+        "existing@example.com,Existing,,,,\n"
+        "carol@example.com,Carol,taken,,,\n"
+        "alice@example.com,Alice Again,,,,\n"
+        "not-an-email,Nobody,,,,\n"
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stats = await import_users(source, import_format="csv", batch_size=2, executor=executor, workers=2)
+
+    assert (stats.read, stats.imported, stats.skipped, stats.invalid) == (6, 2, 2, 2)
+    assert [line for line, _ in stats.errors] == [6, 7]
+    users = {
+        user.email: user for user in await session.scalars(select(m.User).options(undefer_group("security_sensitive")))
+    }
+    assert set(users) == {"alice@example.com", "bob@example.com", "existing@example.com"}
+    assert await verify_password("Correct-Horse-9!", users["alice@example.com"].hashed_password or "")
+    assert users["bob@example.com"].hashed_password == legacy_hash
+    assert users["existing@example.com"].name == existing.name
+    assignments = (await session.execute(select(m.UserRole.user_id, m.UserRole.role_id))).all()
+    assert sorted((row.user_id, row.role_id) for row in assignments) == sorted(
+        [
+            (users["alice@example.com"].id, default_role.id),
+            (users["bob@example.com"].id, admin_role.id),
+            (users["bob@example.com"].id, default_role.id),
+        ]
+    )
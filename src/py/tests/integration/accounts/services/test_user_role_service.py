@@ -0,0 +1,37 @@
+"""Tests for UserRoleService."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+
+from app.db import models as m
+from tests.factories import RoleFactory, UserFactory, UserRoleFactory
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.domain.accounts.services import UserRoleService
+
+pytestmark = [pytest.mark.anyio, pytest.mark.integration, pytest.mark.services]
+
+
+async def test_assign_role_to_active_users_is_set_based_and_idempotent(
+    session: AsyncSession,
+    user_role_service: UserRoleService,
+) -> None:
+    role = RoleFactory.build()
+    users = [UserFactory.build(is_active=True) for _ in range(7)]
+    inactive = UserFactory.build(is_active=False)
+    session.add_all([role, *users, inactive])
+    await session.flush()
+    session.add(UserRoleFactory.build(user_id=users[0].id, role_id=role.id))
+    await session.commit()
+
+    assert await user_role_service.assign_role_to_active_users(role.id, chunk_size=3) == 6
+    assert await user_role_service.assign_role_to_active_users(role.id, chunk_size=3) == 0
+
+    holders = await session.scalars(select(m.UserRole.user_id).where(m.UserRole.role_id == role.id))
+    assert sorted(holders) == sorted(user.id for user in users)
@@ -623,3 +623,49 @@ async def test_update_user(session: AsyncSession, user_service: UserService) ->
 
     assert updated_user.name == "Updated Name"
     assert updated_user.id == user.id
+
+
+async def test_list_and_count_as_matches_orm_listing(session: AsyncSession, user_service: UserService) -> None:
+    """Projected listing returns the same page and total as list_and_count + to_schema."""
+    from advanced_alchemy.filters import LimitOffset, OrderBy, SearchFilter
+
+    from app.domain.admin.schemas import AdminUserSummary
+
+    session.add_all([UserFactory.build(name=f"Projected {i}") for i in range(7)])
+    session.add(UserFactory.build(name="Someone Else"))
+    await session.commit()
+    filters = [
+        SearchFilter(field_name={"name", "email"}, value="projected", ignore_case=True),
+        OrderBy(field_name="name", sort_order="asc"),
+        LimitOffset(limit=5, offset=0),
+    ]
+
+    items, total = await user_service.list_and_count_as(AdminUserSummary, *filters)
+    results, expected_total = await user_service.list_and_count(*filters)
+
+    assert total == expected_total == 7
+    assert items == user_service.to_schema(results, expected_total, filters, schema_type=AdminUserSummary).items
+    assert [item.name for item in items] == [f"Projected {i}" for i in range(5)]
+
+
+async def test_list_and_count_as_past_last_page(session: AsyncSession, user_service: UserService) -> None:
+    """An empty page still reports the total."""
+    from advanced_alchemy.filters import LimitOffset
+
+    from app.domain.admin.schemas import AdminUserSummary
+
+    session.add_all([UserFactory.build() for _ in range(3)])
+    await session.commit()
+
+    items, total = await user_service.list_and_count_as(AdminUserSummary, LimitOffset(limit=10, offset=10))
+
+    assert items == []
+    assert total == 3
+
+
+async def test_list_and_count_as_rejects_unmapped_fields(user_service: UserService) -> None:
+    """Structs with fields that are not columns are refused."""
+    from app.domain.accounts.schemas import User
+
+    with pytest.raises(ValueError, match="not columns of User"):
+        await user_service.list_and_count_as(User)
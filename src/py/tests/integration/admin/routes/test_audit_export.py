@@ -0,0 +1,214 @@
+"""The audit log export streams over a session of its own, closed however the response ends."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import event, func, insert, select
+
+from app import config
+from app.db import models as m
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from litestar import Litestar
+    from litestar.types import Message
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+    from tests.query_budget import QueryBudgetClient
+
+pytestmark = pytest.mark.anyio
+
+EXPORT_URL = "/api/admin/audit/export"
+
+
+@pytest.fixture(name="audit_logs")
+async def fx_audit_logs(session: AsyncSession, seeded_db: None) -> int:
+    """Three audit logs; returns the number of audit logs in the database."""
+    await session.execute(
+        insert(m.AuditLog),
+        [
+            {"action": "login.failed", "actor_email": "user@example.com"},
+            {"action": "admin.user.update", "actor_email": "superuser@example.com", "details": {"changes": ["name"]}},
+            {"action": "admin.user.update", "actor_email": "superuser@example.com", "target_label": 'quoted, "label"'},
+        ],
+    )
+    await session.commit()
+    return await session.scalar(select(func.count()).select_from(m.AuditLog)) or 0
+
+
+@pytest.fixture(name="standalone_sessions")
+def fx_standalone_sessions(_patch_db: None, monkeypatch: pytest.MonkeyPatch) -> dict[AsyncSession, list[str]]:
+    """Sessions opened outside the request scope, as ``provide_services`` does, with the ORM statements of each."""
+    sessions: dict[AsyncSession, list[str]] = {}
+    session_maker = config.alchemy.session_maker
+    assert session_maker is not None
+
+    def record() -> AsyncSession:
+        session = session_maker()
+        statements = sessions[session] = []
+        event.listen(session.sync_session, "do_orm_execute", lambda state: statements.append(str(state.statement)))
+        return session
+
+    monkeypatch.setattr(config.alchemy, "session_maker", record)
+    return sessions
+
+
+@pytest.fixture(name="checked_out")
+def fx_checked_out(engine: AsyncEngine) -> Iterator[list[int]]:
+    """Connections of the test engine currently checked out, as a one-item list."""
+    checked_out = [0]
+
+    def checkout(*_: Any) -> None:
+        checked_out[0] += 1
+
+    def checkin(*_: Any) -> None:
+        checked_out[0] -= 1
+
+    event.listen(engine.sync_engine, "checkout", checkout)
+    event.listen(engine.sync_engine, "checkin", checkin)
+    yield checked_out
+    event.remove(engine.sync_engine, "checkout", checkout)
+    event.remove(engine.sync_engine, "checkin", checkin)
+
+
+def _export_sessions(sessions: dict[AsyncSession, list[str]]) -> list[AsyncSession]:
+    return [session for session, statements in sessions.items() if any("FROM audit_log" in s for s in statements)]
+
+
+async def test_export_ndjson(
+    seeded_client: QueryBudgetClient,
+    superuser_token_headers: dict[str, str],
+    audit_logs: int,
+    standalone_sessions: dict[AsyncSession, list[str]],
+) -> None:
+    response = await seeded_client.get(EXPORT_URL, headers=superuser_token_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["content-disposition"].endswith('.ndjson"')
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == audit_logs
+    assert {"login.failed", "admin.user.update"} <= {line["action"] for line in lines}
+    assert {"changes": ["name"]} in [line["details"] for line in lines]
+    # The rows come from a session of the stream's own, closed once the body is out.
+    [export_session] = _export_sessions(standalone_sessions)
+    assert not export_session.in_transaction()
+
+
+async def test_export_csv(
+    seeded_client: QueryBudgetClient,
+    superuser_token_headers: dict[str, str],
+    audit_logs: int,
+) -> None:
+    response = await seeded_client.get(EXPORT_URL, params={"format": "csv"}, headers=superuser_token_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"].endswith('.csv"')
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == audit_logs
+    assert {"id", "action", "actorEmail", "targetLabel", "details", "createdAt"} <= set(rows[0])
+    assert 'quoted, "label"' in [row["targetLabel"] for row in rows]
+    assert '{"changes":["name"]}' in [row["details"] for row in rows]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"action": "login.failed"},
+        {"actionIn": ["login.failed"]},
+        {"searchString": "LOGIN.FAILED", "searchIgnoreCase": True},
+    ],
+)
+async def test_export_applies_the_list_filters(
+    seeded_client: QueryBudgetClient,
+    superuser_token_headers: dict[str, str],
+    audit_logs: int,
+    params: dict[str, Any],
+) -> None:
+    response = await seeded_client.get(EXPORT_URL, params=params, headers=superuser_token_headers)
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines
+    assert {(line["action"], line["actorEmail"]) for line in lines} == {("login.failed", "user@example.com")}
+
+
+async def test_export_requires_a_superuser(
+    seeded_client: QueryBudgetClient, user_token_headers: dict[str, str]
+) -> None:
+    response = await seeded_client.get(EXPORT_URL, headers=user_token_headers)
+
+    assert response.status_code == 403
+
+
+async def _export_until_disconnect(app: Litestar, headers: dict[str, str]) -> int:
+    """Request the export as a client that goes away once the first rows arrive.
+
+    Returns:
+        The number of body chunks sent before the disconnect.
+    """
+    rows_sent = asyncio.Event()
+    requested = False
+    chunks = 0
+
+    async def receive() -> Any:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await rows_sent.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal chunks
+        if message["type"] == "http.response.body" and message.get("body"):
+            chunks += 1
+            rows_sent.set()
+            # A slow client: the stream is suspended mid-export when the disconnect arrives.
+            await asyncio.sleep(5)
+
+    scope: Any = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": EXPORT_URL,
+        "raw_path": EXPORT_URL.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), *((k.lower().encode(), v.encode()) for k, v in headers.items())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=10)
+    return chunks
+
+
+async def test_export_session_is_closed_when_the_client_disconnects(
+    app: Litestar,
+    seeded_client: QueryBudgetClient,
+    superuser_token_headers: dict[str, str],
+    session: AsyncSession,
+    standalone_sessions: dict[AsyncSession, list[str]],
+    checked_out: list[int],
+) -> None:
+    # More than one chunk of rows, so the cursor is still open after the first.
+    await session.execute(insert(m.AuditLog), [{"action": "login.failed"} for _ in range(2_500)])
+    await session.commit()
+
+    # On the client's portal, where the app and its lifespan run.
+    chunks = seeded_client.blocking_portal.call(_export_until_disconnect, app, superuser_token_headers)
+
+    assert chunks == 1
+    [export_session] = _export_sessions(standalone_sessions)
+    assert not export_session.in_transaction()
+    assert checked_out == [0]
@@ -6,7 +6,8 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 from advanced_alchemy.utils.fixtures import open_fixture_async
-from litestar.testing import AsyncTestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app import config
 from app.db.models import EmailVerificationToken, PasswordResetToken, Team, TeamInvitation, User
@@ -14,13 +15,14 @@ from app.domain.accounts.guards import create_access_token
 from app.domain.accounts.services import RoleService, UserService
 from app.domain.teams.services import TeamService
 from app.lib.settings import get_settings
+from tests.query_budget import QueryBudgetClient, counts_toward_budget
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, AsyncIterator
+    from collections.abc import AsyncGenerator, AsyncIterator, Iterator
 
     from httpx import AsyncClient
     from litestar import Litestar
-    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 
 @pytest.fixture
@@ -58,31 +60,49 @@ async def seeded_db(
 
 
 @pytest.fixture
-async def _patch_db(
-    app: Litestar,
-    engine: AsyncEngine,
-    sessionmaker: async_sessionmaker[AsyncSession],
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+async def _patch_db(app: Litestar, engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch) -> None:
     """Patch the database connection for HTTP client tests.
 
     This fixture ensures that all HTTP requests made through the test client
-    use the same test database that fixtures populate.
+    use the same test database that fixtures populate. Request sessions are built from the app's
+    own session config, so they are :class:`~app.lib.sessions.RoutingSession` instances with the
+    same commit, read-only and statement timeout behaviour as in production.
 
     Note: This is NOT autouse - only client tests need it.
     Service tests use session directly and don't need app patching.
     """
-    monkeypatch.setattr(config.alchemy, "session_maker", sessionmaker)
+    request_sessionmaker = async_sessionmaker(**{**config.alchemy.session_config_dict, "bind": engine})
+    monkeypatch.setattr(config.alchemy, "session_maker", request_sessionmaker)
     monkeypatch.setattr(config.alchemy, "engine_instance", engine)
     # Also patch app state for tests that check app.state directly
     app.state[config.alchemy.engine_app_state_key] = engine
-    app.state[config.alchemy.session_maker_app_state_key] = sessionmaker
+    app.state[config.alchemy.session_maker_app_state_key] = request_sessionmaker
+
+
+@pytest.fixture(name="queries")
+def fx_queries(engine: AsyncEngine) -> Iterator[list[str]]:
+    """Record every SQL statement the test engine executes.
+
+    Clear the list right before the request under test and assert on its length afterwards. Like the
+    budgets, it leaves out per-transaction session setup.
+    """
+    statements: list[str] = []
+
+    def record(*args: Any) -> None:
+        if counts_toward_budget(args[2]):
+            statements.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
 
 
 @pytest.fixture(name="client")
-async def fx_client(app: Litestar, _patch_db: None, db_cleanup: None) -> AsyncIterator[AsyncClient]:
-    """Async client that calls requests on the app."""
-    async with AsyncTestClient(app) as client:
+async def fx_client(
+    app: Litestar, engine: AsyncEngine, _patch_db: None, db_cleanup: None
+) -> AsyncIterator[AsyncClient]:
+    """Async client that calls requests on the app, holding each route to its query budget."""
+    async with QueryBudgetClient(app, engine=engine) as client:
         yield client
 
 
@@ -115,6 +135,7 @@ def fx_user_token_headers(seeded_db: None) -> dict[str, str]:
 @pytest.fixture(name="seeded_client")
 async def fx_seeded_client(
     app: Litestar,
+    engine: AsyncEngine,
     _patch_db: None,
     seeded_db: None,
     db_cleanup: None,
@@ -124,7 +145,7 @@ async def fx_seeded_client(
     Uses _patch_db to ensure the test client uses the same database
     that was seeded with fixtures.
     """
-    async with AsyncTestClient(app=app) as client:
+    async with QueryBudgetClient(app, engine=engine) as client:
         yield client
 
 
@@ -0,0 +1,53 @@
+"""SQL statement counts for the team routes.
+
+Budgets themselves live in :mod:`tests.query_budget` and are checked on every client request; these
+tests pin the property the budgets rely on, that a page costs the same number of statements however
+many rows it holds.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.db import models as m
+from tests.query_budget import QUERY_BUDGETS
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+pytestmark = [pytest.mark.anyio, pytest.mark.integration, pytest.mark.teams]
+
+
+async def test_team_list_queries_do_not_grow_with_page(
+    authenticated_client: AsyncClient,
+    session: AsyncSession,
+    test_user: m.User,
+    test_team: m.Team,
+    queries: list[str],
+) -> None:
+    queries.clear()
+    response = await authenticated_client.get("/api/teams")
+    assert response.status_code == 200
+    single = len(queries)
+
+    for index in range(5):
+        team = m.Team(name=f"Query Team {index}", slug=f"query-team-{index}")
+        team.tags = [m.Tag(name=f"Query Tag {index}", slug=f"query-tag-{index}")]
+        other = m.User(email=f"query.member{index}@example.com", name=f"Member {index}")
+        team.members = [
+            m.TeamMember(user_id=test_user.id, role=m.TeamRoles.MEMBER),
+            m.TeamMember(user=other, role=m.TeamRoles.MEMBER),
+        ]
+        session.add(team)
+    await session.commit()
+
+    queries.clear()
+    response = await authenticated_client.get("/api/teams", params={"pageSize": 20})
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 6
+    assert len(queries) == single
+    assert single <= QUERY_BUDGETS["GET /api/teams"]
@@ -208,6 +208,28 @@ async def test_get_team_details(
     assert team["description"] == test_team.description
 
 
+@pytest.mark.anyio
+async def test_get_team_details_conditional(
+    authenticated_client: AsyncTestClient,
+    test_team: m.Team,
+) -> None:
+    """Test that team details revalidate with ETags and change after an update."""
+    response = await authenticated_client.get(f"/api/teams/{test_team.id}")
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    not_modified = await authenticated_client.get(f"/api/teams/{test_team.id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    await authenticated_client.patch(f"/api/teams/{test_team.id}", json={"tags": ["conditional"]})
+
+    modified = await authenticated_client.get(f"/api/teams/{test_team.id}", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.headers["etag"] != etag
+    assert [tag["name"] for tag in modified.json()["tags"]] == ["conditional"]
+
+
 @pytest.mark.anyio
 async def test_get_team_details_not_member(
     client: AsyncTestClient,
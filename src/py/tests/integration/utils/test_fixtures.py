@@ -0,0 +1,38 @@
+"""Tests for the fixture loading helpers that need PostgreSQL."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import func, select
+
+from app.db.models import Role
+from app.utils.fixtures import bulk_upsert
+from tests.factories import RoleFactory
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+pytestmark = [pytest.mark.anyio, pytest.mark.integration]
+
+
+async def test_bulk_upsert_inserts_and_updates_on_conflict(session: AsyncSession) -> None:
+    existing = RoleFactory.build(name="Superuser", slug="superuser", description="old")
+    session.add(existing)
+    await session.commit()
+
+    await bulk_upsert(
+        session,
+        Role,
+        [
+            {"name": "Superuser", "slug": "superuser", "description": "new"},
+            {"name": "Auditor", "slug": "auditor", "description": "read only"},
+        ],
+        index_elements=["name"],
+    )
+    await session.commit()
+
+    rows = dict((await session.execute(select(Role.name, Role.description))).tuples().all())
+    assert rows == {"Superuser": "new", "Auditor": "read only"}
+    assert await session.scalar(select(func.count()).select_from(Role).where(Role.id == existing.id)) == 1
@@ -0,0 +1,108 @@
+"""SQL statement budgets enforced on every request the integration test clients make.
+
+Extra queries are the usual performance regression here: an eager load dropped from a ``deps.py``
+provider or a relationship left lazy turns one select into one per row. Each entry below caps the
+statements a route may execute per request, and holds no matter how many rows the request returns.
+Add a route when its count has been checked with the ``queries`` fixture, and only raise a budget
+together with the change that needs the extra statement.
+
+Only successful responses are checked; error paths bail out early and are not worth budgeting. The
+``SET LOCAL statement_timeout`` each request transaction starts with is session setup, not a query
+the route chose to run, and is not counted.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Final, Self
+
+from litestar.testing import AsyncTestClient
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from httpx import Request, Response
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+QUERY_BUDGETS: Final[dict[str, int]] = {
+    "POST /api/access/login": 5,
+    "POST /api/access/refresh": 13,
+    "GET /api/me": 4,
+    "PATCH /api/me": 12,
+    "POST /api/email-verification/verify": 15,
+    # USER_AUTH (3), a windowed page select, then members and tags for the whole page
+    "GET /api/teams": 6,
+    "GET /api/teams/{team_id}": 7,
+    "GET /api/admin/users": 4,
+    "GET /api/admin/users/{user_id}": 7,
+}
+"""Maximum statements per request, keyed by ``"METHOD /path/{param}"``."""
+
+
+_SESSION_SETUP: Final = re.compile(r"SET LOCAL statement_timeout\b", re.IGNORECASE)
+
+
+def counts_toward_budget(statement: str) -> bool:
+    """Check whether a statement is one the route ran, rather than per-transaction session setup."""
+    return _SESSION_SETUP.match(statement) is None
+
+
+class QueryBudgetExceededError(AssertionError):
+    """A request executed more statements than its route's budget."""
+
+
+def _compile(budgets: dict[str, int]) -> list[tuple[str, re.Pattern[str], int]]:
+    compiled = []
+    for route, limit in budgets.items():
+        method, path = route.split(" ", 1)
+        pattern = re.sub(r"\\\{[^}]+\\\}", "[^/]+", re.escape(path))
+        compiled.append((method, re.compile(f"{pattern}/?"), limit))
+    return compiled
+
+
+_BUDGETS = _compile(QUERY_BUDGETS)
+
+
+def budget_for(method: str, path: str) -> int | None:
+    """Return the statement budget for a request, or ``None`` when the route has none."""
+    for budget_method, pattern, limit in _BUDGETS:
+        if budget_method == method and pattern.fullmatch(path):
+            return limit
+    return None
+
+
+class QueryBudgetClient(AsyncTestClient):
+    """Test client that fails a request when it runs more statements than :data:`QUERY_BUDGETS` allows.
+
+    The app runs on the client's portal thread and each call blocks until the response is complete,
+    so every statement the engine executes between sending and receiving belongs to that request.
+    """
+
+    def __init__(self, *args: Any, engine: AsyncEngine, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._engine = engine
+        self._statements: list[str] = []
+
+    def _record(self, *args: Any) -> None:
+        if counts_toward_budget(args[2]):
+            self._statements.append(args[2])
+
+    async def __aenter__(self) -> Self:
+        event.listen(self._engine.sync_engine, "before_cursor_execute", self._record)
+        return await super().__aenter__()
+
+    async def __aexit__(self, *args: object) -> None:
+        await super().__aexit__(*args)
+        event.remove(self._engine.sync_engine, "before_cursor_execute", self._record)
+
+    async def send(self, request: Request, **kwargs: Any) -> Response:
+        self._statements.clear()
+        response = await super().send(request, **kwargs)
+        limit = budget_for(request.method, request.url.path)
+        if limit is not None and response.is_success and len(self._statements) > limit:
+            statements = "\n".join(f"  {statement}" for statement in self._statements)
+            msg = (
+                f"{request.method} {request.url.path} executed {len(self._statements)} statements, "
+                f"budget is {limit}:\n{statements}"
+            )
+            raise QueryBudgetExceededError(msg)
+        return response
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.db import models as m
+from app.domain.accounts.services import UserService
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_profile_version_covers_everything_the_profile_returns() -> None:
+    """Test that the ``/api/me`` ETag changes with the user's teams and OAuth accounts."""
+    now = datetime.now(UTC)
+    user = m.User(id=uuid4(), email="ada@example.com", updated_at=now)
+    team = m.Team(id=uuid4(), name="Analytical Engines", slug="analytical-engines", updated_at=now)
+    user.teams = [m.TeamMember(id=uuid4(), team=team, updated_at=now)]
+    versions = [UserService.profile_version(user)]
+
+    account = m.UserOAuthAccount(id=uuid4(), oauth_name="github", account_id="42", updated_at=now)
+    user.oauth_accounts = [account]
+    versions.append(UserService.profile_version(user))
+    account.updated_at = now + timedelta(seconds=1)
+    versions.append(UserService.profile_version(user))
+    team.updated_at = now + timedelta(seconds=1)
+    versions.append(UserService.profile_version(user))
+    user.oauth_accounts = []
+    versions.append(UserService.profile_version(user))
+
+    assert len(set(versions)) == len(versions)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import gzip
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+
+from app.lib.assets import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    AssetIndex,
+    create_assets_router,
+    is_hashed_asset,
+    manifest_files,
+    parse_accept_encoding,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+pytestmark = pytest.mark.anyio
+
+SCRIPT = b"console.log('hello world');\n" * 100
+
+
+@pytest.fixture()
+def bundle_dir(tmp_path: Path) -> Path:
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "index-BxYz12Ab.js").write_bytes(SCRIPT)
+    (assets / "index-BxYz12Ab.js.gz").write_bytes(gzip.compress(SCRIPT))
+    (assets / "index-BxYz12Ab.js.br").write_bytes(b"fake-brotli")
+    (tmp_path / "robots.txt").write_bytes(b"User-agent: *\n")
+    return tmp_path
+
+
+@pytest.fixture()
+async def client(bundle_dir: Path) -> AsyncIterator[AsyncTestClient[Litestar]]:
+    app = Litestar(route_handlers=[create_assets_router(path="/static/", directory=bundle_dir)])
+    async with AsyncTestClient(app=app) as test_client:
+        yield test_client
+
+
+def test_is_hashed_asset() -> None:
+    assert is_hashed_asset("assets/index-BxYz12Ab.js")
+    assert is_hashed_asset("assets/vendor-a1-2c3d4.css")
+    assert not is_hashed_asset("robots.txt")
+    assert not is_hashed_asset("site-manifest.json")
+    assert not is_hashed_asset("apple-touch-icon.png")
+
+
+def test_is_hashed_asset_uses_the_manifest() -> None:
+    hashed = frozenset({"assets/index-Bx-z12Ab.js", "favicon-D4fc.ico"})
+
+    assert is_hashed_asset("assets/index-Bx-z12Ab.js", hashed)
+    assert is_hashed_asset("favicon-D4fc.ico", hashed)
+    assert not is_hashed_asset("assets/copied-from-public.png", hashed)
+
+
+def test_index_caches_only_manifest_files_as_immutable(bundle_dir: Path) -> None:
+    (bundle_dir / "assets" / "logo-a-B_c1.svg").write_bytes(b"<svg/>")
+    (bundle_dir / "apple-touch-icon.png").write_bytes(b"png")
+    (bundle_dir / ".vite").mkdir()
+    (bundle_dir / ".vite" / "manifest.json").write_text(
+        json.dumps({"src/main.tsx": {"file": "assets/index-BxYz12Ab.js", "assets": ["assets/logo-a-B_c1.svg"]}})
+    )
+
+    assets = AssetIndex(bundle_dir).build()
+
+    assert manifest_files(bundle_dir) == frozenset({"assets/index-BxYz12Ab.js", "assets/logo-a-B_c1.svg"})
+    assert assets["assets/index-BxYz12Ab.js"].cache_control == IMMUTABLE_CACHE_CONTROL
+    assert assets["assets/logo-a-B_c1.svg"].cache_control == IMMUTABLE_CACHE_CONTROL
+    assert assets["apple-touch-icon.png"].cache_control == REVALIDATE_CACHE_CONTROL
+    assert assets[".vite/manifest.json"].cache_control == REVALIDATE_CACHE_CONTROL
+
+
+def test_parse_accept_encoding() -> None:
+    assert parse_accept_encoding("gzip, br;q=0.5, identity;q=0") == {"gzip": 1.0, "br": 0.5, "identity": 0.0}
+    assert parse_accept_encoding("") == {}
+    assert parse_accept_encoding("br;q=bad") == {"br": 0.0}
+
+
+def test_index_skips_compressed_siblings(bundle_dir: Path) -> None:
+    assets = AssetIndex(bundle_dir).build()
+
+    assert set(assets) == {"assets/index-BxYz12Ab.js", "robots.txt"}
+    script = assets["assets/index-BxYz12Ab.js"]
+    assert set(script.variants) == {"identity", "br", "gzip"}
+    assert len({variant.etag for variant in script.variants.values()}) == 3
+    assert script.cache_control == IMMUTABLE_CACHE_CONTROL
+    assert assets["robots.txt"].cache_control == REVALIDATE_CACHE_CONTROL
+
+
+async def test_serves_brotli_when_preferred(client: AsyncTestClient[Litestar]) -> None:
+    response = await client.get("/static/assets/index-BxYz12Ab.js", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-length"] == str(len(b"fake-brotli"))
+    assert "javascript" in response.headers["content-type"]
+
+
+async def test_serves_gzip_when_brotli_refused(client: AsyncTestClient[Litestar]) -> None:
+    response = await client.get("/static/assets/index-BxYz12Ab.js", headers={"Accept-Encoding": "br;q=0, gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == SCRIPT
+
+
+async def test_serves_identity_without_accept_encoding(client: AsyncTestClient[Litestar]) -> None:
+    response = await client.get("/static/assets/index-BxYz12Ab.js", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.content == SCRIPT
+
+
+async def test_conditional_request_returns_not_modified(client: AsyncTestClient[Litestar]) -> None:
+    first = await client.get("/static/assets/index-BxYz12Ab.js", headers={"Accept-Encoding": "gzip"})
+    etag = first.headers["etag"]
+
+    second = await client.get(
+        "/static/assets/index-BxYz12Ab.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": f"W/{etag}"},
+    )
+
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+
+
+async def test_head_request_has_no_body(client: AsyncTestClient[Litestar]) -> None:
+    response = await client.head("/static/robots.txt")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    assert response.content == b""
+
+
+async def test_missing_asset_returns_not_found(client: AsyncTestClient[Litestar]) -> None:
+    response = await client.get("/static/assets/missing-AbCdEfGh.js")
+
+    assert response.status_code == 404
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import anyio
+import msgspec
+import pytest
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from litestar import Litestar, Request, get, post
+from litestar.testing import AsyncTestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.lib import cache as cache_module
+from app.lib.cache import LRUMemoryStore, ResponseCache, cached, invalidate_on_commit
+from app.lib.sessions import RoutingSQLAlchemyConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_lru_store_evicts_least_recently_used() -> None:
+    store = LRUMemoryStore(max_entries=2)
+    await store.set("a", b"1")
+    await store.set("b", b"2")
+    assert await store.get("a") == b"1"
+
+    await store.set("c", b"3")
+
+    assert await store.get("a") == b"1"
+    assert await store.get("b") is None
+    assert await store.get("c") == b"3"
+
+
+async def test_lru_store_expires_entries() -> None:
+    store = LRUMemoryStore()
+    await store.set("a", "1", expires_in=0)
+
+    assert await store.get("a") is None
+    assert not await store.exists("a")
+
+
+async def test_concurrent_misses_compute_once() -> None:
+    response_cache = ResponseCache(LRUMemoryStore())
+    calls = 0
+    results: list[bytes] = []
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.05)
+        return b"value"
+
+    async def fetch() -> None:
+        results.append(await response_cache.get_or_compute("key", compute, tag="tag", ttl=60))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(10):
+            tg.start_soon(fetch)
+
+    assert calls == 1
+    assert results == [b"value"] * 10
+    assert await response_cache.get_or_compute("key", compute, tag="tag", ttl=60) == b"value"
+    assert calls == 1
+
+
+async def test_errors_are_shared_and_not_cached() -> None:
+    response_cache = ResponseCache(LRUMemoryStore())
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.01)
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    async def fetch() -> None:
+        with pytest.raises(RuntimeError, match="boom"):
+            await response_cache.get_or_compute("key", compute, tag="tag", ttl=60)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(fetch)
+
+    assert calls == 1
+    await fetch()
+    assert calls == 2
+
+
+async def test_invalidate_rotates_tag() -> None:
+    response_cache = ResponseCache(LRUMemoryStore())
+    values = iter([b"first", b"second", b"other"])
+
+    async def compute() -> bytes:
+        return next(values)
+
+    assert await response_cache.get_or_compute("key", compute, tag="tag", ttl=60) == b"first"
+    assert await response_cache.get_or_compute("key", compute, tag="tag", ttl=60) == b"first"
+
+    await response_cache.invalidate("tag")
+
+    assert await response_cache.get_or_compute("key", compute, tag="tag", ttl=60) == b"second"
+    assert await response_cache.get_or_compute("key", compute, tag="other-tag", ttl=60) == b"other"
+
+
+class Stats(msgspec.Struct):
+    calls: int
+
+
+async def test_cached_handler(monkeypatch: pytest.MonkeyPatch) -> None:
+    response_cache = ResponseCache(LRUMemoryStore())
+    monkeypatch.setattr(cache_module, "get_response_cache", lambda: response_cache)
+    calls = 0
+
+    @get("/stats")
+    @cached("stats", ttl=60)
+    async def stats(request: Request[Any, Any, Any], window: int = 1) -> Stats:
+        nonlocal calls
+        calls += 1
+        return Stats(calls=calls)
+
+    async with AsyncTestClient(app=Litestar(route_handlers=[stats])) as client:
+        first = await client.get("/stats")
+        second = await client.get("/stats")
+        other_query = await client.get("/stats", params={"window": 2})
+        await response_cache.invalidate("stats")
+        after_invalidate = await client.get("/stats")
+
+    assert first.json() == {"calls": 1}
+    assert second.json() == {"calls": 1}
+    assert first.headers["content-type"] == "application/json"
+    assert other_query.json() == {"calls": 2}
+    assert after_invalidate.json() == {"calls": 3}
+
+
+async def test_invalidations_wait_for_the_request_to_commit(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    response_cache = ResponseCache(LRUMemoryStore())
+    monkeypatch.setattr(cache_module, "get_response_cache", lambda: response_cache)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE TABLE event (name TEXT)"))
+    config = RoutingSQLAlchemyConfig(engine_instance=engine, before_send_handler="autocommit")
+    versions: list[bytes | None] = []
+
+    async def version() -> bytes | None:
+        return await response_cache.store.get(response_cache._version_key("stats"))
+
+    @post("/events/{name:str}")
+    async def record(db_session: AsyncSession, name: str) -> None:
+        await db_session.execute(text("INSERT INTO event VALUES (:name)"), {"name": name})
+        invalidate_on_commit(db_session, "stats")
+        versions.append(await version())
+        if name == "fail":
+            raise ValueError(name)
+
+    app = Litestar([record], plugins=[SQLAlchemyPlugin(config=config)])
+    async with AsyncTestClient(app) as client:
+        assert (await client.post("/events/ok")).status_code == 201
+        after_commit = await version()
+        assert (await client.post("/events/fail")).status_code == 500
+        after_rollback = await version()
+    await engine.dispose()
+
+    assert versions == [None, after_commit]
+    assert after_commit is not None
+    assert after_rollback == after_commit
+
+
+async def test_commit_invalidations_repeat_after_the_replica_lag() -> None:
+    response_cache = ResponseCache(LRUMemoryStore())
+    computed = iter([b"primary", b"stale replica", b"fresh"])
+
+    async def compute() -> bytes:
+        return next(computed)
+
+    async def stats() -> bytes:
+        return await response_cache.get_or_compute("stats", compute, tag="stats", ttl=60)
+
+    assert await stats() == b"primary"
+    await response_cache.invalidate("stats")
+    response_cache.invalidate_later(0.05, "stats")
+    assert await stats() == b"stale replica"
+    await anyio.sleep(0.1)
+    assert await stats() == b"fresh"
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.lib import deps
 from app.lib.deps import CompositeServiceMixin, provide_services
+from app.lib.tracing import inject_job_context
 
 
 @pytest.mark.anyio
@@ -14,6 +15,7 @@ async def test_get_task_queue() -> None:
     # Mock the queue object that get_queue should return
     mock_queue = AsyncMock()
     mock_queue.connect = AsyncMock()  # Mock the connect method
+    mock_queue.register_before_enqueue = MagicMock()
 
     # Mock the saq plugin object
     mock_saq_plugin = MagicMock()
@@ -27,6 +29,7 @@ async def test_get_task_queue() -> None:
         # Assertions
         mock_saq_plugin.get_queue.assert_called_once_with("background-tasks")
         mock_queue.connect.assert_awaited_once()
+        mock_queue.register_before_enqueue.assert_called_once_with(inject_job_context)
         assert returned_queue is mock_queue
 
 
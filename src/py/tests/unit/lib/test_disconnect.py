@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from litestar import Litestar, get
+from litestar.middleware import DefineMiddleware
+from litestar.testing import AsyncTestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.lib.disconnect import CancelOnDisconnectMiddleware
+from app.lib.sessions import RoutingSQLAlchemyConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from litestar.types import Receive, Scope, Send
+
+pytestmark = pytest.mark.anyio
+
+
+async def _disconnecting_client() -> Any:
+    await asyncio.sleep(0.01)
+    return {"type": "http.disconnect"}
+
+
+async def _send(_message: Any) -> None:
+    pass
+
+
+@pytest.mark.parametrize(("method", "cancelled"), [("GET", True), ("POST", False)])
+async def test_reads_are_cancelled_when_the_client_disconnects(method: str, cancelled: bool) -> None:
+    finished: list[bool] = []
+
+    async def slow_handler(_scope: Scope, _receive: Receive, _send: Send) -> None:
+        try:
+            await asyncio.sleep(0.2)
+        except asyncio.CancelledError:
+            finished.append(False)
+            raise
+        finished.append(True)
+
+    scope: Any = {"type": "http", "method": method, "path": "/slow"}
+    await CancelOnDisconnectMiddleware(slow_handler)(scope, _disconnecting_client, _send)
+
+    assert finished == [not cancelled]
+
+
+async def test_handlers_still_receive_the_request_body() -> None:
+    incoming: asyncio.Queue[Any] = asyncio.Queue()
+    incoming.put_nowait({"type": "http.request", "body": b"payload", "more_body": False})
+    received: list[Any] = []
+
+    async def echo(_scope: Scope, receive: Receive, _send: Send) -> None:
+        received.append(await receive())
+
+    scope: Any = {"type": "http", "method": "GET", "path": "/echo"}
+    await CancelOnDisconnectMiddleware(echo)(scope, incoming.get, _send)
+
+    assert received == [{"type": "http.request", "body": b"payload", "more_body": False}]
+
+
+async def test_work_after_the_response_is_not_cancelled() -> None:
+    finished: list[bool] = []
+
+    async def background_work(_scope: Scope, _receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"done", "more_body": False})
+        await asyncio.sleep(0.05)
+        finished.append(True)
+
+    scope: Any = {"type": "http", "method": "GET", "path": "/done"}
+    await CancelOnDisconnectMiddleware(background_work)(scope, _disconnecting_client, _send)
+
+    assert finished == [True]
+
+
+async def test_cancelled_requests_return_their_session_connection(tmp_path: Path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", pool_size=2, max_overflow=0)
+    config = RoutingSQLAlchemyConfig(engine_instance=engine, before_send_handler="autocommit")
+
+    @get("/slow")
+    async def slow(db_session: AsyncSession) -> int:
+        await db_session.execute(text("SELECT 1"))
+        await asyncio.sleep(1)
+        return 1
+
+    app = Litestar(
+        [slow],
+        plugins=[SQLAlchemyPlugin(config=config)],
+        middleware=[DefineMiddleware(CancelOnDisconnectMiddleware, session_scope_key=config.session_scope_key)],
+    )
+    sent: list[Any] = []
+
+    async def send(message: Any) -> None:
+        sent.append(message)
+
+    async def receive() -> Any:
+        await asyncio.sleep(0.05)
+        return {"type": "http.disconnect"}
+
+    async with AsyncTestClient(app):
+        for _ in range(3):
+            scope: Any = {
+                "type": "http",
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": "/slow",
+                "raw_path": b"/slow",
+                "root_path": "",
+                "query_string": b"",
+                "headers": [],
+                "client": ("127.0.0.1", 1234),
+                "server": ("testserver", 80),
+                "state": {},
+            }
+            await asyncio.wait_for(app(scope, receive, send), timeout=5)
+            assert engine.pool.checkedout() == 0  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert sent == []
+    await engine.dispose()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from litestar import Litestar, Request, Response, get
+from litestar.testing import AsyncTestClient
+
+from app.lib.etag import PUBLIC_REVALIDATE, conditional_response, etag_matches, make_etag
+
+pytestmark = pytest.mark.anyio
+
+
+def test_make_etag_is_weak_and_stable() -> None:
+    etag = make_etag("team", 1, None)
+
+    assert etag.weak
+    assert etag == make_etag("team", 1, None)
+    assert etag != make_etag("team", 2, None)
+    assert etag.to_header().startswith('W/"')
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ("*", True),
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('"xyz", W/"abc"', True),
+        ('W/"xyz"', False),
+    ],
+)
+def test_etag_matches(if_none_match: str | None, expected: bool) -> None:
+    assert etag_matches(if_none_match, 'W/"abc"') is expected
+
+
+async def test_conditional_response_skips_build_when_fresh() -> None:
+    builds: list[int] = []
+
+    async def build() -> dict[str, int]:
+        builds.append(1)
+        return {"version": 1}
+
+    @get("/resource")
+    async def resource(request: Request[Any, Any, Any]) -> Response[dict[str, int]]:
+        return await conditional_response(request, make_etag(1), build, cache_control=PUBLIC_REVALIDATE)
+
+    async with AsyncTestClient(app=Litestar(route_handlers=[resource])) as client:
+        first = await client.get("/resource")
+        second = await client.get("/resource", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert first.json() == {"version": 1}
+    assert first.headers["cache-control"] == PUBLIC_REVALIDATE
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == first.headers["etag"]
+    assert len(builds) == 1
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import pytest
+from litestar import Litestar, get
+
+from app.domain.admin.schemas import AuditLogEntry
+from app.lib.export import ExportStream, encode_export
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from litestar.types import Message
+
+pytestmark = pytest.mark.anyio
+
+ENTRIES = [
+    AuditLogEntry(
+        id=UUID(int=1),
+        action="admin.user.update",
+        created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        actor_email="admin@example.com",
+        details={"changes": ["name", "is_active"]},
+    ),
+    AuditLogEntry(
+        id=UUID(int=2),
+        action="login.failed",
+        created_at=datetime(2026, 1, 2, 3, 4, 6, tzinfo=UTC),
+        target_label='quoted, "label"',
+    ),
+]
+
+
+async def _chunks() -> AsyncGenerator[list[AuditLogEntry], None]:
+    yield ENTRIES[:1]
+    yield []
+    yield ENTRIES[1:]
+
+
+async def _collect(export_format: str) -> list[bytes]:
+    return [chunk async for chunk in encode_export(export_format, AuditLogEntry, _chunks())]  # type: ignore[arg-type]
+
+
+async def test_ndjson_export_writes_one_camelised_object_per_line() -> None:
+    chunks = await _collect("ndjson")
+
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line)["action"] for line in lines] == ["admin.user.update", "login.failed"]
+    assert json.loads(lines[0])["actorEmail"] == "admin@example.com"
+    assert json.loads(lines[0])["createdAt"] == "2026-01-02T03:04:05Z"
+
+
+async def test_csv_export_writes_header_then_rows() -> None:
+    chunks = await _collect("csv")
+
+    assert len(chunks) == 3
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert rows[0]["id"] == str(UUID(int=1))
+    assert json.loads(rows[0]["details"]) == {"changes": ["name", "is_active"]}
+    assert rows[0]["targetLabel"] == ""
+    assert rows[1]["targetLabel"] == 'quoted, "label"'
+    assert rows[1]["details"] == ""
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+async def test_export_stream_closes_the_source_when_the_client_disconnects(export_format: str) -> None:
+    closed: list[bool] = []
+    body_sent = asyncio.Event()
+
+    async def source() -> AsyncGenerator[list[AuditLogEntry], None]:
+        try:
+            while True:
+                yield ENTRIES
+        finally:
+            closed.append(True)
+
+    @get("/export")
+    async def export() -> ExportStream:
+        return ExportStream(encode_export(export_format, AuditLogEntry, source()))  # type: ignore[arg-type]
+
+    requested = False
+
+    async def receive() -> Any:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await body_sent.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        # Disconnect once rows are out, while the source is suspended mid-stream.
+        if message["type"] == "http.response.body" and b"admin.user.update" in message.get("body", b""):
+            body_sent.set()
+            await asyncio.sleep(1)
+
+    scope: Any = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/export",
+        "raw_path": b"/export",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1),
+        "server": ("testserver", 80),
+    }
+    await asyncio.wait_for(Litestar([export])(scope, receive, send), timeout=0.5)
+
+    assert closed == [True]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import pytest
+from litestar import Litestar, get
+from litestar.exceptions import NotAuthorizedException
+from litestar.testing import AsyncTestClient
+
+from app.domain.system import guards
+from app.domain.system.guards import requires_metrics_token
+from app.lib import metrics
+from app.lib.crypt import get_password_hash
+from app.lib.metrics import Counter, Gauge, Histogram, MetricsMiddleware, MetricsRegistry
+
+if TYPE_CHECKING:
+    from pytest import MonkeyPatch
+
+pytestmark = pytest.mark.anyio
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(3, "/a")
+
+    assert histogram.render().splitlines() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 2',
+        'latency_seconds_bucket{route="/a",le="1"} 3',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+        'latency_seconds_sum{route="/a"} 3.65',
+        'latency_seconds_count{route="/a"} 4',
+    ]
+    assert histogram.count("/a") == 4
+
+
+def test_counter_and_gauge_render_labelled_series() -> None:
+    counter = Counter("lookups", "Lookups.", ("result",))
+    counter.inc("hit")
+    counter.inc("hit")
+    counter.inc('mi"ss')
+    gauge = Gauge("depth", "Depth.")
+    gauge.inc(amount=3)
+    gauge.dec()
+
+    assert counter.render().splitlines()[2:] == ['lookups_total{result="hit"} 2', 'lookups_total{result="mi\\"ss"} 1']
+    assert gauge.render().splitlines()[2:] == ["depth 2"]
+
+
+async def test_parse_metrics_reads_rendered_samples() -> None:
+    registry = MetricsRegistry()
+    registry.counter("lookups", "Lookups.", ("result",)).inc('mi"ss')
+    registry.histogram("wait_seconds", "Wait.", buckets=(0.1,)).observe(0.5)
+
+    samples = metrics.parse_metrics(await registry.collect())
+
+    assert samples["lookups_total"] == [({"result": 'mi"ss'}, 1.0)]
+    assert samples["wait_seconds_bucket"] == [({"le": "0.1"}, 0.0), ({"le": "+Inf"}, 1.0)]
+    assert samples["wait_seconds_sum"] == [({}, 0.5)]
+
+
+async def test_registry_runs_collectors_and_survives_failures() -> None:
+    registry = MetricsRegistry()
+    gauge = registry.gauge("sampled", "Sampled.")
+
+    def broken() -> None:
+        raise RuntimeError
+
+    async def sample() -> None:
+        gauge.set(7)
+
+    registry.add_collector(broken)
+    registry.add_collector(sample)
+
+    assert "sampled 7\n" in await registry.collect()
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("sampled", "Again.")
+
+
+async def test_middleware_labels_requests_by_route_template() -> None:
+    @get("/items/{item_id:uuid}")
+    async def item(item_id: UUID) -> dict[str, str]:
+        assert metrics.HTTP_REQUESTS_IN_FLIGHT.value() >= 1
+        return {"id": str(item_id)}
+
+    labels = ("GET", "/items/{item_id}", "200")
+    before = metrics.HTTP_REQUEST_DURATION.count(*labels)
+    app = Litestar(route_handlers=[item], middleware=[MetricsMiddleware])
+    async with AsyncTestClient(app) as client:
+        for _ in range(2):
+            response = await client.get(f"/items/{UUID(int=1)}")
+            assert response.status_code == 200
+
+    assert metrics.HTTP_REQUEST_DURATION.count(*labels) == before + 2
+
+
+async def test_password_hashing_is_tracked_in_flight() -> None:
+    before = metrics.ARGON2_IN_FLIGHT.value()
+    await get_password_hash("Sup3r-Secret!")
+    assert metrics.ARGON2_IN_FLIGHT.value() == before
+
+
+@pytest.mark.parametrize(
+    ("token", "header", "allowed"),
+    [
+        ("", None, True),
+        ("s3cret", "Bearer s3cret", True),
+        ("s3cret", "Bearer wrong", False),
+        ("s3cret", None, False),
+    ],
+)
+def test_metrics_token_guard(monkeypatch: MonkeyPatch, token: str, header: str | None, allowed: bool) -> None:
+    settings = SimpleNamespace(metrics=SimpleNamespace(TOKEN=token))
+    monkeypatch.setattr(guards, "get_settings", lambda: settings)
+    connection: Any = SimpleNamespace(headers={"authorization": header} if header else {})
+
+    if allowed:
+        requires_metrics_token(connection, None)  # type: ignore[arg-type]
+    else:
+        with pytest.raises(NotAuthorizedException):
+            requires_metrics_token(connection, None)  # type: ignore[arg-type]
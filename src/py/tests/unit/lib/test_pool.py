@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.lib import metrics
+from app.lib.pool import InstrumentedAsyncAdaptedQueuePool, advise_pool_size
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_pool_records_hold_time_by_route(tmp_path: Path) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+    pool = engine.pool
+    assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+    pool.label = "replica0"
+    holds = metrics.DB_POOL_HOLD.count("replica0", "/pool-test")
+    primary_holds = metrics.DB_POOL_HOLD.count("primary", "/pool-test")
+    overflows = metrics.DB_POOL_OVERFLOW_CONNECTS.value("replica0")
+
+    token = metrics.current_route.set("/pool-test")
+    try:
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+    finally:
+        metrics.current_route.reset(token)
+    assert metrics.DB_POOL_HOLD.count("replica0", "/pool-test") == holds + 2
+    assert metrics.DB_POOL_HOLD.count("primary", "/pool-test") == primary_holds
+    assert metrics.DB_POOL_OVERFLOW_CONNECTS.value("replica0") == overflows + 1
+    assert pool.recreate().label == "replica0"
+    await engine.dispose()
+
+
+def test_advice_follows_littles_law() -> None:
+    before = """\
+db_pool_checkout_wait_seconds_bucket{pool="primary",le="0.025"} 100
+db_pool_checkout_wait_seconds_count{pool="primary"} 100
+db_pool_checkout_wait_seconds_count{pool="replica0"} 50
+db_pool_connection_hold_seconds_sum{pool="primary",route="/api/teams"} 10
+db_pool_connection_hold_seconds_sum{pool="primary",route="/api/me"} 5
+db_pool_connection_hold_seconds_sum{pool="replica0",route="/api/teams"} 10
+db_pool_overflow_connects_total{pool="primary"} 1
+db_pool_size{pool="primary"} 5
+db_pool_size{pool="replica0"} 3
+"""
+    after = """\
+db_pool_checkout_wait_seconds_bucket{pool="primary",le="0.025"} 280
+db_pool_checkout_wait_seconds_count{pool="primary"} 300
+db_pool_checkout_wait_seconds_count{pool="replica0"} 500
+db_pool_connection_hold_seconds_sum{pool="primary",route="/api/teams"} 250
+db_pool_connection_hold_seconds_sum{pool="primary",route="/api/me"} 65
+db_pool_connection_hold_seconds_sum{pool="primary",route="/health"} 0
+db_pool_connection_hold_seconds_sum{pool="replica0",route="/api/teams"} 910
+db_pool_connection_hold_seconds_sum{pool="replica0",route="/api/search"} 60
+db_pool_overflow_connects_total{pool="primary"} 4
+db_pool_size{pool="primary"} 5
+db_pool_size{pool="replica0"} 3
+"""
+    advice = advise_pool_size(before, after, interval=60)
+
+    assert advice.in_use == 5
+    assert (advice.checkouts, advice.slow_waits, advice.overflow_connects) == (200, 20, 3)
+    assert advice.routes == [("/api/teams", 240), ("/api/me", 60)]
+    assert (advice.recommended_size, advice.recommended_overflow) == (8, 4)
+
+    replica = advise_pool_size(before, after, interval=60, pool="replica0")
+    assert (replica.pool_size, replica.checkouts, replica.in_use) == (3, 450, 16)
+    assert replica.routes == [("/api/teams", 900), ("/api/search", 60)]
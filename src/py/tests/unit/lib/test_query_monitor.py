@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from litestar import Litestar, get
+from litestar.testing import AsyncTestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from structlog.testing import capture_logs
+
+from app.lib.query_monitor import (
+    QueryMonitorMiddleware,
+    RequestQueries,
+    current_request_queries,
+    install_query_monitor,
+    statement_shape,
+)
+from app.lib.settings import DatabaseSettings
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    install_query_monitor(engine, DatabaseSettings(SLOW_QUERY_MS=10_000))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("statement", "shape"),
+    [
+        ("SELECT * FROM t WHERE id = %(id_1)s", "SELECT * FROM t WHERE id = ?"),
+        ("SELECT * FROM t WHERE id = $1", "SELECT * FROM t WHERE id = ?"),
+        ("SELECT * FROM t\n   WHERE name = 'O''Brien' LIMIT 10", "SELECT * FROM t WHERE name = ? LIMIT ?"),
+        ("SELECT * FROM t WHERE id IN ($1, $2, $3)", "SELECT * FROM t WHERE id IN (?, ...)"),
+        ("SELECT * FROM t WHERE id IN (%(id_1_1)s, %(id_1_2)s)", "SELECT * FROM t WHERE id IN (?, ...)"),
+        ("SELECT data::jsonb FROM t_2 WHERE a = :a", "SELECT data::jsonb FROM t_2 WHERE a = ?"),
+    ],
+)
+def test_statement_shape(statement: str, shape: str) -> None:
+    assert statement_shape(statement) == shape
+
+
+def test_repeated_shapes() -> None:
+    queries = RequestQueries()
+    queries.record("SELECT 1 FROM users", 1.0)
+    for user_id in range(3):
+        queries.record(f"SELECT * FROM team_member WHERE user_id = {user_id}", 2.0, slow=user_id == 0)
+
+    summary = queries.summary(threshold=3)
+
+    assert summary == {
+        "count": 4,
+        "shapes": 2,
+        "duration_ms": 7.0,
+        "slow": 1,
+        "repeated": {"SELECT * FROM team_member WHERE user_id = ?": 3},
+    }
+    assert queries.repeated(threshold=4) == {}
+
+
+async def test_slow_statements_are_logged_outside_requests() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    install_query_monitor(engine, DatabaseSettings(SLOW_QUERY_MS=0))
+    with capture_logs() as logs:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1 WHERE 2 = :a"), {"a": 2})
+    await engine.dispose()
+
+    assert current_request_queries() is None
+    slow = next(log for log in logs if log["event"] == "Slow statement")
+    assert slow["statement"] == "SELECT ? WHERE ? = ?"
+    assert slow["plan"] is None
+
+
+async def test_middleware_groups_statements_per_request(engine: AsyncEngine) -> None:
+    @get("/rows")
+    async def rows() -> dict[str, int]:
+        async with engine.connect() as conn:
+            for row in range(6):
+                await conn.execute(text("SELECT :row"), {"row": row})
+        queries = current_request_queries()
+        assert queries is not None
+        return {"count": queries.count}
+
+    app = Litestar(route_handlers=[rows], middleware=[QueryMonitorMiddleware])
+    with capture_logs() as logs:
+        async with AsyncTestClient(app) as client:
+            response = await client.get("/rows")
+
+    assert response.json() == {"count": 6}
+    warning = next(log for log in logs if log["event"] == "Repeated statements")
+    assert warning["path"] == "/rows"
+    assert warning["repeated"] == {"SELECT ?": 6}
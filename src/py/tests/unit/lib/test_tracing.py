@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from saq import Job, Status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.lib import tracing
+from app.lib.email import AppEmailService
+from app.lib.settings import AppSettings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def spans() -> Iterator[InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    tracing.configure_tracing(AppSettings(TRACE_SAMPLE_PERCENT=100), exporter=exporter)
+    yield exporter
+    tracing.shutdown_tracing()
+
+
+def test_start_span_is_a_no_op_without_tracing() -> None:
+    with tracing.start_span("nothing") as span:
+        assert span is None
+
+
+async def test_statements_are_traced_by_shape(spans: InMemorySpanExporter) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tracing.instrument_engine(engine)
+    tracing.instrument_engine(engine)
+    with tracing.start_span("request"):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT :value"), {"value": "secret"})
+    await engine.dispose()
+
+    statement, request = spans.get_finished_spans()
+    assert statement.name == "SELECT sqlite"
+    assert statement.attributes is not None
+    assert statement.attributes["db.statement"] == "SELECT ?"
+    assert statement.parent is not None
+    assert request.context is not None
+    assert statement.parent.span_id == request.context.span_id
+
+
+async def test_job_continues_the_enqueuing_trace(spans: InMemorySpanExporter) -> None:
+    job = Job(function="cleanup_auth_tokens")
+    with tracing.start_span("enqueue") as enqueue:
+        await tracing.inject_job_context(job)
+    ctx: dict[str, Any] = {"job": job}
+
+    tracing.start_job_span(job, ctx)
+    with tracing.start_span("inside job"):
+        pass
+    job.status = Status.FAILED
+    job.error = "Traceback ...\nValueError: boom\n"
+    tracing.end_job_span(job, ctx)
+
+    finished = {span.name: span for span in spans.get_finished_spans()}
+    job_span, inner_parent = finished["saq.job cleanup_auth_tokens"], finished["inside job"].parent
+    assert job_span.context is not None
+    assert inner_parent is not None
+    assert job_span.context.trace_id == enqueue.get_span_context().trace_id
+    assert inner_parent.span_id == job_span.context.span_id
+    assert job_span.status.description == "ValueError: boom"
+    assert ctx == {"job": job}
+
+
+async def test_email_send_is_traced(spans: InMemorySpanExporter) -> None:
+    mailer = MagicMock()
+    mailer.send_message = AsyncMock(return_value=1)
+
+    assert await AppEmailService(mailer=mailer).send_email("user@example.com", "Hi", "<p>Hi</p>")
+
+    (span,) = spans.get_finished_spans()
+    assert span.name == "email.send"
+    assert span.attributes == {"email.recipients": 1}
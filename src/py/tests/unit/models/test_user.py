@@ -0,0 +1,32 @@
+"""Unit tests for User model."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.db import models as m
+
+pytestmark = [pytest.mark.unit, pytest.mark.models]
+
+
+@pytest.mark.parametrize(
+    "relationship", ["roles", "teams", "oauth_accounts", "verification_tokens", "reset_tokens", "refresh_tokens"]
+)
+def test_unloaded_relationships_raise(relationship: str) -> None:
+    """Test that a relationship left out of the loader profile fails instead of reading as empty."""
+    user = m.User(id=uuid4(), email="ada@example.com")
+    make_transient_to_detached(user)
+
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        getattr(user, relationship)
+
+
+def test_new_user_relationships_start_empty() -> None:
+    """Test that relationships of a user not yet flushed are empty, without loading."""
+    user = m.User(email="ada@example.com")
+
+    assert (user.roles, user.teams, user.oauth_accounts) == ([], [], [])
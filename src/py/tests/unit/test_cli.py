@@ -1,7 +1,128 @@
+from typing import TYPE_CHECKING
+
 import pytest
 from click.testing import CliRunner
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 @pytest.fixture()
 def cli_runner() -> CliRunner:
     return CliRunner()
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected_roles"),
+    [
+        ({"email": "Jane.Doe@Example.com"}, ["user"]),
+        ({"email": "jane.doe@example.com", "roles": "superuser; user"}, ["superuser", "user"]),
+        ('{"email": "jane.doe@example.com", "roles": ["superuser"]}', ["superuser"]),
+    ],
+)
+def test_parse_import_row(raw: dict[str, str] | str, expected_roles: list[str]) -> None:
+    from app.cli._user_import import parse_row
+
+    row = parse_row(raw, default_role="user")
+
+    assert row.email == "jane.doe@example.com"
+    assert row.role_slugs == expected_roles
+    assert row.is_active is True
+    assert row.hashed_password is None
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        {"name": "No Email"},
+        {"email": "not-an-email"},
+        {"email": "jane.doe@example.com", "password": "short"},
+        {"email": "jane.doe@example.com", "hashed_password": "$2b$12$bcrypt"},
+        {"email": "jane.doe@example.com", "is_active": "maybe"},
+        "{not json",
+    ],
+)
+def test_parse_import_row_rejects_invalid(raw: dict[str, str] | str) -> None:
+    import msgspec
+
+    from app.cli._user_import import parse_row
+    from app.lib.validation import ValidationError
+
+    with pytest.raises((ValidationError, msgspec.DecodeError)):
+        parse_row(raw, default_role="user")
+
+
+def test_read_import_rows_streams_csv_and_jsonl(tmp_path: "Path") -> None:
+    from app.cli._user_import import detect_format, read_rows
+
+    csv_file = tmp_path / "users.csv"
+    csv_file.write_text("email,name\na@example.com,A\nb@example.com,B\n")
+    jsonl_file = tmp_path / "users.jsonl"
+    jsonl_file.write_text('{"email": "a@example.com"}\n\n{"email": "b@example.com"}\n')
+
+    assert detect_format(csv_file) == "csv"
+    assert detect_format(jsonl_file) == "jsonl"
+    assert [(line, row["email"]) for line, row in read_rows(csv_file, "csv")] == [  # type: ignore[index]
+        (2, "a@example.com"),
+        (3, "b@example.com"),
+    ]
+    assert [line for line, _ in read_rows(jsonl_file, "jsonl")] == [1, 3]
+
+
+def test_hot_path_migration_matches_declared_indexes() -> None:
+    import importlib.util
+    from pathlib import Path
+
+    from advanced_alchemy.base import UUIDAuditBase
+
+    from app.cli._index_report import declared_indexes
+    from app.db import migrations
+
+    path = next((Path(migrations.__file__).parent / "versions").glob("*_hot_path_indexes_*.py"))
+    spec = importlib.util.spec_from_file_location("hot_path_indexes", path)
+    assert spec is not None
+    assert spec.loader is not None
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    declared = declared_indexes(UUIDAuditBase.registry.metadata)
+    sqlite_declared = declared_indexes(UUIDAuditBase.registry.metadata, "sqlite")
+
+    for index, table, _, _ in migration.HOT_PATH_INDEXES:
+        assert declared[index] == table
+        assert index in sqlite_declared
+    assert "ix_team_name_trgm" in declared
+    assert "ix_team_name_trgm" not in sqlite_declared
+
+
+def test_diagnostics_group_offers_json_output(cli_runner: CliRunner) -> None:
+    from app.cli.commands import diagnostics_group
+
+    assert set(diagnostics_group.commands) == {"activity", "bloat", "cache", "statements"}
+    for name in diagnostics_group.commands:
+        result = cli_runner.invoke(diagnostics_group, [name, "--help"])
+        assert result.exit_code == 0
+        assert "[table|json]" in result.output
+
+
+def test_diagnostics_to_json() -> None:
+    import json
+
+    from app.cli._diagnostics import Bloat, CacheHitRatios, TableCacheHits, to_json
+
+    ratios = CacheHitRatios(database=0.99, tables=[TableCacheHits("audit_log", 10, 0.9, 0, None)])
+    found = [Bloat("audit_log", None, 4096, 1024), Bloat("refresh_token", "pk_refresh_token", 0, 0)]
+
+    assert json.loads(json.dumps(to_json(ratios))) == {
+        "database": 0.99,
+        "tables": [
+            {
+                "table": "audit_log",
+                "heap_blocks_read": 10,
+                "heap_hit_ratio": 0.9,
+                "index_blocks_read": 0,
+                "index_hit_ratio": None,
+            }
+        ],
+    }
+    assert [item["bloat_ratio"] for item in to_json(found)] == [0.25, 0.0]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from tests.query_budget import QUERY_BUDGETS, budget_for, counts_toward_budget
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "expected"),
+    [
+        ("GET", "/api/teams", QUERY_BUDGETS["GET /api/teams"]),
+        ("GET", "/api/teams/0195b0f4-7c1e-7000-8000-000000000001", QUERY_BUDGETS["GET /api/teams/{team_id}"]),
+        ("GET", "/api/admin/users/", QUERY_BUDGETS["GET /api/admin/users"]),
+        ("POST", "/api/teams", None),
+        ("GET", "/api/teams/0195b0f4-7c1e-7000-8000-000000000001/members", None),
+        ("GET", "/api/unknown", None),
+    ],
+)
+def test_budget_for_matches_route_templates(method: str, path: str, expected: int | None) -> None:
+    assert budget_for(method, path) == expected
+
+
+def test_session_setup_does_not_count_toward_budgets() -> None:
+    assert not counts_toward_budget("SET LOCAL statement_timeout = 15000")
+    assert counts_toward_budget("SELECT user_account.id FROM user_account")
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from app.cli._synthetic import TABLES, SyntheticSpec, generate_rows, plan_chunks
+
+SPEC = SyntheticSpec(users=500, teams=40, tags=12, audit_logs=300)
+
+
+@pytest.mark.parametrize("table", [table.name for table in TABLES if table.units(SPEC)])
+def test_rows_do_not_depend_on_chunking(table: str) -> None:
+    units = next(t.units(SPEC) for t in TABLES if t.name == table)
+
+    whole = list(generate_rows(SPEC, table, 0, units))
+    chunked = [row for start in range(0, units, 7) for row in generate_rows(SPEC, table, start, min(start + 7, units))]
+
+    assert whole == chunked
+    assert whole == list(generate_rows(SyntheticSpec(users=500, teams=40, tags=12, audit_logs=300), table, 0, units))
+
+
+def test_seed_changes_the_data() -> None:
+    other = SyntheticSpec(seed=7, users=500, teams=40, tags=12, audit_logs=300)
+
+    assert list(generate_rows(SPEC, "audit_log", 0, 10)) != list(generate_rows(other, "audit_log", 0, 10))
+
+
+def test_ids_are_unique_and_time_ordered() -> None:
+    ids = [row[0] for row in generate_rows(SPEC, "user_account", 0, SPEC.users)]
+
+    assert len(set(ids)) == len(ids)
+    assert all(uuid.version == 7 for uuid in ids)
+    assert ids[0].int >> 80 <= ids[-1].int >> 80
+
+
+def test_team_sizes_follow_skew_and_memberships_are_unique() -> None:
+    sizes = [SPEC.team_size(team) for team in range(SPEC.teams)]
+    members = list(generate_rows(SPEC, "team_member", 0, SPEC.teams))
+
+    assert sizes == sorted(sizes, reverse=True)
+    assert sizes[0] > 10 * sizes[-1]
+    assert len(members) == sum(sizes)
+    assert len({(row[1], row[2]) for row in members}) == len(members)
+    assert sum(row[4] for row in members) == SPEC.teams
+
+
+def test_plan_chunks_loads_referenced_tables_first() -> None:
+    first, second = plan_chunks(SPEC, chunk_size=100)
+
+    assert {table for table, _, _ in first} == {"user_account", "team", "tag"}
+    assert "team_member" in {table for table, _, _ in second}
+    user_chunks = [(start, stop) for table, start, stop in first if table == "user_account"]
+    assert user_chunks[0] == (0, 100)
+    assert user_chunks[-1][1] == SPEC.users
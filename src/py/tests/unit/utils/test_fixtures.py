@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import gzip
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.utils.fixtures import iter_fixture_chunks
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_iter_fixture_chunks_streams_jsonl(tmp_path: Path) -> None:
+    lines = [json.dumps({"name": f"role-{i}"}) for i in range(5)]
+    with gzip.open(tmp_path / "role.jsonl.gz", "wt", encoding="utf-8") as handle:
+        handle.write("\n".join(lines[:3]) + "\n\n" + "\n".join(lines[3:]) + "\n")
+
+    chunks = list(iter_fixture_chunks(tmp_path, "role", chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[-1] == [{"name": "role-4"}]
+
+
+def test_iter_fixture_chunks_falls_back_to_json_array(tmp_path: Path) -> None:
+    (tmp_path / "role.json").write_text(json.dumps([{"name": "a"}, {"name": "b"}, {"name": "c"}]))
+
+    assert [len(chunk) for chunk in iter_fixture_chunks(tmp_path, "role", chunk_size=2)] == [2, 1]
+
+
+def test_iter_fixture_chunks_missing_fixture(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        list(iter_fixture_chunks(tmp_path, "role"))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import pytest
+from alembic import op
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.exc import OperationalError
+
+from app.lib.settings import DatabaseSettings
+from app.utils import migrations
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+metadata = MetaData()
+item = Table("item", metadata, Column("id", Integer, primary_key=True), Column("label", String, nullable=True))
+
+
+class LockNotAvailableError(Exception):
+    sqlstate = "55P03"
+
+
+def driver_error(orig: Exception) -> OperationalError:
+    return OperationalError("ALTER TABLE item", {}, orig)
+
+
+@contextmanager
+def offline_postgresql() -> Iterator[io.StringIO]:
+    buffer = io.StringIO()
+    context = MigrationContext.configure(dialect_name="postgresql", opts={"as_sql": True, "output_buffer": buffer})
+    with Operations.context(context):
+        yield buffer
+
+
+def test_timeout_statements_default_to_settings() -> None:
+    settings = DatabaseSettings(MIGRATION_LOCK_TIMEOUT=2_000, MIGRATION_STATEMENT_TIMEOUT=0)
+
+    assert migrations.timeout_statements(settings) == ["SET lock_timeout = 2000", "SET statement_timeout = 0"]
+    assert migrations.timeout_statements(settings, lock_timeout=500)[0] == "SET lock_timeout = 500"
+
+
+def test_create_index_concurrently_offline() -> None:
+    with offline_postgresql() as buffer, op.get_context().autocommit_block():
+        migrations.create_index_concurrently("ix_item_label", "item", ["label"], where="label IS NOT NULL")
+
+    sql = buffer.getvalue()
+    assert sql.count("COMMIT") == sql.count("BEGIN") == 1
+    assert sql.index("COMMIT") < sql.index("SET lock_timeout = 0") < sql.index("CREATE INDEX") < sql.index("BEGIN")
+    assert sql.index("CREATE INDEX") < sql.index("SET lock_timeout = 3000")
+    assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_item_label ON item (label) WHERE label IS NOT NULL" in sql
+
+
+def test_backfill_updates_in_batches() -> None:
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        metadata.create_all(connection)
+        connection.execute(insert(item), [{"id": i, "label": None if i % 2 else "set"} for i in range(1, 12)])
+        with Operations.context(MigrationContext.configure(connection)):
+            updated = migrations.backfill(item, {"label": "filled"}, item.c.label.is_(None), batch_size=2, pause=0)
+        labels = connection.execute(select(item.c.label).order_by(item.c.id)).scalars().all()
+    engine.dispose()
+
+    assert updated == 6
+    assert labels == ["filled" if i % 2 else "set" for i in range(1, 12)]
+
+
+def test_guarded_retries_until_the_locks_are_free() -> None:
+    calls: list[int] = []
+
+    def operation() -> str:
+        calls.append(len(calls))
+        if len(calls) < 3:
+            raise driver_error(LockNotAvailableError())
+        return "done"
+
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection, Operations.context(MigrationContext.configure(connection)):
+        assert migrations.guarded(operation, attempts=3, backoff=0) == "done"
+        calls.clear()
+        with pytest.raises(OperationalError):
+            migrations.guarded(operation, attempts=2, backoff=0)
+    engine.dispose()
+
+    assert len(calls) == 2
+
+
+def test_guarded_does_not_retry_other_errors() -> None:
+    calls: list[int] = []
+
+    def operation() -> None:
+        calls.append(1)
+        raise driver_error(Exception("disk full"))
+
+    engine = create_engine("sqlite://")
+    with (
+        engine.begin() as connection,
+        Operations.context(MigrationContext.configure(connection)),
+        pytest.raises(OperationalError),
+    ):
+        migrations.guarded(operation, attempts=5, backoff=0)
+    engine.dispose()
+
+    assert calls == [1]
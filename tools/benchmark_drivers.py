@@ -0,0 +1,111 @@
+"""Compare psycopg (with different prepare thresholds) and asyncpg on the same database.
+
+Every driver runs the same statements: a primary key lookup, a page of audit log ``details``
+(JSONB decoding) and an audit log insert (JSONB encoding). Rows are seeded inside a transaction
+that is rolled back afterwards, so it can be pointed at any development database::
+
+    uv run python tools/benchmark_drivers.py --rows 500 --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from dataclasses import replace
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.engine import make_url
+
+from app.db import models as m
+from app.lib.settings import get_settings
+from app.utils.engine_factory import create_sqlalchemy_engine
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+DRIVERS: dict[str, tuple[str, int]] = {
+    "psycopg": ("postgresql+psycopg", 5),
+    "psycopg-prepare-always": ("postgresql+psycopg", 0),
+    "psycopg-prepare-never": ("postgresql+psycopg", -1),
+    "asyncpg": ("postgresql+asyncpg", 5),
+}
+"""Variant name to SQLAlchemy driver and ``DATABASE_PREPARE_THRESHOLD`` (asyncpg ignores it)."""
+
+
+def _details(i: int) -> dict[str, object]:
+    return {"index": i, "changes": {f"field_{n}": {"old": n, "new": n + 1} for n in range(10)}, "tags": ["a", "b"]}
+
+
+async def _time(call: Callable[[], Awaitable[object]], rounds: int) -> dict[str, float]:
+    await call()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(statistics.median(samples), 3), "min_ms": round(min(samples), 3)}
+
+
+async def _workloads(connection: AsyncConnection, rows: int, rounds: int) -> dict[str, object]:
+    user_id = uuid4()
+    await connection.execute(
+        insert(m.User), [{"id": user_id, "email": f"bench.{user_id}@example.com", "is_verified": True}]
+    )
+    await connection.execute(
+        insert(m.AuditLog), [{"id": uuid4(), "action": "bench.seeded", "details": _details(i)} for i in range(rows)]
+    )
+
+    async def primary_key_lookup() -> object:
+        return (await connection.execute(select(m.User.email).where(m.User.id == user_id))).one()
+
+    async def jsonb_page() -> object:
+        statement = select(m.AuditLog.details).where(m.AuditLog.action == "bench.seeded").limit(100)
+        return (await connection.execute(statement)).all()
+
+    async def jsonb_insert() -> object:
+        return await connection.execute(
+            insert(m.AuditLog).values(id=uuid4(), action="bench.inserted", details=_details(0))
+        )
+
+    return {
+        "primary_key_lookup": await _time(primary_key_lookup, rounds),
+        "jsonb_page_100": await _time(jsonb_page, rounds),
+        "jsonb_insert": await _time(jsonb_insert, rounds),
+    }
+
+
+async def run(rows: int, rounds: int, drivers: list[str]) -> dict[str, object]:
+    settings = get_settings().db
+    results: dict[str, object] = {}
+    for name in drivers:
+        drivername, threshold = DRIVERS[name]
+        url = make_url(settings.URL).set(drivername=drivername).render_as_string(hide_password=False)
+        engine = create_sqlalchemy_engine(
+            replace(settings, URL=url, PREPARE_THRESHOLD=threshold, _engine_instance=None)
+        )
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            results[name] = await _workloads(connection, rows, rounds)
+            await transaction.rollback()
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500, help="Audit log rows to seed before timing.")
+    parser.add_argument("--rounds", type=int, default=200, help="Timed calls per workload and driver.")
+    parser.add_argument("--driver", choices=DRIVERS, action="append", help="Limit to these variants (repeatable).")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.rows, args.rounds, args.driver or list(DRIVERS))), indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
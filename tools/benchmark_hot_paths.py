@@ -0,0 +1,332 @@
+"""Micro-benchmarks for the CPU-bound hot paths, with a stored baseline to compare against.
+
+Each benchmark times one call of a pure function (password hashing and checks, validation,
+JSON encoding, template rendering, team guards, JWT creation). ``run`` prints or saves the
+results; ``compare`` runs the suite again (or loads a second result file) and exits non-zero
+when any median regresses past the threshold::
+
+    uv run python tools/benchmark_hot_paths.py run --save tools/benchmarks/baseline.json
+    uv run python tools/benchmark_hot_paths.py compare tools/benchmarks/baseline.json --threshold 10
+
+Timings only compare meaningfully on the same machine, so regenerate the baseline on the box
+that runs the comparison (``make benchmark-baseline``) before relying on it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    Factory = Callable[[], Awaitable[Callable[[], Any]]]
+
+DEFAULT_BASELINE = Path(__file__).parent / "benchmarks" / "baseline.json"
+PASSWORD = "Correct-Horse-Battery-9!"  # noqa: S105
+
+BENCHMARKS: dict[str, Factory] = {}
+
+
+def benchmark(name: str) -> Callable[[Factory], Factory]:
+    """Register a benchmark.
+
+    The decorated coroutine does any setup and returns the callable to time. The callable may
+    return an awaitable, in which case the awaited time is measured.
+    """
+
+    def register(factory: Factory) -> Factory:
+        BENCHMARKS[name] = factory
+        return factory
+
+    return register
+
+
+@benchmark("crypt.get_password_hash")
+async def _get_password_hash() -> Callable[[], Any]:
+    from app.lib.crypt import get_password_hash
+
+    return lambda: get_password_hash(PASSWORD)
+
+
+@benchmark("crypt.verify_password")
+async def _verify_password() -> Callable[[], Any]:
+    from app.lib.crypt import get_password_hash, verify_password
+
+    hashed = await get_password_hash(PASSWORD)
+    return lambda: verify_password(PASSWORD, hashed)
+
+
+@benchmark("crypt.verify_backup_code")
+async def _verify_backup_code() -> Callable[[], Any]:
+    from app.lib.crypt import generate_backup_codes, get_password_hash, verify_backup_code
+
+    codes = generate_backup_codes()
+    hashed: list[str | None] = [await get_password_hash(code) for code in codes]
+    # The last code is the worst case: every stored hash is checked before the match.
+    return lambda: verify_backup_code(codes[-1], hashed)
+
+
+@benchmark("validation.validate_password_strength")
+async def _validate_password_strength() -> Callable[[], Any]:
+    from app.lib.validation import validate_password_strength
+
+    return lambda: validate_password_strength(PASSWORD)
+
+
+@benchmark("validation.get_password_strength")
+async def _get_password_strength() -> Callable[[], Any]:
+    from app.lib.validation import get_password_strength
+
+    return lambda: get_password_strength(PASSWORD)
+
+
+@benchmark("validation.validate_email")
+async def _validate_email() -> Callable[[], Any]:
+    from app.lib.validation import validate_email
+
+    return lambda: validate_email("First.Last+tag@Sub.Example.COM")
+
+
+def _payload() -> dict[str, Any]:
+    now = datetime.now(UTC)
+    return {
+        "items": [
+            {"id": uuid4(), "email": f"user{i}@example.com", "name": f"User {i}", "createdAt": now, "roles": ["user"]}
+            for i in range(50)
+        ],
+        "total": 50,
+        "limit": 50,
+        "offset": 0,
+    }
+
+
+@benchmark("serialization.to_json")
+async def _to_json() -> Callable[[], Any]:
+    from app.utils.serialization import to_json
+
+    payload = _payload()
+    return lambda: to_json(payload)
+
+
+@benchmark("serialization.from_json")
+async def _from_json() -> Callable[[], Any]:
+    from app.utils.serialization import from_json, to_json
+
+    encoded = to_json(_payload())
+    return lambda: from_json(encoded)
+
+
+@benchmark("email.render_template")
+async def _render_template() -> Callable[[], Any]:
+    from app.lib.email.service import AppEmailService
+
+    service = AppEmailService(mailer=MagicMock())
+    # Templates are build artifacts; seed the cache so only the substitution is measured.
+    body = "<p>{{USER_NAME}}, confirm {{VERIFICATION_URL}} within {{EXPIRES_HOURS}} hours.</p>"
+    service._template_cache["verification.html"] = "<html><body>" + body * 40 + "{{APP_NAME}}</body></html>"  # noqa: SLF001
+    context: dict[str, str | int] = {
+        "USER_NAME": "Ada",
+        "VERIFICATION_URL": "https://example.com/verify?token=abc123",
+        "EXPIRES_HOURS": 24,
+    }
+    return lambda: service._render_template("verification.html", context)  # noqa: SLF001
+
+
+def _guard_connection(memberships: int) -> SimpleNamespace:
+    from app.db import models as m
+
+    teams = [m.Team(id=uuid4(), name=f"Team {i}", slug=f"team-{i}") for i in range(memberships)]
+    user = m.User(id=uuid4(), email="member@example.com", is_superuser=False)
+    user.roles = [m.UserRole(role=m.Role(name="Application Access", slug="application-access"))]
+    user.teams = [m.TeamMember(team=team, team_id=team.id, role=m.TeamRoles.ADMIN, is_owner=True) for team in teams]
+    # Target the last team so the membership scan is the worst case.
+    return SimpleNamespace(path_params={"team_id": teams[-1].id}, user=user)
+
+
+@benchmark("guards.requires_team_membership")
+async def _requires_team_membership() -> Callable[[], Any]:
+    from app.domain.teams.guards import requires_team_membership
+
+    connection = _guard_connection(25)
+    return lambda: requires_team_membership(connection, None)  # type: ignore[arg-type]
+
+
+@benchmark("guards.requires_team_admin")
+async def _requires_team_admin() -> Callable[[], Any]:
+    from app.domain.teams.guards import requires_team_admin
+
+    connection = _guard_connection(25)
+    return lambda: requires_team_admin(connection, None)  # type: ignore[arg-type]
+
+
+@benchmark("guards.requires_team_ownership")
+async def _requires_team_ownership() -> Callable[[], Any]:
+    from app.domain.teams.guards import requires_team_ownership
+
+    connection = _guard_connection(25)
+    return lambda: requires_team_ownership(connection, None)  # type: ignore[arg-type]
+
+
+@benchmark("auth.create_access_token")
+async def _create_access_token() -> Callable[[], Any]:
+    from app.domain.accounts.guards import create_access_token
+
+    user_id = str(uuid4())
+    return lambda: create_access_token(user_id, "member@example.com", is_verified=True)
+
+
+async def _call(target: Callable[[], Any], iterations: int) -> float:
+    """Return the seconds taken by ``iterations`` back-to-back calls."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = target()
+        if asyncio.iscoroutine(result):
+            await result
+    return time.perf_counter() - start
+
+
+async def measure(target: Callable[[], Any], *, rounds: int, round_time: float) -> dict[str, float]:
+    """Time ``target`` over ``rounds`` rounds, each long enough to swamp timer overhead.
+
+    Returns:
+        Per-call statistics in microseconds.
+    """
+    await _call(target, 1)
+    iterations, elapsed = 1, await _call(target, 1)
+    while elapsed < round_time / 10:
+        iterations *= 2
+        elapsed = await _call(target, iterations)
+    iterations = max(1, math.ceil(round_time * iterations / elapsed))
+    samples = [await _call(target, iterations) / iterations * 1e6 for _ in range(rounds)]
+    median = statistics.median(samples)
+    return {
+        "min_us": round(min(samples), 3),
+        "median_us": round(median, 3),
+        "mean_us": round(statistics.fmean(samples), 3),
+        "stddev_us": round(statistics.stdev(samples), 3) if rounds > 1 else 0.0,
+        "ops": round(1e6 / median, 1) if median else 0.0,
+        "rounds": rounds,
+        "iterations": iterations,
+    }
+
+
+def _machine() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+async def run(names: list[str], *, rounds: int, round_time: float) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for name in names:
+        target = await BENCHMARKS[name]()
+        results[name] = await measure(target, rounds=rounds, round_time=round_time)
+    return {"created_at": datetime.now(UTC).isoformat(), "machine": _machine(), "benchmarks": results}
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> tuple[list[dict[str, Any]], bool]:
+    """Compare median timings of two runs.
+
+    Returns:
+        One row per benchmark present in either run, and whether any regressed past ``threshold`` percent.
+    """
+    rows: list[dict[str, Any]] = []
+    regressed = False
+    before, after = baseline["benchmarks"], current["benchmarks"]
+    for name in sorted(before.keys() | after.keys()):
+        if name not in before or name not in after:
+            rows.append({"name": name, "status": "new" if name in after else "missing"})
+            continue
+        old, new = before[name]["median_us"], after[name]["median_us"]
+        change = (new - old) / old * 100 if old else 0.0
+        status = "ok"
+        if change > threshold:
+            status, regressed = "regression", True
+        elif change < -threshold:
+            status = "improvement"
+        rows.append(
+            {"name": name, "baseline_us": old, "current_us": new, "change_pct": round(change, 1), "status": status}
+        )
+    return rows, regressed
+
+
+def _write(report: dict[str, Any], path: str | None) -> None:
+    rendered = json.dumps(report, indent=2) + "\n"
+    if path is None:
+        sys.stdout.write(rendered)
+        return
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(rendered, encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_options(command: argparse.ArgumentParser) -> None:
+        command.add_argument("--rounds", type=int, default=15, help="Timed rounds per benchmark.")
+        command.add_argument(
+            "--round-time", type=float, default=0.05, help="Minimum seconds per round; sets iterations per round."
+        )
+        command.add_argument(
+            "-k", dest="filter", default="", help="Only run benchmarks whose name contains this substring."
+        )
+
+    run_command = subcommands.add_parser("run", help="Run the benchmarks and print or save the results.")
+    add_run_options(run_command)
+    run_command.add_argument("--save", help="Write the results to this file instead of stdout.")
+
+    compare_command = subcommands.add_parser("compare", help="Compare a run against a stored baseline.")
+    add_run_options(compare_command)
+    compare_command.add_argument("baseline", nargs="?", default=str(DEFAULT_BASELINE), help="Baseline results file.")
+    compare_command.add_argument("current", nargs="?", help="Results file to compare; runs the suite if omitted.")
+    compare_command.add_argument(
+        "--threshold", type=float, default=10.0, help="Median slowdown, in percent, that counts as a regression."
+    )
+    compare_command.add_argument("--output", help="Also write the fresh run to this file.")
+
+    args = parser.parse_args()
+    names = [name for name in BENCHMARKS if args.filter in name]
+
+    if args.command == "run":
+        _write(asyncio.run(run(names, rounds=args.rounds, round_time=args.round_time)), args.save)
+        return
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    if args.current:
+        current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    else:
+        current = asyncio.run(run(names, rounds=args.rounds, round_time=args.round_time))
+        if args.output:
+            _write(current, args.output)
+        stored = baseline["benchmarks"]
+        baseline["benchmarks"] = {name: stored[name] for name in names if name in stored}
+    if baseline.get("machine") != current.get("machine"):
+        sys.stderr.write("warning: baseline was recorded on a different machine or interpreter\n")
+    rows, regressed = compare(baseline, current, args.threshold)
+    _write({"threshold_pct": args.threshold, "regressed": regressed, "results": rows}, None)
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare the ORM and column-projected paths of the admin user list.
+
+Seeds users inside a transaction that is rolled back afterwards, so it can be pointed at any
+development database::
+
+    uv run python tools/benchmark_list_projection.py --users 1000 --rounds 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from advanced_alchemy.filters import LimitOffset, OrderBy
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import models as m
+from app.domain.accounts.services import UserService
+from app.domain.admin.schemas import AdminUserSummary
+from app.lib.settings import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+PAGE_SIZES = (25, 100, 500)
+
+
+async def _time(call: Callable[[], Awaitable[object]], rounds: int) -> dict[str, float]:
+    await call()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(statistics.median(samples), 3), "min_ms": round(min(samples), 3)}
+
+
+async def run(users: int, rounds: int) -> dict[str, object]:
+    engine = get_settings().db.get_engine()
+    results: dict[str, object] = {}
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        await connection.execute(
+            insert(m.User),
+            [
+                {"id": uuid4(), "email": f"bench.{i}@example.com", "name": f"Bench {i}", "is_verified": True}
+                for i in range(users)
+            ],
+        )
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        service = UserService(session=session)
+        for page_size in PAGE_SIZES:
+            filters = (OrderBy(field_name="created_at", sort_order="desc"), LimitOffset(limit=page_size, offset=0))
+
+            async def orm_path(filters: tuple[OrderBy, LimitOffset] = filters) -> object:
+                results, total = await service.list_and_count(*filters)
+                page = service.to_schema(results, total, filters, schema_type=AdminUserSummary)
+                session.expunge_all()
+                return page
+
+            async def projected_path(filters: tuple[OrderBy, LimitOffset] = filters) -> object:
+                results, total = await service.list_and_count_as(AdminUserSummary, *filters)
+                return service.to_schema(results, total, filters)
+
+            results[str(page_size)] = {
+                "orm": await _time(orm_path, rounds),
+                "projected": await _time(projected_path, rounds),
+            }
+        await session.close()
+        await transaction.rollback()
+    await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000, help="Users to seed before timing.")
+    parser.add_argument("--rounds", type=int, default=50, help="Timed calls per path and page size.")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.users, args.rounds)), indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Time list-endpoint searches with and without the ``pg_trgm`` GIN indexes.
+
+Seeds synthetic users, teams and audit log rows, then runs each endpoint's first page of search
+results twice: "before", the plain ``SearchFilter`` with the trigram indexes dropped, and
+"after", :class:`~app.lib.search.TrigramSearchFilter` with them in place. Everything happens in
+one transaction that is rolled back afterwards, indexes included, so it can be pointed at any
+development database (the ``DROP INDEX`` does lock the tables until then)::
+
+    uv run python tools/benchmark_search.py --rows 200000 --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from advanced_alchemy.filters import LimitOffset, OrderBy, SearchFilter
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from app.db import models as m
+from app.lib.search import TrigramSearchFilter
+from app.lib.settings import get_settings
+from app.utils.engine_factory import create_sqlalchemy_engine
+
+if TYPE_CHECKING:
+    from sqlalchemy import Index
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+SEARCHES: dict[str, tuple[Any, str, list[str]]] = {
+    "users": (m.User, "name,email", ["ada", "lovelace", "example.com"]),
+    "teams": (m.Team, "name", ["platform", "team 4242"]),
+    "audit": (m.AuditLog, "actor_email,action,target_label", ["user.updated", "ada", "team 4242"]),
+}
+"""Endpoint name to model, ``search`` fields and the terms to time."""
+
+WORDS = ["ada", "grace", "alan", "edsger", "barbara", "lovelace", "hopper", "turing", "liskov", "platform"]
+ACTIONS = ["user.created", "user.updated", "team.created", "team.deleted", "login.failed"]
+
+
+def _trigram_indexes() -> list[Index]:
+    return [
+        index
+        for model, _, _ in SEARCHES.values()
+        for index in model.__table__.indexes
+        if index.name is not None and index.name.endswith("_trgm")
+    ]
+
+
+async def _seed(connection: AsyncConnection, rows: int) -> None:
+    def word(i: int) -> str:
+        return WORDS[i % len(WORDS)]
+
+    for start in range(0, rows, 10_000):
+        batch = range(start, min(start + 10_000, rows))
+        await connection.execute(
+            insert(m.User),
+            [
+                {"id": uuid4(), "email": f"{word(i)}.{i}@example.com", "name": f"{word(i).title()} {word(i // 7)} {i}"}
+                for i in batch
+            ],
+        )
+        await connection.execute(
+            insert(m.Team),
+            [{"id": uuid4(), "name": f"{word(i).title()} team {i}", "slug": f"bench-{i}"} for i in batch],
+        )
+        await connection.execute(
+            insert(m.AuditLog),
+            [
+                {
+                    "id": uuid4(),
+                    "actor_email": f"{word(i)}.{i}@example.com",
+                    "action": ACTIONS[i % len(ACTIONS)],
+                    "target_label": f"{word(i // 3).title()} team {i}",
+                }
+                for i in batch
+            ],
+        )
+    for model, _, _ in SEARCHES.values():
+        await connection.execute(text(f"ANALYZE {model.__tablename__}"))
+
+
+async def _time_searches(connection: AsyncConnection, filter_type: type[SearchFilter], rounds: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for endpoint, (model, fields, terms) in SEARCHES.items():
+        for term in terms:
+            search = filter_type(field_name=set(fields.split(",")), value=term, ignore_case=True)
+            statement = select(model.id, func.count().over())
+            for filter_ in (search, OrderBy("created_at", "desc"), LimitOffset(25, 0)):
+                statement = filter_.append_to_statement(statement, model)
+            samples = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                await connection.execute(statement)
+                samples.append((time.perf_counter() - start) * 1000)
+            results[f"{endpoint}:{term}"] = {
+                "median_ms": round(statistics.median(samples), 3),
+                "min_ms": round(min(samples), 3),
+            }
+    return results
+
+
+async def run(rows: int, rounds: int) -> dict[str, Any]:
+    engine = create_sqlalchemy_engine(get_settings().db)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        await _seed(connection, rows)
+        for index in _trigram_indexes():
+            await connection.execute(DropIndex(index, if_exists=True))
+        before = await _time_searches(connection, SearchFilter, rounds)
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for index in _trigram_indexes():
+            await connection.execute(CreateIndex(index))
+        for model, _, _ in SEARCHES.values():
+            await connection.execute(text(f"ANALYZE {model.__tablename__}"))
+        after = await _time_searches(connection, TrigramSearchFilter, rounds)
+        await transaction.rollback()
+    await engine.dispose()
+    return {"rows": rows, "before": before, "after": after}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows seeded into each searched table.")
+    parser.add_argument("--rounds", type=int, default=20, help="Timed runs per search term and variant.")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.rows, args.rounds)), indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""HTTP load test for the critical API flows.
+
+Drives a running app (``app run``) with concurrent virtual users and reports throughput and
+latency percentiles per scenario as JSON. Seed a dataset first so the queries see realistic
+cardinalities, and promote one generated user so the admin scenario can run::
+
+    uv run app perf generate --users 100000 --teams 10000 --audit-logs 1000000
+    uv run app users promote-to-superuser --email user0000000.s42@example.com
+    uv run python tools/load_test.py --base-url http://localhost:8000 --duration 30 --concurrency 16
+
+Virtual users log in as generated users (``user{n:07d}.s{seed}@example.com``, password
+``Synthetic-Passw0rd!``); the first one is used for the superuser-only audit scenario.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+SYNTHETIC_PASSWORD = "Synthetic-Passw0rd!"  # noqa: S105
+PERCENTILES = (50, 95, 99)
+
+
+def synthetic_email(index: int, seed: int) -> str:
+    return f"user{index:07d}.s{seed}@example.com"
+
+
+@dataclass
+class VirtualUser:
+    """One authenticated client; keeps its own cookies so refresh-token rotation works."""
+
+    client: httpx.AsyncClient
+    email: str
+    team_id: str | None = None
+    candidates: itertools.count[int] = field(default_factory=itertools.count)
+
+    async def login(self) -> httpx.Response:
+        response = await self.client.post(
+            "/api/access/login", data={"username": self.email, "password": SYNTHETIC_PASSWORD}
+        )
+        if response.is_success:
+            self.client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+        return response
+
+
+@dataclass
+class ScenarioResult:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: dict[str, int] = field(default_factory=dict)
+    elapsed_s: float = 0.0
+
+    def record(self, started: float, response: httpx.Response | None, error: str | None = None) -> None:
+        self.latencies_ms.append((time.perf_counter() - started) * 1000)
+        if error is None and response is not None and not response.is_success:
+            error = str(response.status_code)
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def summary(self) -> dict[str, Any]:
+        count = len(self.latencies_ms)
+        report: dict[str, Any] = {
+            "requests": count,
+            "errors": self.errors,
+            "throughput_rps": round(count / self.elapsed_s, 1) if self.elapsed_s else 0.0,
+        }
+        if count >= 2:  # noqa: PLR2004
+            cuts = statistics.quantiles(self.latencies_ms, n=100, method="inclusive")
+            report.update({f"p{p}_ms": round(cuts[p - 1], 2) for p in PERCENTILES})
+            report["max_ms"] = round(max(self.latencies_ms), 2)
+        return report
+
+
+async def _login(user: VirtualUser) -> httpx.Response:
+    return await user.login()
+
+
+async def _refresh(user: VirtualUser) -> httpx.Response:
+    return await user.client.post("/api/access/refresh")
+
+
+async def _me(user: VirtualUser) -> httpx.Response:
+    return await user.client.get("/api/me")
+
+
+async def _list_teams(user: VirtualUser) -> httpx.Response:
+    return await user.client.get("/api/teams", params={"pageSize": 20, "currentPage": 1})
+
+
+async def _team_detail(user: VirtualUser) -> httpx.Response:
+    return await user.client.get(f"/api/teams/{user.team_id}")
+
+
+async def _add_member(user: VirtualUser, *, seed: int, users: int) -> httpx.Response:
+    """Add a generated user to the virtual user's own team, then remove them again (untimed)."""
+    email = synthetic_email(users - 1 - next(user.candidates) % users, seed)
+    path = f"/api/teams/{user.team_id}/members"
+    response = await user.client.post(path, json={"userName": email})
+    if response.is_success:
+        await user.client.request("DELETE", path, json={"userName": email})
+    return response
+
+
+async def _list_audit(user: VirtualUser) -> httpx.Response:
+    return await user.client.get("/api/admin/audit", params={"pageSize": 50, "currentPage": 1})
+
+
+async def _setup(
+    base_url: str, concurrency: int, seed: int, request_timeout: float
+) -> tuple[list[VirtualUser], VirtualUser]:
+    limits = httpx.Limits(max_connections=concurrency * 2 + 2)
+
+    def client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=base_url, timeout=request_timeout, limits=limits)
+
+    admin = VirtualUser(client(), synthetic_email(0, seed))
+    virtual_users = [VirtualUser(client(), synthetic_email(index + 1, seed)) for index in range(concurrency)]
+    for user in [admin, *virtual_users]:
+        response = await user.login()
+        response.raise_for_status()
+    for index, user in enumerate(virtual_users):
+        response = await user.client.post("/api/teams", json={"name": f"Load test {seed}-{index}"})
+        response.raise_for_status()
+        user.team_id = response.json()["id"]
+    return virtual_users, admin
+
+
+async def _teardown(virtual_users: list[VirtualUser], admin: VirtualUser) -> None:
+    for user in virtual_users:
+        if user.team_id is not None:
+            await user.client.delete(f"/api/teams/{user.team_id}")
+        await user.client.aclose()
+    await admin.client.aclose()
+
+
+async def _run_scenario(
+    scenario: Callable[[VirtualUser], Awaitable[httpx.Response]],
+    virtual_users: list[VirtualUser],
+    duration: float,
+) -> ScenarioResult:
+    result = ScenarioResult()
+    deadline = time.perf_counter() + duration
+
+    async def worker(user: VirtualUser) -> None:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await scenario(user)
+            except httpx.HTTPError as exc:
+                result.record(started, None, type(exc).__name__)
+            else:
+                result.record(started, response)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(user) for user in virtual_users))
+    result.elapsed_s = time.perf_counter() - started
+    return result
+
+
+async def run(
+    base_url: str,
+    *,
+    duration: float,
+    concurrency: int,
+    seed: int,
+    users: int,
+    scenarios: list[str],
+    request_timeout: float,
+) -> dict[str, Any]:
+    virtual_users, admin = await _setup(base_url, concurrency, seed, request_timeout)
+
+    async def add_member(user: VirtualUser) -> httpx.Response:
+        return await _add_member(user, seed=seed, users=users)
+
+    available: dict[str, tuple[Callable[[VirtualUser], Awaitable[httpx.Response]], list[VirtualUser]]] = {
+        "login": (_login, virtual_users),
+        "refresh": (_refresh, virtual_users),
+        "me": (_me, virtual_users),
+        "teams.list": (_list_teams, virtual_users),
+        "teams.detail": (_team_detail, virtual_users),
+        "teams.member_add": (add_member, virtual_users),
+        # The admin API is superuser-only, so one client carries the whole concurrency.
+        "admin.audit_list": (_list_audit, [admin] * concurrency),
+    }
+    report: dict[str, Any] = {
+        "base_url": base_url,
+        "duration_s": duration,
+        "concurrency": concurrency,
+        "scenarios": {},
+    }
+    try:
+        for name in scenarios:
+            scenario, clients = available[name]
+            report["scenarios"][name] = (await _run_scenario(scenario, clients, duration)).summary()
+    finally:
+        await _teardown(virtual_users, admin)
+    return report
+
+
+def main() -> None:
+    scenario_names = [
+        "login",
+        "refresh",
+        "me",
+        "teams.list",
+        "teams.detail",
+        "teams.member_add",
+        "admin.audit_list",
+    ]
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000", help="URL of the running app.")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per scenario.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent virtual users.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed the dataset was generated with.")
+    parser.add_argument("--users", type=int, default=10_000, help="Users in the generated dataset.")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds.")
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=scenario_names,
+        help="Scenario to run; repeat for several. Defaults to all.",
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+    args = parser.parse_args()
+    report = asyncio.run(
+        run(
+            args.base_url,
+            duration=args.duration,
+            concurrency=args.concurrency,
+            seed=args.seed,
+            users=args.users,
+            scenarios=args.scenarios or scenario_names,
+            request_timeout=args.timeout,
+        )
+    )
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:  # noqa: PTH123
+            handle.write(rendered + "\n")
+    else:
+        sys.stdout.write(rendered + "\n")
+
+
+if __name__ == "__main__":
+    main()
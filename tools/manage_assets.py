@@ -1,15 +1,57 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import logging
 import platform
 import subprocess
 from pathlib import Path
 from typing import Any
 
+try:
+    import brotli  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover
+    brotli = None
+
 logger = logging.getLogger("manage_assets")
 
 PROJECT_ROOT = Path(__file__).parent.parent
+BUNDLE_DIR = PROJECT_ROOT / "src/py/app/server/static/web"
+COMPRESSIBLE_SUFFIXES = {".js", ".mjs", ".css", ".html", ".svg", ".json", ".map", ".txt", ".xml", ".wasm", ".ico"}
+MIN_COMPRESS_SIZE = 1024
+MIN_COMPRESSION_GAIN = 0.9
+
+
+def compress_assets(bundle_dir: Path = BUNDLE_DIR) -> None:
+    """Write ``.br`` and ``.gz`` siblings for compressible files in the built bundle.
+
+    Siblings are only kept when they are meaningfully smaller than the original, so the server
+    never sends a larger precompressed body.  Brotli output requires the optional ``brotli`` package.
+
+    Args:
+        bundle_dir: The Vite bundle output directory.
+    """
+    if brotli is None:
+        logger.warning("brotli is not installed; only gzip siblings will be written.")
+    original_total = compressed_total = 0
+    for file_path in sorted(bundle_dir.rglob("*")):
+        if not file_path.is_file() or file_path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        data = file_path.read_bytes()
+        if len(data) < MIN_COMPRESS_SIZE:
+            continue
+        encoded = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            encoded[".br"] = brotli.compress(data, quality=11)
+        for suffix, payload in encoded.items():
+            sibling = file_path.with_name(file_path.name + suffix)
+            if len(payload) > len(data) * MIN_COMPRESSION_GAIN:
+                sibling.unlink(missing_ok=True)
+                continue
+            sibling.write_bytes(payload)
+            original_total += len(data)
+            compressed_total += len(payload)
+    logger.info("Precompressed %d bytes of assets into %d bytes.", original_total, compressed_total)
 
 
 def manage_resources(setup_kwargs: Any) -> Any:
@@ -23,6 +65,7 @@ def manage_resources(setup_kwargs: Any) -> Any:
     """
     build_assets = setup_kwargs.pop("build_assets", None)
     install_packages = setup_kwargs.pop("install_packages", None)
+    compress = setup_kwargs.pop("compress_assets", None)
     kwargs: dict[str, Any] = {}
 
     if platform.system() == "Windows":
@@ -38,6 +81,10 @@ def manage_resources(setup_kwargs: Any) -> Any:
         logger.info("Building frontend assets with bun.")
         subprocess.run(["bun", "run", "build"], **kwargs, cwd=web_dir)  # noqa: S607, PLW1510
 
+    if compress is not None:
+        logger.info("Precompressing built assets.")
+        compress_assets()
+
     return setup_kwargs
 
 
@@ -45,6 +92,17 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser("Manage Resources")
     parser.add_argument("--build-assets", action="store_true", help="Build assets for static hosting.", default=None)
     parser.add_argument("--install-packages", action="store_true", help="Install packages with bun.", default=None)
+    parser.add_argument(
+        "--compress-assets",
+        action="store_true",
+        help="Write precompressed .br/.gz siblings for the built bundle.",
+        default=None,
+    )
     args = parser.parse_args()
-    setup_kwargs = {"build_assets": args.build_assets, "install_packages": args.install_packages}
+    logging.basicConfig(level=logging.INFO)
+    setup_kwargs = {
+        "build_assets": args.build_assets,
+        "install_packages": args.install_packages,
+        "compress_assets": args.compress_assets,
+    }
     manage_resources(setup_kwargs)